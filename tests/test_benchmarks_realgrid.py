@@ -6,6 +6,8 @@ Run with:
   python -m pytest tests/test_benchmarks_realgrid.py --benchmark-only \
     --benchmark-json=tests/performance_results/parsers_performance.json -q -k "parse"
 """
+import os
+
 import pytest
 import pandas
 import polars
@@ -76,6 +78,32 @@ def test_parse_realgrid_to_duckdb(benchmark):
     assert data.execute("SELECT COUNT(*) FROM triplets").fetchone()[0] > 1_000_000
 
 
+@pytest.mark.benchmark(group="parse-threads")
+@pytest.mark.skipif(not HAS_CYTHON_PUGIXML_ARROW, reason="cython_pugixml_arrow not built")
+@pytest.mark.parametrize("max_workers", [1, 2, 4, 8])
+def test_parse_realgrid_threads(benchmark, max_workers):
+    """Thread scaling of the cython engine — it parses without the GIL, so
+    wall time should drop with max_workers up to the core count."""
+    benchmark.extra_info.update({"engine": "cython_pugixml_arrow", "max_workers": max_workers,
+                                 "cpu_count": os.cpu_count()})
+    table = benchmark(lambda: parse([REALGRID_ZIP] * 8, engine="cython_pugixml_arrow",
+                                    return_type="arrow", max_workers=max_workers))
+    assert table.num_rows > 8_000_000
+
+
+@pytest.mark.benchmark(group="parse-threads")
+@pytest.mark.skipif(not HAS_CYTHON_PUGIXML_ARROW, reason="cython_pugixml_arrow not built")
+@pytest.mark.parametrize("max_workers", [1, 2, 4, 8])
+def test_parse_batches_realgrid_threads(benchmark, max_workers):
+    """Same for the streaming path (prefetch threads)."""
+    from triplets.parser import parse_batches
+    benchmark.extra_info.update({"engine": "cython_pugixml_arrow", "max_workers": max_workers,
+                                 "cpu_count": os.cpu_count()})
+    rows = benchmark(lambda: sum(batch.num_rows for batch in parse_batches(
+        [REALGRID_ZIP] * 8, engine="cython_pugixml_arrow", max_workers=max_workers)))
+    assert rows > 8_000_000
+
+
 # ── type_tableview benchmarks ───────────────────────────────────────────────
 
 @pytest.mark.benchmark(group="type-tableview")
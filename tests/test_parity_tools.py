@@ -125,6 +125,7 @@ CALL_SPECS = {
     "id_tableview": lambda e, d, c: d.id_tableview(c["id"], **_tv_kwargs(e)),
     "types_dict": lambda e, d, c: d.types_dict(),
     "get_object_data": lambda e, d, c: d.get_object_data(c["id"]),
+    "get_objects_data": lambda e, d, c: d.get_objects_data([c["id"], c["reference"]]),
     "get_namespace_map": lambda e, d, c: d.get_namespace_map(),
     "triplets_to_tableviews": lambda e, d, c: d.triplets_to_tableviews(),
     "filter_triplets": lambda e, d, c: d.filter_triplets(KEY="Type", VALUE=c["type"]),
@@ -2,11 +2,13 @@
 
 Uses minimal_cim.xml (committed) + RealGrid when present.
 """
+import math
+
 import pytest
 import pandas
 
 import triplets
-from triplets.parser import parse, find_all_xml, clean_ID, read_rdf
+from triplets.parser import parse, reparse, find_all_xml, clean_ID, read_rdf
 
 from pathlib import Path
 
@@ -44,6 +46,88 @@ def test_find_all_xml_minimal():
     assert len(files) == 1
 
 
+def _mixed_zip(path):
+    """Zip of MINIMAL stored, deflated, bzip2'd (zipfile fallback) and nested."""
+    import io
+    import zipfile
+    content = Path(MINIMAL).read_bytes()
+    inner = io.BytesIO()
+    with zipfile.ZipFile(inner, "w") as bundle:
+        bundle.writestr("inner.xml", content, compress_type=zipfile.ZIP_DEFLATED)
+    with zipfile.ZipFile(path, "w") as bundle:
+        bundle.writestr("stored.xml", content, compress_type=zipfile.ZIP_STORED)
+        bundle.writestr("deflated.xml", content, compress_type=zipfile.ZIP_DEFLATED)
+        bundle.writestr("bzip2.xml", content, compress_type=zipfile.ZIP_BZIP2)
+        bundle.writestr("nested.zip", inner.getvalue())
+    return content
+
+
+def test_find_all_xml_zip_members(tmp_path):
+    import mmap
+    content = _mixed_zip(tmp_path / "mixed.zip")
+    files = find_all_xml(tmp_path / "mixed.zip")
+    assert [f.name for f in files] == ["stored.xml", "deflated.xml", "bzip2.xml", "inner.xml"]
+    assert all(f.read() == content and bytes(f.getbuffer()) == content for f in files)
+    assert isinstance(files[0].getbuffer().obj, mmap.mmap)   # STORED: a view into the mapped archive
+
+
+@pytest.mark.parametrize("codec", ["gzip", "xz", "zstd"])
+def test_parse_compressed_xml(parser_engine, codec, tmp_path):
+    """a.xml.gz/.xz/.zst on disk and inside a zip parse like the plain file."""
+    import gzip
+    import lzma
+    import zipfile
+    content = Path(MINIMAL).read_bytes()
+    if codec == "zstd":
+        compress, suffix = pytest.importorskip("zstandard").ZstdCompressor().compress, ".zst"
+    else:
+        compress, suffix = {"gzip": (gzip.compress, ".gz"), "xz": (lzma.compress, ".xz")}[codec]
+    (tmp_path / f"a.xml{suffix}").write_bytes(compress(content))
+    with zipfile.ZipFile(tmp_path / "b.zip", "w") as bundle:
+        bundle.writestr(f"b.xml{suffix}", compress(content))
+    files = find_all_xml([tmp_path / f"a.xml{suffix}", tmp_path / "b.zip"])
+    assert [Path(f.name).name for f in files] == ["a.xml", "b.xml"]
+    assert all(bytes(f.getbuffer()) == content for f in files)
+    result = parse([tmp_path / f"a.xml{suffix}", tmp_path / "b.zip"], engine=parser_engine)
+    assert len(result) == 2 * len(parse(MINIMAL, engine=parser_engine))
+
+
+def test_parse_zip_members_deferred_loads(parser_engine, tmp_path):
+    """Member loads run on the workers after discovery; rows match a sequential parse."""
+    _mixed_zip(tmp_path / "mixed.zip")
+    sequential = parse(tmp_path / "mixed.zip", engine=parser_engine)
+    parallel = parse(tmp_path / "mixed.zip", engine=parser_engine, max_workers=3)
+    assert sequential["INSTANCE_ID"].nunique() == parallel["INSTANCE_ID"].nunique() == 4
+    assert len(sequential) == len(parallel) == 4 * len(parse(MINIMAL, engine=parser_engine))
+
+
+@pytest.mark.parametrize("engine", ["python_lxml_pandas", "python_lxml_arrow"])
+def test_parse_executor_process_matches_threads(engine, tmp_path, monkeypatch):
+    """Worker processes return the rows of the thread pool, in input order."""
+    pytest.importorskip("pyarrow")
+    from triplets.parser import processes as processes_module
+    import gzip
+    _mixed_zip(tmp_path / "mixed.zip")
+    (tmp_path / "c.xml.gz").write_bytes(gzip.compress(Path(MINIMAL).read_bytes()))
+    sources = [tmp_path / "mixed.zip", MINIMAL, tmp_path / "c.xml.gz"]
+    threads = parse(sources, engine=engine, max_workers=2, executor="thread", types=["ConnectivityNode"])
+    jobs = []
+    real_job = processes_module._job
+    monkeypatch.setattr(processes_module, "_job", lambda source: jobs.append(real_job(source)) or jobs[-1])
+    processes = parse(sources, engine=engine, max_workers=2, executor="process", types=["ConnectivityNode"])
+    # members of the zip on disk go as (archive, member) for the worker to read; only the nested one as bytes
+    assert sorted(str(job.member) for job in jobs if hasattr(job, "member")) == [
+        "None", "bzip2.xml", "deflated.xml", "stored.xml"]                       # None: c.xml.gz
+    assert [job[0] for job in jobs if type(job) is tuple] == ["inner.xml"]
+    # INSTANCE_IDs and the Distribution / NamespaceMap IDs are fresh per parse; compare the rest
+    pandas.testing.assert_frame_equal(processes[["KEY", "VALUE"]].astype(str), threads[["KEY", "VALUE"]].astype(str))
+    assert (processes["ID"] == "nodeA").equals(threads["ID"] == "nodeA")
+    assert list(pandas.factorize(processes["INSTANCE_ID"])[0]) == list(pandas.factorize(threads["INSTANCE_ID"])[0])
+    assert processes["INSTANCE_ID"].nunique() == 6
+    with pytest.raises(ValueError, match="executor"):
+        parse(MINIMAL, engine=engine, executor="fork")
+
+
 # ── Registration ────────────────────────────────────────────────────────────
 
 class TestRegistration:
@@ -94,6 +178,309 @@ def test_parse_returns_arrow_and_polars():
     assert len(pdf) > 0
 
 
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+def test_parse_unifies_dictionaries_across_files(engine, tmp_path):
+    """Every chunk of KEY / INSTANCE_ID carries the one merged dictionary."""
+    pa = pytest.importorskip("pyarrow")
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    import zipfile
+    with zipfile.ZipFile(tmp_path / "m.zip", "w") as bundle:
+        for i in range(3):
+            bundle.write(MINIMAL, f"f{i}.xml")
+    table = parse(tmp_path / "m.zip", engine=engine, return_type="arrow", max_workers=2)
+    for name in ("KEY", "INSTANCE_ID"):
+        chunks = table[name].chunks
+        assert len(chunks) == 3 and all(chunk.dictionary.equals(chunks[0].dictionary) for chunk in chunks)
+        assert sorted(chunks[0].dictionary.to_pylist()) == sorted(set(table[name].cast(pa.string()).to_pylist()))
+    assert len(table["INSTANCE_ID"].chunks[0].dictionary) == 3
+
+
+def test_dictionary_unifier_grows_by_delta():
+    """Codes stay valid and earlier arrays intact while the dictionary outgrows its buffers."""
+    pa = pytest.importorskip("pyarrow")
+    from triplets.parser import _DictionaryUnifier
+    unifier = _DictionaryUnifier()
+    columns = [pa.array([f"value {i}" for i in range(start, start + 3000)] + ["shared", None])
+               for start in range(0, 9000, 1500)]
+    encoded = [unifier.encode(column) for column in columns]
+    for column, array in zip(columns, encoded):
+        assert array.to_pylist() == column.to_pylist()
+        assert unifier.dictionary.slice(0, len(array.dictionary)).equals(array.dictionary)
+    assert len(unifier.dictionary) == 10501
+
+
+# ── id_encoding="uuid16": packed UUID ID / VALUE columns ─────────────────────
+
+_UUIDS = ["00000000-0000-0000-0000-000000000000", "7a41f67c-e448-47e4-b42e-23cb39de3e7f",
+          "ffffffff-ffff-ffff-ffff-ffffffffffff"]
+# not canonical lowercase UUIDs — must stay in the text columns
+_NOT_UUIDS = ["7A41F67C-E448-47E4-B42E-23CB39DE3E7F", "7a41f67c-e448-47e4-b42e-23cb39de3e7g",
+              "7a41f67ce448-47e4-b42e-23cb39de3e7f-", "7a41f67c-e448-47e4-b42e-23cb39de3e7"]
+
+
+def _write_uuid_objects(path):
+    objects = "".join(
+        f'<cim:Terminal rdf:ID="_{name}"><cim:IdentifiedObject.name>{name}</cim:IdentifiedObject.name>'
+        f'<cim:Terminal.ConnectivityNode rdf:resource="#_{target}"/></cim:Terminal>\n'
+        for name, target in zip(_UUIDS + _NOT_UUIDS, _NOT_UUIDS + _UUIDS))
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns:cim="http://iec.ch/TC57/2013/CIM-schema-cim16#">\n'
+        f"{objects}</rdf:RDF>\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+@pytest.mark.parametrize("return_type", ["pandas", "polars", "arrow"])
+def test_parse_uuid16_round_trip(engine, return_type, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    if return_type == "polars":
+        pytest.importorskip("polars")
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    from triplets._engine_detect import to_arrow
+    from triplets.parser import decode_ids
+    path = _write_uuid_objects(tmp_path / "uuids.xml")
+    packed = parse(path, engine=engine, return_type=return_type, id_encoding="uuid16")
+    assert list(to_arrow(packed).column_names) == ["ID", "ID_TEXT", "KEY", "VALUE", "VALUE_UUID", "INSTANCE_ID"]
+
+    table = parse(path, engine=engine, return_type="arrow", id_encoding="uuid16")
+    assert table.schema.field("ID").type == pa.binary(16)
+    terminals = table.filter(pa.compute.equal(table["KEY"].cast(pa.string()), "Type"))
+    terminals = terminals.filter(pa.compute.equal(terminals["VALUE"], "Terminal"))
+    assert terminals["ID"].null_count == len(_NOT_UUIDS)
+    assert sorted(terminals["ID_TEXT"].drop_null().to_pylist()) == sorted(_NOT_UUIDS)
+    references = table.filter(pa.compute.equal(table["KEY"].cast(pa.string()), "Terminal.ConnectivityNode"))
+    assert references["VALUE_UUID"].null_count == len(_NOT_UUIDS)
+
+    decoded = to_arrow(decode_ids(packed))
+    expected = parse(path, engine=engine, return_type="arrow")
+    assert decoded.column_names == ["ID", "KEY", "VALUE", "INSTANCE_ID"]
+    assert _without_meta_ids(decoded) == _without_meta_ids(expected)
+
+
+def test_parse_uuid16_numpy_fallback(tmp_path, monkeypatch):
+    """Without the compiled kernels the vectorized numpy path gives the same layout."""
+    pytest.importorskip("pyarrow")
+    from triplets.parser import ids, decode_ids
+    path = _write_uuid_objects(tmp_path / "uuids.xml")
+    compiled = parse(path, engine="python_lxml_arrow", return_type="arrow", id_encoding="uuid16")
+    monkeypatch.setattr(ids, "_kernels", lambda: None)
+    fallback = ids.encode_ids(decode_ids(compiled))
+    assert fallback.equals(compiled.cast(fallback.schema))
+    assert decode_ids(fallback).equals(decode_ids(compiled).cast(decode_ids(fallback).schema))
+
+
+def test_parse_uuid16_errors_and_reparse(tmp_path):
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ValueError, match="id_encoding"):
+        parse(MINIMAL, return_type="arrow", id_encoding="uuid8")
+    with pytest.raises(ValueError, match="arrow parser engine"):
+        parse(MINIMAL, engine="python_lxml_pandas", id_encoding="uuid16")
+    path = _write_uuid_objects(tmp_path / "uuids.xml")
+    first = parse([path, MINIMAL], engine="python_lxml_arrow", return_type="arrow", id_encoding="uuid16")
+    second = reparse(first, [path], engine="python_lxml_arrow")
+    assert second.column_names == first.column_names
+    assert second.num_rows == first.num_rows - len(parse(MINIMAL))
+
+
+# ── id_encoding="interned": int64 codes shared across datasets ───────────────
+
+def _write_rdf(path, objects):
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns:cim="http://iec.ch/TC57/2013/CIM-schema-cim16#">\n'
+        f"{objects}</rdf:RDF>\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+def test_parse_interned_codes_join_across_datasets(engine, tmp_path):
+    """An IGM parsed before its boundary set references the boundary nodes by
+    the codes they get later; non-UUID references resolve once their ID is known."""
+    pa = pytest.importorskip("pyarrow")
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    from triplets.parser import IDInterner, decode_ids
+    boundary = _write_rdf(tmp_path / "bd.xml", "".join(
+        f'<cim:ConnectivityNode rdf:ID="_{uuid}"><cim:IdentifiedObject.name>N{i}</cim:IdentifiedObject.name>'
+        f'</cim:ConnectivityNode>\n' for i, uuid in enumerate(_UUIDS)))
+    igm = _write_rdf(tmp_path / "igm.xml", "".join(
+        f'<cim:Terminal rdf:ID="_T{i}"><cim:Terminal.ConnectivityNode rdf:resource="#_{uuid}"/>'
+        f'<cim:Terminal.Local rdf:resource="#_T{(i + 1) % 3}"/></cim:Terminal>\n'
+        for i, uuid in enumerate(_UUIDS)))
+    interner = IDInterner()
+    first = parse(igm, engine=engine, return_type="arrow", id_encoding="interned", interner=interner)
+    second = parse(boundary, engine=engine, return_type="arrow", id_encoding="interned", interner=interner)
+    assert first.schema.field("ID").type == pa.int64() and first.schema.field("VALUE_ID").type == pa.int64()
+
+    references = first.filter(pa.compute.is_valid(first["VALUE_ID"]))
+    assert sorted(references["KEY"].cast(pa.string()).to_pylist()) == ["Terminal.ConnectivityNode"] * 3 + ["Terminal.Local"] * 3
+    assert references["VALUE"].null_count == len(references)
+    node_ids = second.select(["ID"]).group_by("ID").aggregate([]).rename_columns(["NODE"])
+    nodes = references.join(node_ids, keys="VALUE_ID", right_keys="NODE", join_type="inner")
+    assert nodes.num_rows == len(_UUIDS)
+
+    for packed, path in ((first, igm), (second, boundary)):
+        decoded = decode_ids(packed, interner)
+        assert _without_meta_ids(decoded) == _without_meta_ids(parse(path, engine=engine, return_type="arrow"))
+
+    again = parse(igm, engine=engine, return_type="arrow", id_encoding="interned", interner=interner)
+    terminals = pa.compute.equal(first["KEY"].cast(pa.string()), "Terminal.Local")
+    assert again.filter(terminals)["ID"].equals(first.filter(terminals)["ID"])   # same objects, same codes
+
+
+def test_id_interner_compiled_matches_fallback(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    if not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    from triplets.parser import ids
+    columns = [pa.array(["a", "b", "b", None, "", "c" * 40]), pa.array(["d", "a", None])]
+    compiled = ids.IDInterner()
+    monkeypatch.setattr(ids, "_kernels", lambda: None)
+    fallback = ids.IDInterner()
+    for interner in (compiled, fallback):
+        assert interner.lookup(columns[0]).null_count == 6
+        interner.intern(columns[0])
+    assert compiled.strings.equals(fallback.strings)
+    add = pa.chunked_array([pa.array([True, False, True]), pa.array([False, False, True])])
+    column = pa.chunked_array([pa.array(["x", "y", "b"]), pa.array(["z", "x", "w"])])
+    results = [interner._codes(column, add) for interner in (compiled, fallback)]
+    assert results[0].to_pylist() == results[1].to_pylist() == [4, None, 1, None, 4, 5]
+    assert compiled.decode(pa.array([5, None, 0])).to_pylist() == ["w", None, "a"]
+
+
+def test_parse_interned_options_and_reparse(tmp_path):
+    pytest.importorskip("pyarrow")
+    from triplets.parser import IDInterner, default_interner
+    with pytest.raises(ValueError, match="interned"):
+        parse(MINIMAL, return_type="arrow", interner=IDInterner())
+    with pytest.raises(ValueError, match="arrow parser engine"):
+        parse(MINIMAL, engine="python_lxml_pandas", id_encoding="interned")
+    before = len(default_interner())
+    parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow", id_encoding="interned")
+    assert len(default_interner()) > before
+
+    interner = IDInterner()
+    path = _write_uuid_objects(tmp_path / "uuids.xml")
+    first = parse([path, MINIMAL], engine="python_lxml_arrow", return_type="polars",
+                  id_encoding="interned", interner=interner)
+    size = len(interner)
+    second = reparse(first, [path], engine="python_lxml_arrow")   # the recorded interner
+    assert list(second.columns) == list(first.columns) and len(interner) == size
+    assert len(second) == len(first) - len(parse(MINIMAL))
+
+
+# ── rdf_map: schema-typed VALUE_NUM / VALUE_ENUM columns ─────────────────────
+
+_TYPED_OBJECTS = (
+    '<cim:Terminal rdf:ID="_T1"><cim:IdentifiedObject.name>42</cim:IdentifiedObject.name>'
+    '<cim:ACDCTerminal.sequenceNumber>1</cim:ACDCTerminal.sequenceNumber>'
+    '<cim:ACDCTerminal.connected>true</cim:ACDCTerminal.connected>'
+    '<cim:Terminal.phases rdf:resource="http://iec.ch/TC57/2013/CIM-schema-cim16#PhaseCode.ABC"/></cim:Terminal>\n'
+    '<cim:Terminal rdf:ID="_T2"><cim:ACDCTerminal.sequenceNumber>2</cim:ACDCTerminal.sequenceNumber>'
+    '<cim:ACDCTerminal.connected>false</cim:ACDCTerminal.connected></cim:Terminal>\n'
+    '<cim:SvVoltage rdf:ID="_V1"><cim:SvVoltage.v>1.5e2</cim:SvVoltage.v>'
+    '<cim:SvVoltage.angle>n/a</cim:SvVoltage.angle></cim:SvVoltage>\n')
+
+
+def _typed_values(result):
+    rows = result.select(["ID", "KEY", "VALUE_NUM", "VALUE_ENUM"]).to_pylist()
+    return {(row["ID"], row["KEY"]): (row["VALUE_NUM"], row["VALUE_ENUM"]) for row in rows}
+
+
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+def test_parse_rdf_map_typed_columns(engine, tmp_path):
+    """Numbers and booleans land in VALUE_NUM, enumerations in VALUE_ENUM;
+    text, the Type rows and malformed numbers stay null. VALUE is untouched."""
+    pa = pytest.importorskip("pyarrow")
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    from triplets.export_schema import schemas
+    path = _write_rdf(tmp_path / "typed.xml", _TYPED_OBJECTS)
+    plain = parse(path, engine=engine, return_type="arrow")
+    typed = parse(path, engine=engine, return_type="arrow", rdf_map=schemas.ENTSOE_CGMES_2_4_15_552_ED2)
+    assert typed.column_names == plain.column_names + ["VALUE_NUM", "VALUE_ENUM"]
+    assert _without_meta_ids(typed) == _without_meta_ids(plain)
+    assert typed.schema.field("VALUE_NUM").type == pa.float64()
+    assert pa.types.is_dictionary(typed.schema.field("VALUE_ENUM").type)
+    values = _typed_values(typed)
+    assert values[("T1", "ACDCTerminal.sequenceNumber")] == (1.0, None)
+    assert values[("T1", "ACDCTerminal.connected")] == (1.0, None)
+    assert values[("T2", "ACDCTerminal.connected")] == (0.0, None)
+    assert values[("V1", "SvVoltage.v")] == (150.0, None)
+    assert values[("V1", "SvVoltage.angle")] == (None, None)      # malformed → null
+    assert values[("T1", "IdentifiedObject.name")] == (None, None)  # xsd:string, even if numeric
+    assert values[("T1", "Terminal.phases")] == (None, "PhaseCode.ABC")
+    assert values[("T1", "Type")] == (None, None)
+
+
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+def test_parse_rdf_map_padded_and_special_numbers(engine, tmp_path):
+    """Pretty-printed values are trimmed before the cast; INF / -INF / NaN
+    stay numbers when a malformed value sends the batch down the fallback."""
+    pytest.importorskip("pyarrow")
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    from triplets.export_schema import schemas
+    objects = (
+        '<cim:Terminal rdf:ID="_T1"><cim:ACDCTerminal.sequenceNumber>\n   1\n</cim:ACDCTerminal.sequenceNumber>'
+        '<cim:ACDCTerminal.connected> true </cim:ACDCTerminal.connected></cim:Terminal>\n'
+        '<cim:SvVoltage rdf:ID="_V1"><cim:SvVoltage.v>INF</cim:SvVoltage.v>'
+        '<cim:SvVoltage.angle>n/a</cim:SvVoltage.angle></cim:SvVoltage>\n'
+        '<cim:SvVoltage rdf:ID="_V2"><cim:SvVoltage.v>-INF</cim:SvVoltage.v>'
+        '<cim:SvVoltage.angle> NaN </cim:SvVoltage.angle></cim:SvVoltage>\n')
+    path = _write_rdf(tmp_path / "padded.xml", objects)
+    values = _typed_values(parse(path, engine=engine, return_type="arrow", rdf_map=schemas.ENTSOE_CGMES_2_4_15_552_ED2))
+    assert values[("T1", "ACDCTerminal.sequenceNumber")] == (1.0, None)
+    assert values[("T1", "ACDCTerminal.connected")] == (1.0, None)
+    assert values[("V1", "SvVoltage.v")] == (float("inf"), None)
+    assert values[("V2", "SvVoltage.v")] == (float("-inf"), None)
+    assert values[("V1", "SvVoltage.angle")] == (None, None)
+    assert math.isnan(values[("V2", "SvVoltage.angle")][0])
+
+
+def test_parse_rdf_map_layouts_and_tableviews(tmp_path):
+    """The sidecars ride along the ID encodings and reparse, and the
+    tableviews cast the columns VALUE_NUM marks as numeric."""
+    pytest.importorskip("pyarrow")
+    from triplets.export_schema import schemas
+    from triplets.parser import decode_ids
+    rdf_map = schemas.ENTSOE_CGMES_2_4_15_552_ED2
+    path = _write_rdf(tmp_path / "typed.xml", _TYPED_OBJECTS)
+    with pytest.raises(ValueError, match="arrow parser engine"):
+        parse(path, engine="python_lxml_pandas", rdf_map=rdf_map)
+    text = parse(path, engine="python_lxml_arrow", return_type="arrow", rdf_map=rdf_map)
+    for id_encoding in ("uuid16", "interned"):
+        encoded = parse(path, engine="python_lxml_arrow", return_type="arrow", rdf_map=rdf_map,
+                        id_encoding=id_encoding)
+        assert encoded.column_names[-2:] == ["VALUE_NUM", "VALUE_ENUM"]
+        columns = ["KEY", "VALUE", "VALUE_NUM", "VALUE_ENUM"]   # IDs: random per-parse meta objects
+        assert decode_ids(encoded).select(columns).equals(text.select(columns))
+    empty = parse([], return_type="arrow", rdf_map=rdf_map)
+    assert empty.schema.names == text.schema.names
+
+    first = parse([path, MINIMAL], engine="python_lxml_arrow", rdf_map=rdf_map)
+    second = reparse(first, [path], engine="python_lxml_arrow")   # the recorded rdf_map
+    assert list(second.columns) == list(first.columns)
+
+    terminals = first.type_tableview("Terminal")
+    assert terminals["ACDCTerminal.sequenceNumber"].tolist() == [1.0, 2.0]
+    assert terminals["ACDCTerminal.connected"].tolist() == ["true", "false"]
+    assert terminals["IdentifiedObject.name"].tolist()[0] == 42   # untyped: still to_numeric
+    assert terminals["Terminal.phases"].tolist()[0] == "PhaseCode.ABC"
+    try:
+        polars_view = parse(path, engine="python_lxml_arrow", return_type="polars",
+                            rdf_map=rdf_map).type_tableview("Terminal").sort("ID")
+    except ImportError:
+        return
+    assert polars_view["ACDCTerminal.sequenceNumber"].to_list() == [1.0, 2.0]
+    assert polars_view["ACDCTerminal.connected"].to_list() == ["true", "false"]
+
+
 # ── parse_batches: lazy RecordBatchReader for out-of-core ingest ─────────────
 
 def test_parse_batches_matches_parse():
@@ -147,6 +534,412 @@ def test_empty_parse_schema_matches_nonempty(cols, engine):
     assert len(polars.concat([empty_pl, full_pl])) == len(full_pl)
 
 
+# ── Parse-time pushdown ─────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("pushdown", [
+    {"types": ["VoltageLevel", "ConnectivityNode"]},
+    {"keys": "IdentifiedObject.name"},
+    {"instances": ["VL1", "unknown"]},
+    {"types": ["VoltageLevel"], "keys": ["VoltageLevel.Substation"]},
+    {"types": []},
+])
+def test_parse_pushdown_matches_filtered_parse(parser_engine, pushdown):
+    """types/keys/instances keep the selected objects and properties — the
+    same rows as filtering the full parse — plus the metadata objects whole."""
+    full = parse(MINIMAL, engine=parser_engine, categorical_columns=None)
+    pushed = parse(MINIMAL, engine=parser_engine, categorical_columns=None, **pushdown)
+
+    type_of = full[full["KEY"] == "Type"].set_index("ID")["VALUE"]
+    def wanted(row):
+        object_type = type_of[row.ID]
+        if object_type in ("Distribution", "NamespaceMap", "FullModel"):
+            return True
+        types, keys = pushdown.get("types"), pushdown.get("keys")
+        keys = [keys] if isinstance(keys, str) else keys
+        return ((types is None or object_type in types)
+                and (pushdown.get("instances") is None or row.ID in pushdown["instances"])
+                and (keys is None or row.KEY == "Type" or row.KEY in keys))
+    expected = full[[wanted(row) for row in full.itertuples()]]
+
+    def rows(frame):
+        meta = set(frame.loc[frame["VALUE"].isin(["Distribution", "NamespaceMap"]), "ID"])
+        return sorted(("" if row.ID in meta else str(row.ID), str(row.KEY), str(row.VALUE))
+                      for row in frame.itertuples())
+    assert rows(pushed) == rows(expected)
+    assert "FullModel" in set(pushed["VALUE"])
+
+
+# ── Persistent parse cache ──────────────────────────────────────────────────
+
+def test_parse_cache_hit_skips_engine(parser_engine, tmp_path, monkeypatch):
+    if parser_engine == "python_lxml_pandas":
+        with pytest.raises(ValueError, match="arrow parser engine"):
+            parse(MINIMAL, engine=parser_engine, cache_dir=tmp_path)
+        return
+    import zipfile
+    archive = tmp_path / "model.zip"
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.write(MINIMAL, "a.xml")
+    cache_dir = tmp_path / "cache"
+    first = parse([MINIMAL, archive], engine=parser_engine, return_type="arrow", cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.arrow"))) == 1   # same bytes → one entry
+
+    import functools
+    _, engine_mod = triplets.parser.get_engine(parser_engine)
+    @functools.wraps(engine_mod.load_rdf_to_dataframe)   # same signature → same cache key
+    def no_parse(*args, **kwargs):
+        raise AssertionError("cache hit expected")
+    monkeypatch.setattr(engine_mod, "load_rdf_to_dataframe", no_parse)
+    again = parse([MINIMAL, archive], engine=parser_engine, return_type="arrow", cache_dir=cache_dir)
+    assert _without_random_ids(again) == _without_random_ids(first)
+
+    polars = pytest.importorskip("polars")
+    frame = parse(MINIMAL, engine=parser_engine, return_type="polars", string_type="utf8",
+                  cache_dir=cache_dir)
+    assert isinstance(frame, polars.DataFrame) and len(frame) == first.num_rows // 2
+
+
+def _without_random_ids(table):
+    """Rows of table with the per-parse random IDs (INSTANCE_ID, meta objects) blanked."""
+    frame = table.select(["ID", "KEY", "VALUE"]).to_pandas()
+    meta = set(frame.loc[frame["VALUE"].isin(["Distribution", "NamespaceMap"]), "ID"])
+    return sorted(("" if row.ID in meta else str(row.ID), str(row.KEY), str(row.VALUE))
+                  for row in frame.itertuples())
+
+
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+def test_parse_cache_hit_takes_the_current_file_name(engine, tmp_path):
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    copies = [tmp_path / "one" / "a.xml", tmp_path / "two" / "b.xml"]
+    for path in copies:
+        path.parent.mkdir()
+        path.write_bytes(Path(MINIMAL).read_bytes())
+
+    def meta(table):
+        frame = table.to_pandas()
+        frame = frame[frame["ID"].isin(frame.loc[frame["VALUE"].isin(["Distribution", "NamespaceMap"]), "ID"])]
+        return {str(instance): {(str(row.KEY), str(row.VALUE)) for row in rows.itertuples()
+                                if row.KEY in ("label", "xml_base")}
+                for instance, rows in frame.groupby("INSTANCE_ID", observed=True)}, set(frame["ID"])
+
+    fresh = [meta(parse(str(path), engine=engine, return_type="arrow"))[0] for path in copies]
+    cached = parse([str(path) for path in copies], engine=engine, return_type="arrow",
+                   cache_dir=tmp_path / "cache")
+    assert len(list((tmp_path / "cache").glob("*.arrow"))) == 1   # one entry, second file a hit
+    by_instance, meta_ids = meta(cached)
+    assert len(by_instance) == 2 and len(meta_ids) == 4          # no shared random IDs
+    assert sorted(by_instance.values(), key=sorted) == sorted([*fresh[0].values(), *fresh[1].values()], key=sorted)
+
+
+def test_parse_cache_options_and_env(tmp_path, monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    monkeypatch.setenv("TRIPLETS_PARSE_CACHE", str(tmp_path))
+    parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow")
+    parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow", shorten_resources=False)
+    assert len(list(tmp_path.glob("*.arrow"))) == 2     # options key separate entries
+    table = parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow", string_type="large_utf8")
+    assert table.schema.field("VALUE").type == pa.large_string()
+    parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow", cache_dir=False)
+    parse(MINIMAL, engine="python_lxml_pandas")          # env cache ignored, no error
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+
+
+def test_parse_cache_prune(tmp_path):
+    pytest.importorskip("pyarrow")
+    import os
+    from triplets.parser import cache
+    for name in ("a.xml", "b.xml"):
+        (tmp_path / name).write_bytes(Path(MINIMAL).read_bytes() + f"<!-- {name} -->".encode())
+        parse(str(tmp_path / name), engine="python_lxml_arrow", cache_dir=tmp_path / "cache")
+    entries = sorted((tmp_path / "cache").glob("*.arrow"))
+    os.utime(entries[0], (0, 0))                         # unused since 1970
+    assert cache.prune(tmp_path / "cache", max_age=86400) == 1
+    assert cache.prune(tmp_path / "cache", max_bytes=0) == 1
+    assert not list((tmp_path / "cache").iterdir())
+
+
+# ── Incremental re-parse ────────────────────────────────────────────────────
+
+def _instances(data):
+    from triplets._engine_detect import to_pandas
+    return list(dict.fromkeys(to_pandas(data)["INSTANCE_ID"].astype(str)))
+
+
+@pytest.mark.parametrize("return_type", ["pandas", "polars", "arrow"])
+def test_reparse_parses_only_changed_sources(parser_engine, return_type, tmp_path, monkeypatch):
+    if return_type != "pandas":
+        pytest.importorskip(return_type if return_type == "polars" else "pyarrow")
+    import os
+    import zipfile
+    for name in ("a.xml", "b.xml"):
+        (tmp_path / name).write_bytes(Path(MINIMAL).read_bytes())
+    with zipfile.ZipFile(tmp_path / "m.zip", "w") as bundle:
+        bundle.write(MINIMAL, "member.xml")
+    paths = [tmp_path / "a.xml", tmp_path / "b.xml", tmp_path / "m.zip"]
+    first = parse(paths, engine=parser_engine, return_type=return_type)
+    a_id, b_id, member_id = _instances(first)
+
+    stat = os.stat(paths[1])
+    os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))   # b "changed"
+    parsed = []
+    _, engine_mod = triplets.parser.get_engine(parser_engine)
+    real = engine_mod.load_rdf_to_dataframe
+    monkeypatch.setattr(engine_mod, "load_rdf_to_dataframe",
+                        lambda f, **kw: parsed.append(f) or real(f, **kw))
+    second = reparse(first, paths, engine=parser_engine)
+    assert parsed == [str(paths[1])]
+    assert type(second) is type(first) and len(second) == len(first)
+    instances = _instances(second)
+    assert instances[:2] == [a_id, member_id] and instances[2] != b_id
+
+    third = reparse(second, paths[:1], engine=parser_engine)   # b and the zip removed
+    assert _instances(third) == [a_id]
+    assert len(third) * 3 == len(first)
+
+
+def test_reparse_keeps_parse_options(tmp_path):
+    pytest.importorskip("pyarrow")
+    import os
+    for name in ("a.xml", "b.xml"):
+        (tmp_path / name).write_bytes(Path(MINIMAL).read_bytes())
+    paths = [tmp_path / "a.xml", tmp_path / "b.xml"]
+    first = parse(paths, engine="python_lxml_arrow", return_type="arrow", categorical_columns=("KEY",),
+                  string_type="large_utf8", types=["FullModel", "Substation"])
+    stat = os.stat(paths[1])
+    os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    second = reparse(first, paths)
+    assert second.schema == first.schema   # INSTANCE_ID plain, large_utf8 strings
+    assert second.num_rows == first.num_rows   # the types pushdown applies to the changed file too
+    assert first.num_rows < parse(paths, engine="python_lxml_arrow", return_type="arrow").num_rows
+    fresh = parse(paths, engine="python_lxml_pandas")
+    kept = reparse(fresh, paths)   # the pandas engine, not the "auto" default
+    assert kept.dtypes.equals(fresh.dtypes) and len(kept) == len(fresh)
+
+
+def test_reparse_verify_catches_same_size_rewrites(tmp_path):
+    pytest.importorskip("pyarrow")
+    import os
+    paths = [tmp_path / "a.xml", tmp_path / "b.xml"]
+    for path in paths:
+        path.write_bytes(Path(MINIMAL).read_bytes())
+    first = parse(paths, engine="python_lxml_arrow", cache_dir=tmp_path / "cache")   # records digests
+    a_id, b_id = _instances(first)
+
+    stat = os.stat(paths[1])
+    paths[1].write_bytes(Path(MINIMAL).read_bytes().replace(b"Sub1", b"Sub2"))   # same size
+    os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns))                   # same mtime
+    assert _instances(reparse(first, paths)) == [a_id, b_id]   # the fingerprint misses it
+    second = reparse(first, paths, verify=True)
+    assert _instances(second)[0] == a_id and _instances(second)[1] != b_id
+    assert "Sub2" in set(second["VALUE"].astype(str))
+    third = reparse(second, paths, verify=True)                # digests recorded: nothing re-parsed
+    assert _instances(third) == _instances(second)
+    plain = parse(paths, engine="python_lxml_arrow")                              # no digests recorded
+    assert not set(_instances(reparse(plain, paths, verify=True))) & set(_instances(plain))
+
+
+def test_reparse_requires_parse_result():
+    with pytest.raises(ValueError, match="returned by parse"):
+        reparse(pandas.DataFrame(columns=["ID", "KEY", "VALUE", "INSTANCE_ID"]), [MINIMAL])
+
+
+# ── Header scan / header_filter ─────────────────────────────────────────────
+
+_OLD_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:cim="http://iec.ch/TC57/2013/CIM-schema-cim16#"
+         xmlns:md="http://iec.ch/TC57/61970-552/ModelDescription/1#">
+  <md:FullModel rdf:about="urn:uuid:ssh-1">
+    <md:Model.scenarioTime>2024-01-01T10:30:00Z</md:Model.scenarioTime>
+    <md:Model.profile>http://entsoe.eu/CIM/SteadyStateHypothesis/1/1</md:Model.profile>
+    <md:Model.DependentOn rdf:resource="urn:uuid:eq-1"/>
+    <md:Model.modelingAuthoritySet>http://tso.eu/Planning</md:Model.modelingAuthoritySet>
+  </md:FullModel>
+  <cim:Substation rdf:ID="_SS1"><cim:IdentifiedObject.name>S</cim:IdentifiedObject.name></cim:Substation>
+  <md:FullModel rdf:about="urn:uuid:not-read"/>
+</rdf:RDF>
+"""
+_NEW_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:cim="http://iec.ch/TC57/CIM100#" xmlns:dcat="http://www.w3.org/ns/dcat#"
+         xmlns:dcterms="http://purl.org/dc/terms/">
+  <dcat:Dataset rdf:about="urn:uuid:eq-1">
+    <dcat:keyword>EQ</dcat:keyword>
+    <dcterms:conformsTo>http://iec.ch/TC57/ns/CIM/CoreEquipment-EU/3.0</dcterms:conformsTo>
+    <dcat:startDate>2024-02-01T00:00:00Z</dcat:startDate>
+    <dcterms:requires rdf:resource="urn:uuid:bd-1"/>
+    <dcterms:requires rdf:resource="urn:uuid:bd-2"/>
+  </dcat:Dataset>
+  <cim:Substation rdf:about="#_SS2"/>
+</rdf:RDF>
+"""
+
+
+def _header_files(tmp_path):
+    import zipfile
+    (tmp_path / "ssh.xml").write_text(_OLD_HEADER)
+    with zipfile.ZipFile(tmp_path / "eq.zip", "w", zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr("eq.xml", _NEW_HEADER)
+    return [str(tmp_path / "ssh.xml"), tmp_path / "eq.zip", MINIMAL]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_scan_headers_both_vocabularies(tmp_path, max_workers):
+    from triplets.parser import scan_headers
+    headers = scan_headers(_header_files(tmp_path), max_workers=max_workers).set_index("file")
+    assert headers.loc["ssh.xml", ["ID", "header", "keyword", "scenarioTime", "modelingAuthoritySet"]].tolist() == \
+        ["ssh-1", "FullModel", "SSH", "2024-01-01T10:30:00Z", "http://tso.eu/Planning"]
+    assert headers.loc["ssh.xml", "DependentOn"] == ["eq-1"]
+    assert headers.loc["eq.xml", ["ID", "header", "keyword", "scenarioTime"]].tolist() == \
+        ["eq-1", "Dataset", "EQ", "2024-02-01T00:00:00Z"]
+    assert headers.loc["eq.xml", "DependentOn"] == ["bd-1", "bd-2"]
+    assert headers.loc["eq.xml", "source"].endswith("eq.zip!eq.xml")
+    assert headers.loc["eq.xml", "size"] == len(_NEW_HEADER)
+    assert headers.loc["minimal_cim.xml", "ID"] == "minimal"
+
+
+def test_scan_headers_stops_at_first_object(tmp_path):
+    """A document whose body is not well-formed still yields its header."""
+    from triplets.parser import scan_headers
+    (tmp_path / "broken.xml").write_text(_OLD_HEADER.replace("</rdf:RDF>", "<cim:Unclosed>"))
+    with open(tmp_path / "broken.xml", "rb") as file:
+        assert scan_headers(file)["ID"].tolist() == ["ssh-1"]
+        assert file.tell() == 0   # a caller's file-like is given back where it was
+    pa = pytest.importorskip("pyarrow")
+    table = scan_headers(str(tmp_path / "broken.xml"), return_type="arrow")
+    assert table.schema.field("DependentOn").type == pa.list_(pa.string())
+
+
+def test_parse_header_filter_skips_before_loading(parser_engine, tmp_path, monkeypatch):
+    from triplets.parser import utils
+    files = _header_files(tmp_path)
+    loaded = []
+    original = utils._read_member
+    monkeypatch.setattr(utils, "_read_member", lambda *args: loaded.append(args[2].filename) or original(*args))
+    ssh = parse(files, engine=parser_engine, header_filter={"profile": ["SSH"]})
+    assert set(ssh["ID"]) >= {"ssh-1", "SS1"} and "eq-1" not in set(ssh["ID"]) and loaded == []
+    window = parse(files, engine=parser_engine, header_filter={"scenarioTime": ("2024-02-01", None)})
+    assert "SS2" in set(window["ID"]) and "SS1" not in set(window["ID"]) and loaded == ["eq.xml"]
+    everything = parse(files, engine=parser_engine, header_filter=lambda header: True)
+    assert everything["INSTANCE_ID"].nunique() == 3
+    with pytest.raises(ValueError, match="header_filter column"):
+        parse(files, engine=parser_engine, header_filter={"Profile": "EQ"})
+
+
+# ── Model catalog ───────────────────────────────────────────────────────────
+
+def _model(model_id, profile, dependencies=()):
+    requires = "".join(f'<md:Model.DependentOn rdf:resource="urn:uuid:{d}"/>' for d in dependencies)
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+            f'xmlns:cim="http://iec.ch/TC57/2013/CIM-schema-cim16#" '
+            f'xmlns:md="http://iec.ch/TC57/61970-552/ModelDescription/1#">'
+            f'<md:FullModel rdf:about="urn:uuid:{model_id}">'
+            f'<md:Model.profile>http://entsoe.eu/CIM/{profile}</md:Model.profile>{requires}</md:FullModel>'
+            f'<cim:Substation rdf:ID="_{model_id}-object"/></rdf:RDF>')
+
+
+def _igm(path, sv_dependencies=("tp", "ssh")):
+    import zipfile
+    with zipfile.ZipFile(path, "w") as bundle:
+        bundle.writestr("eq.xml", _model("eq", "EquipmentCore/3/1", ["bd"]))
+        bundle.writestr("tp.xml", _model("tp", "Topology/4/1", ["eq"]))
+        bundle.writestr("ssh.xml", _model("ssh", "SteadyStateHypothesis/1/1", ["eq"]))
+        bundle.writestr("sv.xml", _model("sv", "StateVariables/4/1", sv_dependencies))
+        bundle.writestr("other.xml", _model("other", "EquipmentCore/3/1"))
+
+
+def test_model_catalog_incremental_closure_and_parse(tmp_path):
+    import os
+    from triplets.parser import ModelCatalog
+    (tmp_path / "boundary").mkdir()
+    (tmp_path / "boundary" / "bd.xml").write_text(_model("bd", "EquipmentBoundary/3/1"))
+    _igm(tmp_path / "igm.zip")
+    with ModelCatalog(tmp_path / "catalog.db") as catalog:
+        assert catalog.update(tmp_path) == {"added": 6, "changed": 0, "removed": 0, "unchanged": 0}
+        assert catalog.update(tmp_path)["unchanged"] == 6
+        closure = catalog.closure("sv")
+        assert closure["ID"].tolist() == ["bd", "eq", "ssh", "tp", "sv"]   # deepest first
+        assert closure["depth"].tolist() == [3, 2, 1, 1, 0]
+        objects = set(catalog.parse("sv", engine="python_lxml_pandas")["ID"])
+        assert {"sv-object", "tp-object", "ssh-object", "eq-object", "bd-object"} <= objects
+        assert "other-object" not in objects
+        assert catalog.models({"profile": "EQ"})["ID"].tolist() == ["eq", "other"]
+        assert catalog.models()["digest"].notna().all()
+
+    # reopened: one member changed, one file removed
+    _igm(tmp_path / "igm.zip", sv_dependencies=("tp", "ssh", "missing"))
+    os.utime(tmp_path / "igm.zip", ns=(1, 1))
+    os.remove(tmp_path / "boundary" / "bd.xml")
+    with ModelCatalog(tmp_path / "catalog.db") as catalog:
+        assert catalog.update(tmp_path) == {"added": 0, "changed": 1, "removed": 1, "unchanged": 4}
+        closure = catalog.closure(["sv"]).set_index("ID")
+        assert closure["source"].isna().to_dict() == {"bd": True, "eq": False, "missing": True,
+                                                      "ssh": False, "sv": False, "tp": False}
+
+
+
+def test_model_catalog_closure_ends_on_dependency_cycles(tmp_path):
+    from triplets.parser import ModelCatalog
+    (tmp_path / "a.xml").write_text(_model("a", "EquipmentCore/3/1", ["b"]))
+    (tmp_path / "b.xml").write_text(_model("b", "EquipmentCore/3/1", ["a", "c"]))
+    (tmp_path / "c.xml").write_text(_model("c", "EquipmentCore/3/1", ["c"]))   # depends on itself
+    with ModelCatalog(":memory:") as catalog:
+        catalog.update(tmp_path)
+        closure = catalog.closure("a")
+        assert closure["ID"].tolist() == ["c", "b", "a"]
+        assert closure["depth"].tolist() == [2, 1, 0]
+        assert set(catalog.parse("a", engine="python_lxml_pandas")["ID"]) >= {"a-object", "b-object", "c-object"}
+
+
+# ── Parse-time statistics ───────────────────────────────────────────────────
+
+def test_parse_statistics_answer_types_dict_and_content_key(parser_engine, tmp_path):
+    from triplets import tools
+    from triplets.parser import stats
+    from triplets._content_key import _content_hash
+    files = _header_files(tmp_path)
+    if parser_engine == "python_lxml_pandas":
+        assert stats.statistics(parse(files, engine=parser_engine)) is None
+        return
+    assert stats.statistics(parse(files, engine=parser_engine)) is None   # opt-in
+    frame = parse(files, engine=parser_engine, statistics=True)
+    known = stats.statistics(frame)
+    assert known["rows"] == len(frame)
+    assert known["keys"] == frame["KEY"].astype(str).value_counts().to_dict()
+    assert known["instances"] == frame["INSTANCE_ID"].astype(str).value_counts().to_dict()
+    table = parse(files, engine=parser_engine, return_type="arrow", statistics=True)
+    assert stats.read(table)["rows"] == table.num_rows
+
+    expected = tools.types_dict(parse(files, engine=parser_engine))
+    assert tools.types_dict(frame) == expected and known["types"] == expected   # counted once, kept
+    assert tools.types_dict(frame, contains="substation") == {"Substation": expected["Substation"]}
+    assert _content_hash(frame, False) == "parse:" + known["digest"]
+    import pyarrow.compute as pc
+    assert stats.statistics(table.filter(pc.equal(table["KEY"], "Type"))) is None
+
+    frame.loc[0, "VALUE"] = "changed"       # an edit replaces the column's Arrow array
+    assert stats.statistics(frame) is None
+    polars = pytest.importorskip("polars")
+    result = parse(files, engine=parser_engine, return_type="polars", statistics=True)
+    assert stats.statistics(result) is not None
+    result[0, "VALUE"] = "changed"
+    assert stats.statistics(result) is None
+
+
+def test_parse_statistics_travel_with_cache_entries(tmp_path, monkeypatch):
+    from triplets.parser import stats
+    cache_dir = tmp_path / "cache"
+    first = parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow", cache_dir=cache_dir, statistics=True)
+    monkeypatch.setattr(stats, "batch_statistics", lambda batch: pytest.fail("cached statistics expected"))
+    again = parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow", cache_dir=cache_dir, statistics=True)
+    assert stats.read(again)["keys"] == stats.read(first)["keys"]
+    assert list(stats.read(again)["instances"]) == again.column("INSTANCE_ID").unique().to_pylist()
+    assert stats.read(again)["digest"] != stats.read(first)["digest"]   # other INSTANCE_ID
+    assert stats.read(parse(MINIMAL, engine="python_lxml_arrow", return_type="arrow")) is None
+
+
 # ── Per-engine tests ────────────────────────────────────────────────────────
 
 class TestPythonLxmlPandas:
@@ -172,6 +965,28 @@ class TestPythonLxmlArrow:
         assert t.num_rows > 0
 
 
+def _write_objects(path, count, extra=""):
+    """A CIM document of `count` small objects (+ raw `extra` content at the end)."""
+    objects = "".join(
+        f'<cim:Terminal rdf:ID="_T{i}"><cim:IdentifiedObject.name>T &amp; {i}</cim:IdentifiedObject.name>'
+        f'<cim:Terminal.ConnectivityNode rdf:resource="#_N{i}"/></cim:Terminal>\n'
+        f'<cim:ConnectivityNode rdf:about="#_N{i}"/>\n'
+        for i in range(count))
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+        'xmlns:cim="http://iec.ch/TC57/2013/CIM-schema-cim16#">\n'
+        f"{objects}{extra}</rdf:RDF>\n")
+    return str(path)
+
+
+def _without_meta_ids(batch):
+    """Rows as (ID, KEY, VALUE) with the per-parse random meta-object IDs blanked."""
+    meta = set(batch.column("ID").to_pylist()[:3])   # Distribution + NamespaceMap
+    return [(None if row["ID"] in meta else row["ID"], row["KEY"], row["VALUE"])
+            for row in batch.select(["ID", "KEY", "VALUE"]).to_pylist()]
+
+
 @pytest.mark.skipif(not HAS_CYTHON_PUGIXML_ARROW, reason="cython_pugixml_arrow not built")
 class TestCythonPugixmlArrow:
     def test_basic_load(self):
@@ -179,6 +994,81 @@ class TestCythonPugixmlArrow:
         assert isinstance(df, pandas.DataFrame)
         assert len(df) > 0
 
+    @pytest.mark.parametrize("string_type", ["utf8", "large_utf8", "string_view"])
+    def test_split_parse_matches_sequential(self, tmp_path, monkeypatch, string_type):
+        """max_workers splits one document into slices — same rows, same order."""
+        monkeypatch.setattr(cython_pugixml_arrow, "_MIN_CHUNK_BYTES", 1024)
+        path = _write_objects(tmp_path / "big.xml", 500)
+        sequential = cython_pugixml_arrow.load_rdf_to_dataframe(path, string_type=string_type)
+        split = cython_pugixml_arrow.load_rdf_to_dataframe(path, string_type=string_type, max_workers=4)
+        assert split.schema == sequential.schema
+        assert split.column("KEY").dictionary.equals(sequential.column("KEY").dictionary)
+        assert _without_meta_ids(split) == _without_meta_ids(sequential)
+
+    @pytest.mark.parametrize("extra", [
+        # a nested (striped) object and a commented-out object: lexical boundary
+        # candidates that are not top-level — the split must fall back, not drift
+        f'<cim:Outer rdf:ID="O"><cim:Outer.name>{"x" * 2000}</cim:Outer.name><cim:Outer.inner>'
+        '<cim:Inner rdf:about="#I"><cim:Inner.v>1</cim:Inner.v></cim:Inner>'
+        '</cim:Outer.inner></cim:Outer>\n',
+        f'<!-- {"x" * 2000} <cim:Hidden rdf:ID="H"> -->\n<cim:Last rdf:ID="L"/>\n',
+    ])
+    def test_split_parse_unsafe_boundary_falls_back(self, tmp_path, monkeypatch, caplog, extra):
+        import logging
+        monkeypatch.setattr(cython_pugixml_arrow, "_MIN_CHUNK_BYTES", 64)
+        path = _write_objects(tmp_path / "odd.xml", 1, extra)
+        sequential = cython_pugixml_arrow.load_rdf_to_dataframe(path)
+        with caplog.at_level(logging.DEBUG, logger="triplets.parser.cython_pugixml_arrow"):
+            split = cython_pugixml_arrow.load_rdf_to_dataframe(path, max_workers=2, debug=True)
+        assert "Split failed" in caplog.text
+        assert _without_meta_ids(split) == _without_meta_ids(sequential)
+
+    @pytest.mark.parametrize("extra", [
+        "",
+        # window cuts inside a nested object must widen the window, not drift
+        '<cim:Outer rdf:ID="O"><cim:Outer.inner><cim:Inner rdf:about="#I">'
+        f'<cim:Inner.v>{"x" * 600}</cim:Inner.v></cim:Inner></cim:Outer.inner></cim:Outer>\n',
+    ])
+    def test_stream_batches_match_dom(self, tmp_path, monkeypatch, extra):
+        """iter_rdf_batches parses small windows — same rows as the DOM parse."""
+        pa = pytest.importorskip("pyarrow")
+        monkeypatch.setattr(cython_pugixml_arrow, "_MIN_WINDOW_BYTES", 256)
+        path = _write_objects(tmp_path / "big.xml", 300, extra)
+        dom = cython_pugixml_arrow.load_rdf_to_dataframe(path)
+        batches = list(cython_pugixml_arrow.iter_rdf_batches(path, 97))
+        assert [b.num_rows for b in batches[:-1]] == [97] * (len(batches) - 1)
+        assert 0 < batches[-1].num_rows <= 97
+        assert len({b.column("INSTANCE_ID").dictionary[0].as_py() for b in batches}) == 1
+        plain = pa.schema([(name, pa.string()) for name in dom.schema.names])
+        streamed = pa.Table.from_batches([b.cast(plain) for b in batches])
+        assert _without_meta_ids(streamed) == _without_meta_ids(dom)
+
+    def test_pushdown_split_and_stream(self, tmp_path, monkeypatch):
+        """The pushdown filter reaches every slice / window of a document."""
+        pa = pytest.importorskip("pyarrow")
+        monkeypatch.setattr(cython_pugixml_arrow, "_MIN_CHUNK_BYTES", 1024)
+        monkeypatch.setattr(cython_pugixml_arrow, "_MIN_WINDOW_BYTES", 256)
+        path = _write_objects(tmp_path / "big.xml", 300)
+        pushdown = {"types": ["Terminal"], "keys": ["Terminal.ConnectivityNode"]}
+        whole = cython_pugixml_arrow.load_rdf_to_dataframe(path, **pushdown)
+        assert set(whole.column("KEY").to_pylist()) - {"label", "xml_base", "rdf", "cim"} == {
+            "Type", "Terminal.ConnectivityNode"}
+        assert whole.num_rows == 300 * 2 + 6   # + Distribution / NamespaceMap rows
+        split = cython_pugixml_arrow.load_rdf_to_dataframe(path, max_workers=4, **pushdown)
+        assert _without_meta_ids(split) == _without_meta_ids(whole)
+        plain = pa.schema([(name, pa.string()) for name in whole.schema.names])
+        streamed = pa.Table.from_batches(
+            [b.cast(plain) for b in cython_pugixml_arrow.iter_rdf_batches(path, 50, **pushdown)])
+        assert _without_meta_ids(streamed) == _without_meta_ids(whole)
+
+    def test_parse_single_file_uses_split(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cython_pugixml_arrow, "_MIN_CHUNK_BYTES", 1024)
+        path = _write_objects(tmp_path / "big.xml", 200)
+        sequential = parse(path, engine="cython_pugixml_arrow", return_type="arrow")
+        split = parse(path, engine="cython_pugixml_arrow", return_type="arrow", max_workers=4)
+        assert split.num_rows == sequential.num_rows
+        assert split["VALUE"].equals(sequential["VALUE"])
+
 
 # ── Engine parity ───────────────────────────────────────────────────────────
 
@@ -235,6 +1125,57 @@ def test_realgrid_parse_and_meta(realgrid_data):
     assert "Distribution" in realgrid_data["VALUE"].values
 
 
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+def test_parse_batches_batch_rows(engine):
+    """batch_rows re-chunks each file; rows and order match one batch per file."""
+    pytest.importorskip("pyarrow")
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    whole = triplets.parser.parse_batches(MINIMAL, engine=engine).read_all()
+    batches = list(triplets.parser.parse_batches(MINIMAL, engine=engine, batch_rows=5))
+    assert all(b.num_rows == 5 for b in batches[:-1])
+    streamed = triplets.parser.parse_batches(MINIMAL, engine=engine, batch_rows=5).read_all()
+    assert streamed.schema == whole.schema
+    assert streamed["KEY"].equals(whole["KEY"]) and streamed["VALUE"].equals(whole["VALUE"])
+    with pytest.raises(ValueError, match="batch_rows"):
+        triplets.parser.parse_batches(MINIMAL, engine=engine, batch_rows=5, max_workers=2)
+
+
+@pytest.mark.parametrize("engine", ["python_lxml_arrow", "cython_pugixml_arrow"])
+@pytest.mark.parametrize("options", [{}, {"batch_rows": 7}, {"max_workers": 2}])
+def test_parse_batches_shared_dictionaries(engine, options, tmp_path):
+    """categorical_columns: one growing dictionary per column across batches
+    (each a prefix of the next), writable as an IPC stream with deltas."""
+    pa = pytest.importorskip("pyarrow")
+    if engine == "cython_pugixml_arrow" and not HAS_CYTHON_PUGIXML_ARROW:
+        pytest.skip("cython_pugixml_arrow not built")
+    import io
+    import zipfile
+    with zipfile.ZipFile(tmp_path / "m.zip", "w") as bundle:
+        for i in range(3):
+            bundle.write(MINIMAL, f"f{i}.xml")
+    reader = triplets.parser.parse_batches(tmp_path / "m.zip", engine=engine,
+                                           categorical_columns=("INSTANCE_ID", "KEY"), **options)
+    assert reader.schema.field("KEY").type == pa.dictionary(pa.int32(), pa.string())
+    assert reader.schema.field("VALUE").type == pa.string()
+    batches = list(reader)
+    for column in ("KEY", "INSTANCE_ID"):
+        dictionaries = [b.column(column).dictionary.to_pylist() for b in batches]
+        assert all(later[:len(earlier)] == earlier for earlier, later in zip(dictionaries, dictionaries[1:]))
+    assert len(batches[-1].column("INSTANCE_ID").dictionary) == 3
+
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, reader.schema,
+                           options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    plain = triplets.parser.parse_batches(tmp_path / "m.zip", engine=engine, **options).read_all()
+    assert table["KEY"].cast(pa.string()).equals(plain["KEY"]) and table["VALUE"].equals(plain["VALUE"])
+    with pytest.raises(ValueError, match="categorical_columns"):
+        triplets.parser.parse_batches(MINIMAL, engine=engine, categorical_columns=["TYPE"])
+
+
 def test_parse_batches_parallel_prefetch(tmp_path):
     """max_workers keeps batch order (in-order bounded prefetch) and row parity."""
     pytest.importorskip("pyarrow")
@@ -247,3 +1188,36 @@ def test_parse_batches_parallel_prefetch(tmp_path):
     parallel = list(triplets.parser.parse_batches(archive, max_workers=3))
     assert len(parallel) == len(sequential) == 6
     assert [b.num_rows for b in parallel] == [b.num_rows for b in sequential]
+
+
+def test_iterparse_rdf_drops_processed_objects(monkeypatch):
+    """The lxml engines parse incrementally: with a tiny feed chunk every
+    object still arrives whole, and the tree never holds the processed ones."""
+    from triplets.parser import utils
+    monkeypatch.setattr(utils, "_CHUNK", 64)
+    root, objects = utils.iterparse_rdf(MINIMAL)
+    assert root.base.endswith("minimal_cim.xml") and "cim" in root.nsmap
+    sizes, tags = [], []
+    for rdf_object in objects:
+        tags.append(rdf_object.tag)
+        sizes.append(len(root))
+    assert max(sizes) <= 2
+    from lxml import etree
+    dom = etree.parse(MINIMAL, etree.XMLParser(remove_comments=True)).getroot()
+    assert tags == [element.tag for element in dom]
+
+
+@pytest.mark.parametrize("pushdown", [{}, {"types": ["VoltageLevel"], "keys": ["VoltageLevel.Substation"]}])
+def test_parse_batches_lxml_streams_with_pushdown(pushdown, monkeypatch):
+    """python_lxml_arrow streams batch_rows batches (iter_rdf_batches) with
+    the rows of the whole-file parse, pushdown and shorten_resources included."""
+    pytest.importorskip("pyarrow")
+    from triplets.parser import python_lxml_arrow, utils
+    monkeypatch.setattr(utils, "_CHUNK", 128)
+    whole = triplets.parser.parse_batches(MINIMAL, engine="python_lxml_arrow", shorten_resources=False,
+                                          **pushdown).read_all()
+    batches = list(python_lxml_arrow.iter_rdf_batches(MINIMAL, 3, shorten_resources=False, **pushdown))
+    assert all(b.num_rows == 3 for b in batches[:-1])
+    streamed = triplets.parser.parse_batches(MINIMAL, engine="python_lxml_arrow", batch_rows=3,
+                                             shorten_resources=False, **pushdown).read_all()
+    assert streamed["KEY"].equals(whole["KEY"]) and streamed["VALUE"].equals(whole["VALUE"])
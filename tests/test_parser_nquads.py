@@ -125,3 +125,48 @@ def test_return_types():
 
 def test_top_level_export():
     assert triplets.read_nquads is read_nquads
+
+
+def test_read_nquads_batches_streams_bounded_blocks():
+    pyarrow = pytest.importorskip("pyarrow")
+    from triplets.parser.nquads import read_nquads_batches
+    content = "".join(f'<urn:uuid:a{i}> <{CIM}IdentifiedObject.name> "n{i}" <urn:uuid:g{i % 3}> .\n'
+                      for i in range(5000))
+
+    reader = read_nquads_batches(content, batch_rows=1000, categorical_columns=["INSTANCE_ID"])
+    assert isinstance(reader, pyarrow.RecordBatchReader)
+    batches = list(reader)
+    assert len(batches) > 1
+    assert all(batch.schema == reader.schema for batch in batches)
+    assert pyarrow.types.is_dictionary(reader.schema.field("INSTANCE_ID").type)
+
+    table = pyarrow.Table.from_batches(batches)
+    assert table.num_rows == 5000
+    expected = read_nquads(content, return_type="arrow")
+    assert table.column("VALUE").to_pylist() == expected.column("VALUE").to_pylist()
+    assert table.column("INSTANCE_ID").to_pylist() == expected.column("INSTANCE_ID").to_pylist()
+
+
+def test_read_nquads_batches_rejects_unknown_categorical_column():
+    pytest.importorskip("pyarrow")
+    from triplets.parser.nquads import read_nquads_batches
+    with pytest.raises(ValueError, match="categorical_columns"):
+        read_nquads_batches("<urn:uuid:a> <urn:p> \"n\" .", categorical_columns=["GRAPH"])
+
+
+def test_terms_to_batch_matches_terms_to_triplets():
+    """The CONSTRUCT decoding shared by the SPARQL engines agrees with the
+    pandas term conversion."""
+    pyarrow = pytest.importorskip("pyarrow")
+    from triplets.parser.nquads import terms_to_batch, terms_to_triplets
+    subjects = ["<urn:uuid:a>", "_:b0", "<http://example.com/s>"]
+    predicates = ["<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>", f"<{CIM}IdentifiedObject.name>",
+                  "<http://example.com/p>"]
+    objects = [f"<{CIM}Terminal>", '"caf\\u00E9 \\"x\\""@en', '"2.5"^^<http://www.w3.org/2001/XMLSchema#float>']
+
+    batch = terms_to_batch(pyarrow.array(subjects), pyarrow.array(predicates), pyarrow.array(objects))
+    frame = terms_to_triplets(pandas.DataFrame({"ID": subjects, "KEY": predicates, "VALUE": objects},
+                                               dtype="object"))
+    for column in ("ID", "KEY", "VALUE"):
+        assert batch.column(column).to_pylist() == frame[column].tolist()
+    assert batch.column("INSTANCE_ID").null_count == len(subjects)
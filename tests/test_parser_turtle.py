@@ -0,0 +1,87 @@
+"""Tests for read_turtle / read_trig — Rust parse, N-Quads conventions (triplets.parser.turtle)."""
+import io
+
+import pandas
+import pytest
+
+pytest.importorskip("pyoxigraph")
+pyarrow = pytest.importorskip("pyarrow")
+
+import triplets
+from triplets.parser.nquads import read_nquads
+from triplets.parser.turtle import read_trig, read_trig_batches, read_turtle, read_turtle_batches
+
+CIM = "http://iec.ch/TC57/CIM100#"
+
+TURTLE = f"""@prefix cim: <{CIM}> .
+@prefix : <urn:uuid:> .
+:a a cim:ACLineSegment ;
+    cim:IdentifiedObject.name "Line \\"1\\""@en, "L1" ;
+    cim:Conductor.length 12.5 ;
+    cim:Equipment.EquipmentContainer :c .
+"""
+
+
+def canon(frame):
+    return frame.astype(object).sort_values(["ID", "KEY", "VALUE"]).reset_index(drop=True)
+
+
+def test_turtle_matches_nquads_conventions():
+    result = canon(read_turtle(TURTLE))
+    assert result[["ID", "KEY", "VALUE"]].values.tolist() == [
+        ["a", "Conductor.length", "12.5"],
+        ["a", "Equipment.EquipmentContainer", "c"],
+        ["a", "IdentifiedObject.name", "L1"],
+        ["a", "IdentifiedObject.name", 'Line "1"'],
+        ["a", "Type", "ACLineSegment"],
+    ]
+    assert result["INSTANCE_ID"].isna().all()
+
+
+def test_turtle_equals_same_graph_in_nquads():
+    nquads = (f'<urn:uuid:a> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <{CIM}ACLineSegment> .\n'
+              f'<urn:uuid:a> <{CIM}IdentifiedObject.name> "L1" .\n')
+    turtle = f'<urn:uuid:a> a <{CIM}ACLineSegment> ; <{CIM}IdentifiedObject.name> "L1" .'
+    pandas.testing.assert_frame_equal(canon(read_turtle(turtle)), canon(read_nquads(nquads)))
+
+
+def test_trig_graph_becomes_instance_id():
+    content = '@prefix : <urn:uuid:> .\n:g { :a :p "x" }\n:b :p :c .\n'
+    result = canon(read_trig(content))
+    assert result["INSTANCE_ID"].iloc[0] == "g"
+    assert pandas.isna(result["INSTANCE_ID"].iloc[1])
+
+
+def test_source_bytes_str_filelike_and_path(tmp_path):
+    path = tmp_path / "data.ttl"
+    path.write_text(TURTLE)
+    for source in (TURTLE, TURTLE.encode(), io.BytesIO(TURTLE.encode()), str(path), path):
+        assert len(read_turtle(source)) == 5
+
+
+def test_relative_iris_need_base_iri():
+    with pytest.raises(ValueError, match="not Turtle"):
+        read_turtle('<#a> <#p> "x" .')
+    result = read_turtle('<#a> <#p> "x" .', base_iri="http://example.com/doc")
+    assert result.iloc[0]["ID"] == "http://example.com/doc#a"
+
+
+def test_batches_are_bounded_and_share_dictionaries():
+    content = "@prefix : <urn:uuid:> .\n" + "".join(f':a{i} :p "v{i}" .\n' for i in range(250))
+    reader = read_turtle_batches(content, batch_rows=100, categorical_columns=["KEY"])
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [100, 100, 50]
+    assert pyarrow.types.is_dictionary(reader.schema.field("KEY").type)
+    assert pyarrow.Table.from_batches(batches).num_rows == 250
+
+    trig = read_trig_batches("@prefix : <urn:uuid:> .\n:g { :a :p :b }", batch_rows=1)
+    assert trig.read_all().column("INSTANCE_ID").to_pylist() == ["g"]
+
+
+def test_return_types_and_registration():
+    polars = pytest.importorskip("polars")
+    assert isinstance(read_turtle(TURTLE, return_type="polars"), polars.DataFrame)
+    assert isinstance(read_trig(TURTLE, return_type="arrow"), pyarrow.Table)
+    assert isinstance(pandas.read_turtle(TURTLE), pandas.DataFrame)
+    assert isinstance(polars.read_trig(TURTLE), polars.DataFrame)
+    assert triplets.read_turtle is read_turtle
@@ -1192,3 +1192,308 @@ class TestDispatchBoundary:
     def test_surface_gap_raises_not_implemented(self, con):
         with pytest.raises(NotImplementedError, match="has no duckdb engine"):
             triplets.tools.tableviews_to_triplets({"T": con.sql("SELECT 1 AS ID")})
+
+
+# ── TripletIndex: indexed lookups match the scans ───────────────────────────
+
+def _grid_triplets(dtype=None):
+    """Substations ← VoltageLevels ← Breakers ← Terminals, one object declared
+    in two instances (two Type rows) and one dangling reference."""
+    rows = []
+    for s in range(3):
+        rows += [(f"S{s}", "Type", "Substation", "EQ"), (f"S{s}", "IdentifiedObject.name", f"sub {s}", "EQ")]
+        for v in range(2):
+            vl = f"VL{s}{v}"
+            rows += [(vl, "Type", "VoltageLevel", "EQ"), (vl, "VoltageLevel.Substation", f"S{s}", "EQ"),
+                     (vl, "VoltageLevel.highVoltageLimit", str(110 * (v + 1)), "EQ")]
+            for b in range(2):
+                br = f"B{s}{v}{b}"
+                rows += [(br, "Type", "Breaker", "EQ"), (br, "Equipment.EquipmentContainer", vl, "EQ"),
+                         (br, "Switch.open", "false", "SSH"), (br, "Type", "Breaker", "SSH")]
+                rows += [(f"T{br}", "Type", "Terminal", "EQ"), (f"T{br}", "Terminal.ConductingEquipment", br, "EQ")]
+    rows += [("X", "Type", "Terminal", "EQ"), ("X", "Terminal.ConductingEquipment", "missing", "EQ")]
+    data = pandas.DataFrame(rows, columns=["ID", "KEY", "VALUE", "INSTANCE_ID"])
+    return data.astype(dtype) if dtype else data
+
+
+class TestTripletIndex:
+    """The pandas / polars engines answer through a TripletIndex from the
+    second lookup on a frame; results must equal the scans they replace."""
+
+    LOOKUPS = [
+        ("get_object_data", ("VL10",)),
+        ("get_object_data", ("nothing",)),
+        ("type_tableview", ("Breaker",)),
+        ("type_tableview", ("VoltageLevel",), {"multivalue": True}),
+        ("key_tableview", ("Switch.open",)),
+        ("id_tableview", (["B000", "S1", "nothing"],)),
+        ("filter_triplets_by_type", ("Breaker",)),
+        ("references_to", ("S0",), {"levels": 3}),
+        ("references_from", ("TB100",), {"levels": 3}),
+        ("references_from", ("X",)),
+        ("references_to", (["VL00", "S0", "TB111", "nothing"],), {"levels": 3}),
+        ("references_from", (["TB100", "B100", "X"],), {"levels": 2}),
+        ("get_objects_data", (["B000", "S1", "nothing", "B000"],)),
+        ("id_tableview", (pandas.Series(["VL10", "S2"]),)),
+    ]
+
+    @staticmethod
+    def _scan(engine, monkeypatch, name, args, kwargs):
+        with monkeypatch.context() as patch:
+            patch.setattr(engine, "triplet_index", lambda data, build=False: None)
+            return getattr(engine, name)(*args, **kwargs)
+
+    @pytest.mark.parametrize("dtype, chunks", [(None, 1), ("category", 1), ("string[pyarrow]", 1),
+                                               ("string[pyarrow]", 3)])
+    def test_pandas_matches_scan(self, dtype, chunks, monkeypatch):
+        pytest.importorskip("pyarrow")
+        from triplets.tools import pandas_engine, triplet_index
+        data = _grid_triplets(dtype)
+        if chunks > 1:   # Arrow columns of several chunks, as from a parse of several files
+            size = -(-len(data) // chunks)
+            data = pandas.concat([data[i:i + size] for i in range(0, len(data), size)], ignore_index=True)
+            assert data["VALUE"].array._pa_array.num_chunks == chunks
+        assert triplet_index(data) is None          # first lookup: scan, remembered
+        assert triplet_index(data) is not None      # second lookup: built
+        for name, args, *kwargs in self.LOOKUPS:
+            kwargs = kwargs[0] if kwargs else {}
+            expected = self._scan(pandas_engine, monkeypatch, name, (data, *args), kwargs)
+            result = getattr(pandas_engine, name)(data, *args, **kwargs)
+            if isinstance(expected, pandas.Series):
+                pandas.testing.assert_series_equal(result, expected)
+            else:
+                # the scans' merges recast categorical link columns level by level
+                # (str, then object); the index keeps the first level's dtype
+                relaxed = dtype == "category" and name.startswith("references")
+                pandas.testing.assert_frame_equal(result, expected, check_dtype=not relaxed,
+                                                  check_categorical=not relaxed)
+
+    def test_polars_matches_scan(self, monkeypatch):
+        pl = pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        from triplets.tools import polars_engine, triplet_index
+        data = pl.from_pandas(_grid_triplets()).with_columns(pl.col("KEY").cast(pl.Categorical))
+        assert triplet_index(data, build=True) is not None
+        for name, args, *kwargs in self.LOOKUPS:
+            kwargs = kwargs[0] if kwargs else {}
+            expected = self._scan(polars_engine, monkeypatch, name, (data, *args), kwargs)
+            result = getattr(polars_engine, name)(data, *args, **kwargs)
+            if expected is None:
+                assert result is None
+                continue
+            # the joins do not keep an order; compare as sorted rows and columns
+            columns = sorted(expected.columns)
+            key = [c for c in columns if not isinstance(expected[c].dtype, pl.List)]
+            assert result.select(columns).sort(key, nulls_last=True).equals(
+                expected.select(columns).sort(key, nulls_last=True)), name
+
+    def test_modified_frame_drops_its_index(self):
+        pytest.importorskip("pyarrow")
+        from triplets.tools import triplet_index
+        data = _grid_triplets()
+        index = triplet_index(data, build=True)
+        assert triplet_index(data) is index
+        data.loc[data["ID"] == "VL10", "VALUE"] = "changed"
+        assert triplet_index(data) is None
+        assert (data.get_object_data("VL10") == "changed").all()
+        assert triplet_index(data) is not index
+
+    def test_numpy_frames_are_not_cached_without_copy_on_write(self, monkeypatch):
+        pytest.importorskip("pyarrow")
+        from triplets import _identity
+        from triplets.tools import triplet_index
+        monkeypatch.setattr(_identity, "_copy_on_write", lambda: False)   # pandas 2.x default
+        data = _grid_triplets().astype(object)
+        assert triplet_index(data, build=True) is not None
+        assert triplet_index(data) is None and triplet_index(data) is None   # scans, never stale
+        arrow = _grid_triplets("string[pyarrow]")   # Arrow arrays are swapped on write
+        assert triplet_index(arrow, build=True) is triplet_index(arrow)
+
+    def test_unindexable_values_scan(self):
+        pytest.importorskip("pyarrow")
+        from triplets.tools import triplet_index
+        data = _grid_triplets()
+        data["VALUE"] = data["VALUE"].astype(object)
+        data.loc[data["KEY"] == "VoltageLevel.highVoltageLimit", "VALUE"] = 110.0
+        assert triplet_index(data, build=True) is None
+        assert len(data.type_tableview("VoltageLevel")) == 6
+
+
+class TestGetObjectsData:
+    """get_objects_data: the triplets of many objects in one semi-join, in
+    dataset order — the rows a get_object_data loop would find."""
+
+    IDS = ["B000", "S1", "nothing", "TB101", "B000"]
+
+    def _expected(self):
+        data = _grid_triplets()
+        return data[data["ID"].isin(self.IDS)]
+
+    def test_pandas(self):
+        data = _grid_triplets()
+        pandas.testing.assert_frame_equal(data.get_objects_data(self.IDS), self._expected())
+        for object_UUID, object_data in data.get_objects_data(pandas.Series(self.IDS)).groupby("ID"):
+            pandas.testing.assert_series_equal(object_data.set_index("KEY")["VALUE"],
+                                               data.get_object_data(object_UUID))
+
+    def test_polars(self):
+        pl = pytest.importorskip("polars")
+        from triplets.tools import polars_engine
+        data = pl.from_pandas(_grid_triplets()).with_columns(pl.col("ID").cast(pl.Categorical))
+        result = polars_engine.get_objects_data(data, self.IDS)
+        assert result.with_columns(pl.col("ID").cast(pl.Utf8)).to_pandas().equals(
+            self._expected().reset_index(drop=True))
+
+    @pytest.mark.parametrize("literal_max", [1000, 1])
+    def test_duckdb(self, literal_max, monkeypatch):
+        duckdb = pytest.importorskip("duckdb")
+        from triplets.tools import duckdb_engine
+        monkeypatch.setattr(duckdb_engine, "_ID_LIST_MAX", literal_max)   # 1: the temp-table path
+        con = duckdb.connect()
+        con.register("_src", _grid_triplets())
+        con.execute("CREATE TABLE triplets AS SELECT * FROM _src")
+        result = duckdb_engine.get_objects_data(con, self.IDS).df()
+        expected = self._expected()
+        assert sorted(map(tuple, result.to_numpy())) == sorted(map(tuple, expected.to_numpy()))
+        assert duckdb_engine.get_objects_data(con, []).df().empty
+        view = duckdb_engine.id_tableview(con, self.IDS).df()
+        assert sorted(view["ID"]) == ["B000", "S1", "TB101"]
+
+    def test_duckdb_calls_keep_their_own_ids(self, monkeypatch):
+        duckdb = pytest.importorskip("duckdb")
+        from triplets.tools import duckdb_engine
+        monkeypatch.setattr(duckdb_engine, "_ID_LIST_MAX", 1)
+        con = duckdb.connect()
+        con.register("_src", _grid_triplets())
+        con.execute("CREATE TABLE triplets AS SELECT * FROM _src")
+        first = duckdb_engine.get_objects_data(con, ["B000", "S1"])
+        first_view = duckdb_engine.id_tableview(con, ["B000", "S1"], view_name="first")
+        duckdb_engine.get_objects_data(con, ["TB101", "nothing"]).df()
+        duckdb_engine.id_tableview(con, ["TB101", "nothing"], view_name="second").df()
+        assert sorted(set(first.df()["ID"])) == ["B000", "S1"]
+        # get_objects_data names nothing: only the two views' ID lists are kept
+        assert len(con.sql("SELECT * FROM duckdb_tables() WHERE temporary").fetchall()) == 2
+        assert sorted(first_view.df()["ID"]) == ["B000", "S1"]
+        assert sorted(con.sql('SELECT * FROM "first"').df()["ID"]) == ["B000", "S1"]
+        # replacing a view drops the ID table behind the old one
+        tables = len(con.sql("SELECT * FROM duckdb_tables() WHERE temporary").fetchall())
+        duckdb_engine.id_tableview(con, ["TB101", "S1"], view_name="first")
+        assert len(con.sql("SELECT * FROM duckdb_tables() WHERE temporary").fetchall()) == tables
+        assert sorted(con.sql('SELECT * FROM "first"').df()["ID"]) == ["S1", "TB101"]
+
+
+class TestTripletsToTableviewsOnePass:
+    """triplets_to_tableviews partitions by Type once; every tableview must
+    equal the per-class type_tableview it replaces."""
+
+    @pytest.mark.parametrize("multivalue", [False, True])
+    def test_pandas(self, multivalue):
+        from triplets.tools import pandas_engine
+        data = _grid_triplets()
+        tableviews = pandas_engine.triplets_to_tableviews(data, multivalue=multivalue)
+        assert list(tableviews) == list(pandas_engine.types_dict(data))
+        for class_name, view in tableviews.items():
+            pandas.testing.assert_frame_equal(
+                view, pandas_engine.type_tableview(data, class_name, multivalue=multivalue))
+
+    @pytest.mark.parametrize("multivalue", [False, True])
+    def test_polars(self, multivalue):
+        pl = pytest.importorskip("polars")
+        from triplets.tools import polars_engine
+        data = pl.from_pandas(_grid_triplets()).with_columns(pl.col("KEY").cast(pl.Categorical))
+        tableviews = polars_engine.triplets_to_tableviews(data, multivalue=multivalue)
+        assert set(tableviews) == set(polars_engine.types_dict(data))
+        for class_name, view in tableviews.items():
+            expected = polars_engine.type_tableview(data, class_name, multivalue=multivalue)
+            assert view.select(sorted(view.columns)).sort("ID").equals(
+                expected.select(sorted(expected.columns)).sort("ID")), class_name
+
+    @pytest.mark.parametrize("multivalue", [False, True])
+    def test_duckdb(self, multivalue):
+        duckdb = pytest.importorskip("duckdb")
+        from triplets.tools import duckdb_engine
+        con = duckdb.connect()
+        con.register("_src", _grid_triplets())
+        con.execute("CREATE TABLE triplets AS SELECT * FROM _src")
+        tableviews = duckdb_engine.triplets_to_tableviews(con, multivalue=multivalue)
+        assert list(tableviews) == list(duckdb_engine.types_dict(con))
+        for class_name, relation in tableviews.items():
+            view = relation.df()
+            expected = duckdb_engine.type_tableview(con, class_name, multivalue=multivalue).df()
+            pandas.testing.assert_frame_equal(
+                view[sorted(view.columns)].sort_values("ID", ignore_index=True),
+                expected[sorted(expected.columns)].sort_values("ID", ignore_index=True))
+
+    def test_duckdb_calls_keep_their_own_relations(self):
+        duckdb = pytest.importorskip("duckdb")
+        from triplets.tools import duckdb_engine
+        con = duckdb.connect()
+        data = _grid_triplets()
+        con.register("_src", data)
+        con.execute("CREATE TABLE ta AS SELECT * FROM _src WHERE ID LIKE 'S%'")
+        con.execute("CREATE TABLE tb AS SELECT * FROM _src WHERE ID LIKE 'VL%'")
+        first = duckdb_engine.triplets_to_tableviews(con, table="ta")
+        second = duckdb_engine.triplets_to_tableviews(con, table="tb")
+        assert sorted(first["Substation"].df()["ID"]) == ["S0", "S1", "S2"]
+        assert list(second) == ["VoltageLevel"]
+        assert not con.sql("SELECT * FROM duckdb_tables() WHERE temporary").fetchall()   # nothing left behind
+
+
+class TestSchemaTypedTableviews:
+    """type_tableview(..., rdf_map=schema) types columns by the schema's
+    xsd:type: numbers and booleans are cast, everything else stays text."""
+
+    SCHEMA = {"EQ": {
+        "VoltageLevel.highVoltageLimit": {"xsd:type": "xsd:float"},
+        "Switch.open": {"xsd:type": "xsd:boolean"},
+        "IdentifiedObject.name": {"xsd:type": "xsd:string"},
+        "VoltageLevel.Substation": {"type": "Association"},
+    }}
+
+    @staticmethod
+    def _data():
+        data = _grid_triplets()
+        data.loc[data["VALUE"] == "sub 1", "VALUE"] = "12"   # numeric-looking name
+        data.loc[data["ID"] == "VL21", "VALUE"] = data.loc[data["ID"] == "VL21", "VALUE"].replace("220", "n/a")
+        return data
+
+    def test_pandas(self):
+        from triplets.tools import pandas_engine
+        data = self._data()
+        voltage = pandas_engine.type_tableview(data, "VoltageLevel", rdf_map=self.SCHEMA)
+        assert voltage["VoltageLevel.highVoltageLimit"].dtype == "float64"
+        assert voltage.loc["VL00", "VoltageLevel.highVoltageLimit"] == 110.0
+        assert pandas.isna(voltage.loc["VL21", "VoltageLevel.highVoltageLimit"])   # malformed → missing
+        breakers = pandas_engine.type_tableview(data, "Breaker", rdf_map=self.SCHEMA)
+        assert breakers["Switch.open"].dtype == "boolean" and not breakers["Switch.open"].any()
+        substations = pandas_engine.type_tableview(data, "Substation", rdf_map=self.SCHEMA)
+        assert substations.loc["S1", "IdentifiedObject.name"] == "12"   # text by schema, not probed
+        tableviews = pandas_engine.triplets_to_tableviews(data, rdf_map=self.SCHEMA)
+        pandas.testing.assert_frame_equal(tableviews["VoltageLevel"], voltage)
+
+    def test_polars(self):
+        pl = pytest.importorskip("polars")
+        from triplets.tools import polars_engine
+        data = pl.from_pandas(self._data())
+        voltage = polars_engine.type_tableview(data, "VoltageLevel", rdf_map=self.SCHEMA).sort("ID")
+        assert voltage["VoltageLevel.highVoltageLimit"].to_list() == [110.0, 220.0, 110.0, 220.0, 110.0, None]
+        breakers = polars_engine.type_tableview(data, "Breaker", rdf_map=self.SCHEMA)
+        assert breakers["Switch.open"].dtype == pl.Boolean
+        substations = polars_engine.type_tableview(data, "Substation", rdf_map=self.SCHEMA)
+        assert substations["IdentifiedObject.name"].dtype == pl.String
+
+    def test_duckdb(self):
+        duckdb = pytest.importorskip("duckdb")
+        from triplets.tools import duckdb_engine
+        con = duckdb.connect()
+        con.register("_src", self._data())
+        con.execute("CREATE TABLE triplets AS SELECT * FROM _src")
+        with pytest.raises(ValueError, match="rdf_map="):
+            duckdb_engine.type_tableview(con, "VoltageLevel", string_to_number=True)
+        voltage = duckdb_engine.type_tableview(con, "VoltageLevel", rdf_map=self.SCHEMA).df().sort_values("ID")
+        assert voltage["VoltageLevel.highVoltageLimit"].isna().tolist() == [False] * 5 + [True]
+        assert voltage["VoltageLevel.highVoltageLimit"].dtype == "float64"
+        breakers = duckdb_engine.triplets_to_tableviews(con, rdf_map=self.SCHEMA)["Breaker"].df()
+        assert breakers["Switch.open"].dtype == bool and not breakers["Switch.open"].any()
+        substations = duckdb_engine.type_tableview(con, "Substation", rdf_map=self.SCHEMA).df()
+        assert sorted(substations["IdentifiedObject.name"]) == ["12", "sub 0", "sub 2"]
@@ -31,7 +31,7 @@ __version__ = get_versions()['version']
 del get_versions
 
 # Expose the new parser API at top level
-from .parser import parse, parse_batches, read_rdf as read_rdf_func, read_nquads  # noqa: F401
+from .parser import parse, parse_batches, read_rdf as read_rdf_func, read_nquads, read_turtle, read_trig  # noqa: F401
 
 # Register read_rdf on pandas and polars (monkey-patch, standard approach)
 # There is no official plugin API for top-level read functions in either library.
@@ -43,6 +43,8 @@ import logging
 pd.read_RDF = partial(parse, return_type="pandas")
 pd.read_rdf = partial(parse, return_type="pandas")
 pd.read_nquads = partial(read_nquads, return_type="pandas")
+pd.read_turtle = partial(read_turtle, return_type="pandas")
+pd.read_trig = partial(read_trig, return_type="pandas")
 logging.getLogger(__name__).debug("Registered pandas.read_rdf (and read_RDF)")
 
 try:
@@ -50,6 +52,8 @@ try:
     pl.read_rdf = partial(parse, return_type="polars")
     pl.read_RDF = partial(parse, return_type="polars")
     pl.read_nquads = partial(read_nquads, return_type="polars")
+    pl.read_turtle = partial(read_turtle, return_type="polars")
+    pl.read_trig = partial(read_trig, return_type="polars")
     logging.getLogger(__name__).debug("Registered polars.read_rdf (polars available)")
 except ImportError:
     logging.getLogger(__name__).debug("polars not installed, skipping read_rdf registration")
@@ -79,9 +83,14 @@ try:
         failure leaves the previous table intact (a failed ``append=True`` adds
         no rows, but may leave a newly created empty table behind).
         ``max_workers`` parses up to that many files ahead (bounded, in-order
-        prefetch — see :func:`triplets.parser.parse_batches`). An arrow parser
-        engine is required; ``string_type`` / ``categorical_columns`` do not
-        apply on this path and raise. Returns the rows loaded by this call.
+        prefetch) and ``batch_rows`` streams each file in batches of that many
+        rows, keeping memory flat even for one huge file (see
+        :func:`triplets.parser.parse_batches`). ``categorical_columns``
+        streams those columns dictionary-encoded with one shared dictionary,
+        so repeated KEY / INSTANCE_ID strings cross into DuckDB once (they
+        land as VARCHAR, or as the ENUM of an existing ``append=True``
+        table). An arrow parser engine is required; ``string_type`` does not
+        apply on this path and raises. Returns the rows loaded by this call.
         """
         if table_name is not None and table is None:
             table = table_name
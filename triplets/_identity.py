@@ -0,0 +1,130 @@
+"""Per-object caches that notice when the object was modified.
+
+Derived state of a triplet dataset (parse statistics, lookup indexes) is
+kept per object identity with a weakref eviction callback, like the
+engine-state content keys: when the object is garbage-collected its entry
+vanishes, so a new object reusing the id() never inherits it. Unlike those
+keys, an IdentityCache does not rely on the caller to promise the object is
+unchanged — each entry carries a snapshot of the object's column storage,
+and a lookup whose snapshot no longer matches drops the entry:
+
+- pyarrow Table / RecordBatch — immutable, identity is enough;
+- pandas DataFrame — the column names, length and each column's storage:
+  the Arrow array of an Arrow-backed column (pandas swaps it on every
+  assignment), or the numpy buffer of any other column. The snapshot holds
+  that column, so under Copy-on-Write an in-place write copies the buffer
+  and the address changes. Without Copy-on-Write (pandas 2.x with
+  ``mode.copy_on_write`` off) a ``.loc`` write keeps the buffer, so frames
+  with numpy-backed columns are not cached there;
+- polars DataFrame — the column names and the buffer addresses of each
+  column's zero-copy Arrow export (physical codes for Categoricals); the
+  snapshot holds the export, so replaced buffers cannot be reused.
+
+Other flavors (DuckDB connections) are not cached.
+"""
+import weakref
+
+from ._caches import register_cache
+from ._engine_detect import flavor
+
+
+class IdentityCache:
+    """A value per live, unmodified data object. ``engine_state=True`` puts
+    the entries under triplets.clear_caches() / cache_scope() (see _caches)."""
+
+    def __init__(self, engine_state=False):
+        self._entries = {}   # id(data) → (weakref.ref with evict callback, snapshot, value)
+        if engine_state:
+            register_cache(self._entries)
+
+    def get(self, data):
+        """The value stored for data, or None (never stored, collected, or modified since)."""
+        entry = self._entries.get(id(data))
+        if entry is None or entry[0]() is not data:
+            return None
+        if not _same(entry[1], snapshot(data)):
+            self._entries.pop(id(data), None)   # release the snapshot's columns
+            return None
+        return entry[2]
+
+    def put(self, data, value):
+        """Store value for data (ignored for flavors without a snapshot); returns value."""
+        current = snapshot(data)
+        if current is None:
+            return value
+        oid = id(data)
+        entries = self._entries
+        entries[oid] = (weakref.ref(data, lambda _: entries.pop(oid, None)), current, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+
+def snapshot(data):
+    """Comparable record of data's column storage, or None when it cannot be taken."""
+    kind = flavor(data)
+    if kind == "pyarrow":
+        return ()
+    if kind == "pandas":
+        columns = tuple(_pandas_column(data.iloc[:, i]) for i in range(data.shape[1]))
+        if None in columns:
+            return None
+        return (tuple(data.columns), len(data)) + columns
+    if kind == "polars":
+        return (tuple(data.columns), data.height) + tuple(_polars_column(series) for series in data.get_columns())
+    return None
+
+
+def _pandas_column(series):
+    """The column's storage token; None for numpy storage an in-place write
+    would keep (no Copy-on-Write)."""
+    array = series.array
+    arrow = getattr(array, "_pa_array", None)
+    if arrow is not None:
+        return _Held(arrow, id(arrow))
+    values = getattr(array, "_ndarray", None)     # numpy-backed
+    if values is None:
+        values = getattr(array, "codes", None)    # Categorical
+    if values is None:
+        return _Held(None, object())              # storage not inspectable: never matches
+    if not _copy_on_write():
+        return None
+    return _Held(series, values.__array_interface__["data"][0])
+
+
+def _copy_on_write():
+    """Whether pandas copies a shared buffer before writing to it: always from
+    pandas 3, behind ``mode.copy_on_write`` in 2.x."""
+    import pandas
+    if int(pandas.__version__.split(".")[0]) >= 3:
+        return True
+    return pandas.options.mode.copy_on_write is True
+
+
+def _polars_column(series):
+    import polars as pl
+    import pyarrow as pa
+    try:
+        exported = pa.chunked_array(series.to_physical() if series.dtype in (pl.Categorical, pl.Enum) else series)
+    except Exception:                             # no Arrow export (Object columns)
+        return _Held(None, object())
+    addresses = tuple(buffer.address if buffer is not None else 0
+                      for chunk in exported.chunks for buffer in chunk.buffers())
+    return _Held(exported, addresses)
+
+
+class _Held:
+    """A token compared by key, holding what keeps the key meaningful alive."""
+
+    __slots__ = ("owner", "key")
+
+    def __init__(self, owner, key):
+        self.owner, self.key = owner, key
+
+    def __eq__(self, other):
+        return isinstance(other, _Held) and self.key == other.key
+
+
+def _same(stored, current):
+    return current is not None and stored == current
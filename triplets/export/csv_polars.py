@@ -33,13 +33,7 @@ def export_to_csv(data, path=None, multivalue=True, export_to_memory=False, sing
     from triplets.tools import polars_engine
 
     def _tableviews(df):
-        td = polars_engine.types_dict(df)
-        views = {}
-        for class_name in td:
-            tv = polars_engine.type_tableview(df, class_name, string_to_number=False, multivalue=multivalue)
-            if tv is not None:
-                views[class_name] = tv
-        return views
+        return polars_engine.triplets_to_tableviews(df, multivalue=multivalue, string_to_number=False)
 
     if single_file:
         if base_filename is None:
@@ -19,10 +19,12 @@ from __future__ import annotations
 import os
 import inspect
 import logging
+import weakref
 from concurrent.futures import ThreadPoolExecutor
-from typing import Union, List, Any, Optional, Sequence
+from typing import Union, List, Any, Callable, Optional, Sequence
 
 from .._registry import EngineRegistry
+from .._engine_detect import flavor, to_arrow, to_pandas
 
 logger = logging.getLogger(__name__)
 
@@ -62,9 +64,19 @@ def get_engine(name: str = "auto"):
 
 
 # Re-exports for compat layer (rdf_parser.py)
-from .utils import find_all_xml, iter_all_xml, clean_ID  # noqa: F401
+from .utils import find_all_xml, iter_all_xml, iter_xml_sources, clean_ID, METADATA_TYPES  # noqa: F401
+from .utils import _iter_sources
 
-from .nquads import read_nquads  # noqa: F401
+from .nquads import read_nquads, read_nquads_batches  # noqa: F401
+from .turtle import read_turtle, read_trig, read_turtle_batches, read_trig_batches  # noqa: F401
+from . import cache as _cache
+from . import processes as _processes
+from . import headers as _headers
+from . import stats as _stats
+from .headers import scan_headers  # noqa: F401
+from .catalog import ModelCatalog  # noqa: F401
+from .ids import IDInterner, default_interner, encode_ids, intern_ids, decode_ids
+from .typed import add_typed_columns, value_kinds
 
 
 def parse(
@@ -76,6 +88,16 @@ def parse(
     categorical_columns: Optional[Sequence[str]] = ("INSTANCE_ID", "KEY"),
     shorten_resources: bool = True,
     string_type: str = "auto",
+    cache_dir: Union[str, os.PathLike, bool, None] = None,
+    types: Optional[Sequence[str]] = None,
+    keys: Optional[Sequence[str]] = None,
+    instances: Optional[Sequence[str]] = None,
+    id_encoding: str = "text",
+    interner: Optional[IDInterner] = None,
+    rdf_map: Union[str, os.PathLike, dict, None] = None,
+    executor: str = "auto",
+    header_filter: Union[dict, Callable, None] = None,
+    statistics: bool = False,
 ) -> Any:
     """Main entry: parse CIM RDF/XML (or zips) using chosen engine.
 
@@ -85,6 +107,17 @@ def parse(
         Enable verbose debug output (file discovery, row counts, timing in some engines, etc.).
         When False but the logger is at DEBUG level (logging.basicConfig(level=logging.DEBUG) or
         getLogger("triplets.parser").setLevel(logging.DEBUG)), debug output is auto-enabled.
+    max_workers : int, optional
+        Parse files concurrently on that many threads. A single file is split
+        instead — on top-level object boundaries, same rows in the same order —
+        when the engine supports it (cython_pugixml_arrow, documents of at
+        least two 16 MB slices).
+    executor : str, default "auto"
+        What parses several files with max_workers: "thread" (a thread pool)
+        or "process" (worker processes, results returned as Arrow IPC in
+        shared memory, not pickled; needs pyarrow). "auto" uses processes for
+        the GIL-bound lxml engines on a multi-CPU machine and threads
+        otherwise (cython_pugixml_arrow releases the GIL). See :mod:`triplets.parser.processes`.
     engine : str, default "auto"
         Parser engine. "auto" picks best available.
         Options: "python_lxml_pandas", "python_lxml_arrow", "cython_pugixml_arrow".
@@ -104,9 +137,192 @@ def parse(
         zero-copy: string_view for polars, utf8 otherwise. Dictionary-encoded
         columns are unaffected (consumers use the indices). Ignored by the
         pandas engine (python_lxml_pandas).
+    cache_dir : str or Path, optional
+        Persistent parse cache (arrow engines): each XML file / zip member is
+        stored as a memory-mapped Arrow IPC file keyed by its content digest,
+        engine and options, and later parses of the same bytes map it instead
+        of parsing. None uses $TRIPLETS_PARSE_CACHE when set; False disables.
+        See :mod:`triplets.parser.cache` (eviction, concurrency).
+    types, keys, instances : sequence of str, optional
+        Parse-time pushdown: keep only objects of these classes (``Type``
+        values, e.g. "ACLineSegment") / with these IDs (``ID`` values), and
+        of their properties only these KEYs ("Type" is always kept). The
+        Distribution / NamespaceMap rows and the FullModel header are kept
+        whole (see ``utils.METADATA_TYPES``). cython_pugixml_arrow drops the
+        rest inside its object loop, before anything is built; the other
+        engines filter each file's result.
+    id_encoding : str, default "text"
+        "uuid16" (arrow engines) stores canonical UUID IDs and reference
+        VALUEs as 16-byte fixed_size_binary columns, with string side
+        columns for everything else — [ID, ID_TEXT, KEY, VALUE, VALUE_UUID,
+        INSTANCE_ID], about half the ID memory. Decode with
+        :func:`decode_ids` before handing the result to the triplet tools or
+        exporters; see :mod:`triplets.parser.ids`.
+        "interned" (arrow engines) stores IDs and reference VALUEs as int64
+        codes of an :class:`IDInterner` — [ID, KEY, VALUE, VALUE_ID,
+        INSTANCE_ID] — so datasets sharing the interner join on integers.
+    interner : IDInterner, optional
+        The interner for id_encoding="interned"; None uses the process-wide
+        :func:`default_interner`. Decode with ``decode_ids(result, interner)``.
+    rdf_map : dict or path, optional
+        Export schema (arrow engines) whose ``xsd:type`` types the values:
+        adds VALUE_NUM (float64 — numbers, 1.0 / 0.0 for booleans, else
+        null) and VALUE_ENUM (dictionary-encoded Enumeration values, else
+        null) after the triplet columns. VALUE stays complete (the
+        tableviews pivot it and use the sidecars with string_to_number to
+        pick numeric and Enumeration columns). See
+        :mod:`triplets.parser.typed`.
+    header_filter : dict or callable, optional
+        Parse only the files whose model header matches, e.g.
+        ``{"profile": ["EQ", "SSH"], "scenarioTime": ("20240101T0000Z",
+        "20240101T2359Z")}`` or a callable on the header row. Each file's
+        header is read first (:func:`scan_headers` — only the header bytes,
+        zip members inflated no further) and the others are skipped before
+        they are loaded. See :func:`triplets.parser.headers.matches`.
+    statistics : bool, default False
+        Count rows per INSTANCE_ID / KEY and digest each file's batch while
+        parsing (arrow engines), so ``types_dict`` and the SPARQL / SHACL
+        cache keys of the unmodified result need no pass over the data.
+        Opt-in: the counts and digest cost about 15% of a cython_pugixml_arrow
+        parse, worth it when the result is queried repeatedly. See
+        :mod:`triplets.parser.stats`.
+
+    The result remembers which source each INSTANCE_ID came from, with a
+    cheap change fingerprint, so :func:`reparse` can refresh it later.
     """
+    return _parse(list_of_paths_to_zip_globalzip_xml, None, debug=debug, max_workers=max_workers,
+                  engine=engine, return_type=return_type, categorical_columns=categorical_columns,
+                  shorten_resources=shorten_resources, string_type=string_type, cache_dir=cache_dir,
+                  types=types, keys=keys, instances=instances, id_encoding=id_encoding, interner=interner,
+                  rdf_map=rdf_map, executor=executor, header_filter=header_filter, statistics=statistics)
+
+
+def reparse(previous: Any, list_of_paths_to_zip_globalzip_xml: Union[str, List, Any],
+            return_type: Optional[str] = None, verify: bool = False, **kwargs: Any) -> Any:
+    """Refresh a :func:`parse` result after some of its input files changed.
+
+    Every input is matched to ``previous`` by source (absolute path, or
+    ``archive.zip!member.xml``) and change fingerprint, recorded at parse
+    time: file size + mtime for paths, the zip directory's CRC-32 + size for
+    members — neither reads the content. Unchanged sources keep their
+    existing rows and INSTANCE_IDs (without re-parsing or even
+    decompressing them); rows of removed or changed sources are dropped and
+    only the changed / new ones are parsed. Kept rows come first, then the
+    newly parsed files in input order; the combined result goes through the
+    same finalize (dictionary encoding, string layout) as a fresh parse.
+
+    ``previous`` must be the object parse()/reparse() returned (fingerprints
+    are remembered per object identity, like the content hashes of the
+    SPARQL engine caches). ``return_type`` defaults to the flavor of
+    ``previous``, and every other option (engine, categorical_columns,
+    string_type, ID encoding and interner, rdf_map, pushdown, ...) to the
+    one it was parsed with; keyword arguments, those of :func:`parse`,
+    override them. File-like inputs carry no fingerprint and are always
+    re-parsed.
+
+    The fingerprint misses a rewrite that keeps the size within the mtime
+    resolution (or a CRC-32 collision). ``verify=True`` also reads every
+    source whose fingerprint matches and compares its content digest (the
+    parse cache key, :func:`triplets.parser.cache.document_key`) with the
+    one recorded for it. Digests are recorded whenever they are computed —
+    by a parse with a parse cache, or by ``reparse(..., verify=True)`` — and
+    a source recorded without one is re-parsed.
+    """
+    entry = _SOURCES.get(id(previous))
+    if entry is None or entry[0]() is not previous:
+        raise ValueError("reparse needs the object returned by parse()/reparse() "
+                         "(its per-file fingerprints are recorded by object identity)")
+    if return_type is None:
+        return_type = {"polars": "polars", "pyarrow": "arrow"}.get(flavor(previous), "pandas")
+    options = dict(entry[2])
+    unknown = set(kwargs) - set(options)
+    if unknown:
+        raise TypeError(f"reparse() got unexpected keyword arguments: {', '.join(sorted(unknown))}")
+    options.update(kwargs)
+    if options["id_encoding"] != "interned" and "interner" not in kwargs:
+        options["interner"] = None   # the recorded one belongs to the interned layout
+    return _parse(list_of_paths_to_zip_globalzip_xml, (previous, entry[1]), return_type=return_type,
+                  verify=verify, **options)
+
+
+# id(result) → (weakref.ref with evict callback, source manifest, options):
+# which source / fingerprint (and content digest, when one was computed) each
+# INSTANCE_ID of a parse() result came from,
+# and the parse() keyword arguments (all but return_type) reparse() carries
+# over — including the IDInterner its codes belong to (id_encoding="interned").
+_SOURCES = {}
+
+
+def _record_sources(result, manifest, options):
+    oid = id(result)
+    _SOURCES[oid] = (weakref.ref(result, lambda _: _SOURCES.pop(oid, None)), manifest, options)
+    return result
+
+
+def _instance_id(result):
+    """INSTANCE_ID of one engine result (one file → one instance)."""
+    values = result["INSTANCE_ID"]
+    if not len(values):
+        return None
+    first = values[0]
+    return first.as_py() if hasattr(first, "as_py") else first
+
+
+def _kept_rows(previous, instance_ids, is_arrow_engine, schema, categorical_columns, interner=None):
+    """Rows of ``previous`` belonging to instance_ids, shaped like fresh engine
+    results: RecordBatches matching ``schema`` (the categorical_columns
+    dictionary-encoded, the rest plain utf8 when None) for arrow engines, a
+    DataFrame of plain string columns for the pandas engine.
+
+    Arrow rows are selected on the INSTANCE_ID dictionary indices and keep
+    their dictionaries (_finalize_arrow remaps them); only the kept rows are
+    decoded (uuid16 / interned) or cast to another layout."""
+    if not is_arrow_engine:
+        frame = to_pandas(previous, plain=True)
+        frame = frame[frame["INSTANCE_ID"].isin(instance_ids)].reset_index(drop=True)
+        return [frame.astype({name: dtype.categories.dtype for name, dtype in frame.dtypes.items()
+                              if dtype == "category"})]
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    table = to_arrow(previous)
+    if isinstance(table, pa.RecordBatch):
+        table = pa.Table.from_batches([table])
+    value_set = pa.array(list(instance_ids), pa.string())
+    masks = []
+    for chunk in table["INSTANCE_ID"].chunks:
+        if pa.types.is_dictionary(chunk.type):   # one lookup per dictionary entry, a gather per row
+            masks.append(pc.is_in(chunk.dictionary.cast(pa.string()), value_set=value_set).take(chunk.indices))
+        else:
+            masks.append(pc.is_in(chunk.cast(pa.string()), value_set=value_set))
+    table = decode_ids(table.filter(pa.chunked_array(masks, pa.bool_())), interner)
+    columns = []
+    for name in ("ID", "KEY", "VALUE", "INSTANCE_ID"):
+        column = table[name]
+        if schema is not None:
+            target = schema.field(name).type
+        else:
+            target = pa.dictionary(pa.int32(), pa.string()) if name in (categorical_columns or ()) else pa.string()
+        if pa.types.is_dictionary(target):
+            if not pa.types.is_dictionary(column.type):
+                column = pc.dictionary_encode(column)
+        elif column.type != target:
+            column = column.cast(target)
+        columns.append(column)
+    return pa.table(columns, names=["ID", "KEY", "VALUE", "INSTANCE_ID"]).to_batches()
+
+
+def _parse(list_of_paths_to_zip_globalzip_xml, previous, *, debug, max_workers, engine, return_type,
+           categorical_columns, shorten_resources, string_type, cache_dir, types, keys, instances,
+           id_encoding, interner, rdf_map, executor, header_filter, statistics, verify=False):
+    """parse() body; previous = (result, source manifest) when refreshing (reparse),
+    verify = compare content digests of sources whose fingerprint matches."""
+    options = dict(debug=debug, max_workers=max_workers, engine=engine, categorical_columns=categorical_columns,
+                   shorten_resources=shorten_resources, string_type=string_type, cache_dir=cache_dir, types=types,
+                   keys=keys, instances=instances, id_encoding=id_encoding, interner=interner, rdf_map=rdf_map,
+                   executor=executor, header_filter=header_filter, statistics=statistics)
     debug = debug or logger.isEnabledFor(logging.DEBUG)
     engine_name, engine_mod = get_engine(engine)
+    options["engine"] = engine_name   # a reparse keeps the engine "auto" resolved to
     is_arrow_engine = engine_name in _ARROW_ENGINES
     string_type = _resolve_string_type(string_type, return_type)
 
@@ -120,6 +336,35 @@ def parse(
     # Engines that build the requested layout natively take string_type; the
     # rest are cast once at finalize (one pass over the combined table).
     native_string_type = "string_type" in inspect.signature(parse_one).parameters
+    # Engines that can split one document across threads take max_workers —
+    # used for a single input file (several files parallelize per file).
+    native_split = "max_workers" in inspect.signature(parse_one).parameters
+    # Engines that filter inside their object loop take types/keys/instances;
+    # the rest get each file's result filtered after the parse.
+    pushdown = _pushdown_options(types, keys, instances)
+    executor = _processes.resolve_executor(executor, engine_name)
+
+    cache = _cache.resolve_cache_dir(cache_dir)
+    if id_encoding not in ("text", "uuid16", "interned"):
+        raise ValueError(f"id_encoding must be 'text', 'uuid16' or 'interned', got {id_encoding!r}")
+    if id_encoding != "text" and not is_arrow_engine:
+        raise ValueError(f"id_encoding={id_encoding!r} requires an arrow parser engine, got {engine_name!r}")
+    if id_encoding == "interned":
+        interner = options["interner"] = default_interner() if interner is None else interner
+    elif interner is not None:
+        raise ValueError("interner applies to id_encoding='interned' only")
+    if rdf_map is not None and not is_arrow_engine:
+        raise ValueError(f"rdf_map requires an arrow parser engine, got {engine_name!r}")
+    kinds = value_kinds(rdf_map) if rdf_map is not None else None
+    if cache is not None and not is_arrow_engine:
+        if cache_dir is not None:
+            raise ValueError(f"cache_dir requires an arrow parser engine, got {engine_name!r}")
+        cache = None   # $TRIPLETS_PARSE_CACHE applies to arrow engines only
+    # Everything besides the document bytes that shapes the parsed batch
+    cache_salt = (f"{engine_name}|{string_type if native_string_type else ''}|{shorten_resources}|"
+                  f"{sorted(pushdown.items())}").encode()
+    stored = []
+    digests = {}   # load → document key, when computed (cache or verify); recorded in the manifest
 
     # Normalize input to list for find_all_xml
     if (isinstance(list_of_paths_to_zip_globalzip_xml, (str, bytes, os.PathLike))
@@ -128,31 +373,129 @@ def parse(
     else:
         items = list(list_of_paths_to_zip_globalzip_xml) if list_of_paths_to_zip_globalzip_xml else []
 
-    xml_files = find_all_xml(items, debug=debug)
-
-    if not xml_files:
-        return _empty(return_type, categorical_columns, string_type)
-
-    def _one(f: Any):
+    # Unchanged sources of a previous result are kept, not loaded
+    unchanged = {entry["source"]: entry for entry in previous[1]} if previous else {}
+    kept, sources, loads = [], [], []
+    for source, fingerprint, load, head in _iter_sources(items, debug=debug):
+        if header_filter is not None and not _headers.matches(_headers._scan_one(source, fingerprint, head),
+                                                              header_filter):
+            if debug:
+                logger.debug("header_filter skipped %s", source)
+            continue
+        old = unchanged.pop(source, None)
+        if old is not None and fingerprint is not None and old["fingerprint"] == fingerprint:
+            if not verify:
+                kept.append(old)
+                continue
+            f = load()
+            key = None if f is None else _cache.document_key(f, cache_salt)
+            if key is not None and key == old.get("digest"):
+                kept.append(old)
+                continue
+            origin = getattr(load, "origin", None)
+            load = lambda f=f: f   # loaded and hashed already
+            if origin is not None:
+                load.origin = origin
+            digests[load] = key
+        sources.append((source, fingerprint))
+        loads.append(load)
+    if debug and previous:
+        logger.debug("reparse: %d sources kept, %d parsed", len(kept), len(loads))
+
+    if not loads and not kept:
+        return _record_sources(_empty(return_type, categorical_columns, string_type, id_encoding, interner,
+                                      kinds is not None), [], options)
+
+    # Several GIL-bound files: parse in worker processes, the rest stays on threads
+    processes = (_processes.ProcessParser(max_workers)
+                 if max_workers and len(loads) > 1 and executor == "process" else None)
+
+    def _parse_one(f: Any, origin: Any = None):
         one_kwargs = {"string_type": string_type} if native_string_type else {}
         if not shorten_resources:
             one_kwargs["shorten_resources"] = False
-        return parse_one(f, debug=debug, **one_kwargs)
-
-    if max_workers and len(xml_files) > 1:
-        with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            results = list(ex.map(_one, xml_files))
+        if max_workers and native_split and len(loads) == 1:
+            one_kwargs["max_workers"] = max_workers
+        if processes is not None:
+            return processes.parse(engine_name, f if origin is None else origin, debug, one_kwargs, pushdown)
+        return _load_one(engine_mod, f, debug, one_kwargs, pushdown)
+
+    def _one(load):
+        # a worker process reads zip members / compressed files on disk itself (from their origin)
+        origin = getattr(load, "origin", None) if processes is not None else None
+        if origin is not None and cache is None and not verify:
+            batch = _parse_one(None, origin)   # nothing to hash: not even loaded here
+            if batch is None:
+                return None
+        else:
+            f = load()   # on the worker: zip members decompress in parallel
+            if f is None:
+                return None
+            key = digests.get(load)
+            if key is None and (cache is not None or verify):
+                key = digests[load] = _cache.document_key(f, cache_salt)
+            batch = _parse_one(f, origin) if cache is None else _cached(f, key, origin)
+        if not is_arrow_engine:
+            return batch
+        # Statistics and per-file encoding also run on the workers; _finalize_arrow only merges
+        counted = _stats.read(batch) or _stats.batch_statistics(batch) if statistics else None
+        batch = _typed(_encode_categorical(batch, categorical_columns))
+        return batch if counted is None else _stats.attach(batch, counted)
+
+    def _typed(batch):
+        return batch if kinds is None else add_typed_columns(batch, kinds)
+
+    def _cached(f: Any, key: str, origin: Any):
+        batch = _cache.load(cache, key)
+        hit = batch is not None
+        if hit:
+            batch = _cache.relabel(batch, f)   # the key is the bytes; IDs and file name are this source's
+        else:
+            batch = _parse_one(f, origin)
+            if statistics:
+                batch = _stats.attach(batch, _stats.batch_statistics(batch))   # a cache hit reuses them
+            _cache.store(cache, key, batch)
+            stored.append(key)
+        if debug:
+            logger.debug("Parse cache %s: %s", "hit" if hit else "miss", getattr(f, "name", f))
+        return batch
+
+    if max_workers and len(loads) > 1:
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                results = list(ex.map(_one, loads))
+        finally:
+            if processes is not None:
+                processes.close()
     else:
-        results = [_one(f) for f in xml_files]
+        results = [_one(load) for load in loads]
+
+    if stored:
+        _cache.prune(cache)
+    parsed = [(source, load, result) for source, load, result in zip(sources, loads, results)
+              if result is not None]   # unreadable zip members drop out
+    results = [result for _, _, result in parsed]
+
+    manifest = kept + [{"source": source, "fingerprint": fingerprint, "instance_id": _instance_id(result),
+                        "digest": digests.get(load)}
+                       for (source, fingerprint), load, result in parsed]
+    if kept:
+        schema = results[0].schema if results and is_arrow_engine else None
+        kept_rows = _kept_rows(previous[0], {entry["instance_id"] for entry in kept},
+                               is_arrow_engine, schema, categorical_columns, interner)
+        results = [_typed(batch) for batch in kept_rows] if is_arrow_engine else kept_rows
+        results += [result for _, _, result in parsed]
 
     if not results:
         # Fallback empty after file list processing (should be rare; engines return DataFrames/Batches)
-        return _empty(return_type, categorical_columns, string_type)
+        return _record_sources(_empty(return_type, categorical_columns, string_type, id_encoding, interner,
+                                      kinds is not None), [], options)
 
     if is_arrow_engine:
-        return _finalize_arrow(results, return_type, categorical_columns, debug, string_type)
+        result = _finalize_arrow(results, return_type, string_type, id_encoding, interner, statistics)
     else:
-        return _finalize_pandas(results, return_type, categorical_columns, debug)
+        result = _finalize_pandas(results, return_type, categorical_columns, debug)
+    return _record_sources(result, manifest, options)
 
 
 def parse_batches(
@@ -161,6 +504,11 @@ def parse_batches(
     engine: str = "auto",
     shorten_resources: bool = True,
     max_workers: Optional[int] = None,
+    batch_rows: Optional[int] = None,
+    types: Optional[Sequence[str]] = None,
+    keys: Optional[Sequence[str]] = None,
+    instances: Optional[Sequence[str]] = None,
+    categorical_columns: Optional[Sequence[str]] = None,
 ) -> Any:
     """Parse CIM RDF/XML lazily into a ``pyarrow.RecordBatchReader``.
 
@@ -174,7 +522,27 @@ def parse_batches(
     ``max_workers`` parses up to that many files ahead on a thread pool — a
     bounded, in-order prefetch: multi-file ingest parallelizes while memory
     stays bounded by max_workers+1 batches (None = fully sequential, one
-    batch alive at a time). Batch order always follows file order.
+    batch alive at a time). Zip members are decompressed on the same workers,
+    inside the window. Batch order always follows file order.
+
+    ``batch_rows`` streams each file in batches of at most that many rows
+    instead of one batch per file. The engine then never builds the whole
+    document: the cython engine scans the buffer in object-aligned windows,
+    python_lxml_arrow parses incrementally and clears each object, so memory
+    per file is bounded by about two batches regardless of the file size
+    (engines without iter_rdf_batches parse the file whole and slice it). The rows and
+    their order are the same as without it. Files stream one after another,
+    so batch_rows does not combine with ``max_workers``.
+
+    ``types`` / ``keys`` / ``instances`` push a filter into the parse, as
+    for :func:`parse`.
+
+    ``categorical_columns`` (e.g. ``("INSTANCE_ID", "KEY")``) emits those
+    columns as ``dictionary<int32, utf8>`` with one dictionary shared by the
+    whole stream: each batch's dictionary extends the previous one (new
+    values are appended, codes never change), so the schema is stable and
+    an IPC writer with ``emit_dictionary_deltas=True`` sends only the new
+    entries. The cython engine's KEY dictionary is remapped, not rebuilt.
 
     Requires an arrow parser engine ("auto" resolves one whenever pyarrow is
     installed); raises ValueError otherwise — no silent pandas fallback.
@@ -189,34 +557,209 @@ def parse_batches(
     if not shorten_resources and engine_name == "cython_pugixml_arrow":
         raise ValueError("shorten_resources=False is not supported by the cython_pugixml_arrow engine, "
                          "use engine='python_lxml_arrow'")
+    if batch_rows is not None and (batch_rows < 1 or max_workers):
+        raise ValueError("batch_rows must be a positive integer and cannot be combined with max_workers")
     parse_one = engine_mod.load_rdf_to_dataframe
 
-    schema = pa.schema([(c, pa.string()) for c in ("ID", "KEY", "VALUE", "INSTANCE_ID")])
+    columns = ("ID", "KEY", "VALUE", "INSTANCE_ID")
+    categorical_columns = tuple(categorical_columns or ())
+    if not set(categorical_columns) <= set(columns):
+        raise ValueError(f"categorical_columns must be among {columns}, got {categorical_columns!r}")
+    schema = pa.schema([(c, pa.dictionary(pa.int32(), pa.string()) if c in categorical_columns else pa.string())
+                        for c in columns])
+    unifiers = {c: _DictionaryUnifier() for c in categorical_columns}
     one_kwargs = {} if shorten_resources else {"shorten_resources": False}
-
-    def one(xml_file):
-        batch = parse_one(xml_file, debug=debug, **one_kwargs)
-        return batch if batch.schema == schema else batch.cast(schema)
+    pushdown = _pushdown_options(types, keys, instances)
+    native_pushdown = "types" in inspect.signature(parse_one).parameters
+
+    def parse_file(xml_file):
+        if native_pushdown:
+            return parse_one(xml_file, debug=debug, **one_kwargs, **pushdown)
+        return _filter_objects(parse_one(xml_file, debug=debug, **one_kwargs), **pushdown)
+
+    def conform(batch):
+        if not unifiers:
+            return batch if batch.schema == schema else batch.cast(schema)
+        arrays = [unifiers[c].encode(batch.column(c)) if c in unifiers
+                  else batch.column(c).cast(pa.string()) for c in columns]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def one(xml_file):   # on the workers; shared dictionaries are built in file order by conform()
+        batch = parse_file(xml_file)
+        return batch if unifiers else conform(batch)
+
+    def loaded(load):
+        xml_file = load()   # on the worker: zip members decompress in parallel
+        return None if xml_file is None else one(xml_file)
+
+    def streamed(xml_file):
+        if hasattr(engine_mod, "iter_rdf_batches"):
+            parts = engine_mod.iter_rdf_batches(xml_file, batch_rows, debug=debug, **one_kwargs, **pushdown)
+        else:
+            whole = parse_file(xml_file)
+            parts = (whole.slice(offset, batch_rows) for offset in range(0, whole.num_rows, batch_rows))
+        for batch in parts:
+            yield conform(batch)
 
     def batches():
         xml_files = iter_all_xml(list_of_paths_to_zip_globalzip_xml, debug=debug)
+        if batch_rows:
+            for xml_file in xml_files:
+                yield from streamed(xml_file)
+            return
         if not max_workers:
             for xml_file in xml_files:
-                yield one(xml_file)
+                yield conform(one(xml_file))
             return
         from collections import deque
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             window = deque()
-            for xml_file in xml_files:
-                window.append(pool.submit(one, xml_file))
+            for _, _, load in iter_xml_sources(list_of_paths_to_zip_globalzip_xml, debug=debug):
+                window.append(pool.submit(loaded, load))
                 if len(window) > max_workers:
-                    yield window.popleft().result()
+                    batch = window.popleft().result()
+                    if batch is not None:
+                        yield conform(batch)   # in file order: dictionary codes are deterministic
             while window:
-                yield window.popleft().result()
+                batch = window.popleft().result()
+                if batch is not None:
+                    yield conform(batch)
 
     return pa.RecordBatchReader.from_batches(schema, batches())
 
 
+def _encode_categorical(batch, categorical_columns):
+    """batch with its plain categorical columns dictionary-encoded (per file)."""
+    import pyarrow as pa
+    for name in categorical_columns or ():
+        index = batch.schema.get_field_index(name)
+        if index >= 0 and not pa.types.is_dictionary(batch.schema.field(index).type):
+            batch = batch.set_column(index, name, batch.column(index).dictionary_encode())
+    return batch
+
+
+class _DictionaryUnifier:
+    """One growing dictionary for a column across a stream of batches.
+
+    encode() maps a batch column (plain or dictionary-encoded, any string
+    layout) onto the shared dictionary: values not seen before are appended,
+    so every returned array's dictionary is a prefix-extension of the last
+    one (Arrow delta dictionaries) and earlier codes stay valid. A value →
+    code memo looks up only each batch's local dictionary, and the
+    dictionary's offsets / data grow in over-allocated buffers that earlier
+    arrays keep viewing a prefix of, so a batch costs its own size, not that
+    of everything seen so far.
+    """
+
+    def __init__(self):
+        import numpy
+        import pyarrow as pa
+        self.dictionary = pa.array([], pa.string())
+        self._codes = {}
+        self._offsets = numpy.zeros(1024, numpy.int32)
+        self._data = numpy.zeros(1 << 16, numpy.uint8)
+
+    def encode(self, column):
+        import numpy
+        import pyarrow as pa
+        if not pa.types.is_dictionary(column.type):
+            column = column.dictionary_encode()
+        local = column.dictionary.cast(pa.string())
+        values = local.to_pylist()
+        new = [value for value in dict.fromkeys(values) if value is not None and value not in self._codes]
+        if new:
+            self._append(pa.array(new, pa.string()))
+            self._codes.update(zip(new, range(len(self._codes), len(self._codes) + len(new))))
+        positions = numpy.fromiter((-1 if value is None else self._codes[value] for value in values),
+                                   numpy.int32, len(values))
+        if numpy.array_equal(positions, numpy.arange(len(values))):   # same codes: keep the indices
+            indices = column.indices
+        else:
+            indices = pa.array(positions, mask=positions < 0).take(column.indices)
+        return pa.DictionaryArray.from_arrays(indices.cast(pa.int32()), self.dictionary, safe=False)
+
+    def _append(self, new):
+        """Add the strings of new (no nulls) to the dictionary."""
+        import numpy
+        import pyarrow as pa
+        count, size = len(self.dictionary), int(self._offsets[len(self.dictionary)])
+        offsets = numpy.frombuffer(new.buffers()[1], numpy.int32, len(new) + 1)
+        data = new.buffers()[2]
+        added = int(offsets[-1])
+        self._offsets = _grown(self._offsets, count + len(new) + 1)
+        self._data = _grown(self._data, size + added)
+        self._offsets[count + 1:count + len(new) + 1] = offsets[1:] + size
+        if added:
+            self._data[size:size + added] = numpy.frombuffer(data, numpy.uint8, added)
+        count += len(new)
+        self.dictionary = pa.StringArray.from_buffers(count, pa.py_buffer(self._offsets[:count + 1]),
+                                                      pa.py_buffer(self._data[:size + added]))
+
+
+def _grown(buffer, length):
+    """buffer, or a copy twice as large (or more) when length does not fit:
+    arrays already built on it keep the old one."""
+    import numpy
+    if length <= len(buffer):
+        return buffer
+    grown = numpy.zeros(max(length, 2 * len(buffer)), buffer.dtype)
+    grown[:len(buffer)] = buffer
+    return grown
+
+
+def _load_one(engine_mod, f, debug, one_kwargs, pushdown):
+    """One engine call for one file, pushdown applied (natively or after)."""
+    parse_one = engine_mod.load_rdf_to_dataframe
+    if "types" in inspect.signature(parse_one).parameters:
+        return parse_one(f, debug=debug, **one_kwargs, **pushdown)
+    return _filter_objects(parse_one(f, debug=debug, **one_kwargs), **pushdown)
+
+
+def _pushdown_options(types, keys, instances):
+    """types/keys/instances → engine kwargs (lists; a lone str is one value)."""
+    options = {}
+    for name, values in (("types", types), ("keys", keys), ("instances", instances)):
+        if values is not None:
+            options[name] = [values] if isinstance(values, str) else list(values)
+    return options
+
+
+def _filter_objects(result, types=None, keys=None, instances=None):
+    """One file's engine result (DataFrame or RecordBatch) reduced to the
+    pushdown selection — the same rows cython_pugixml_arrow emits natively."""
+    if types is None and keys is None and instances is None:
+        return result
+    if flavor(result) == "pyarrow":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        def isin(column, values):
+            if not isinstance(values, pa.Array):
+                values = pa.array(values, pa.string())
+            return pc.is_in(column, value_set=values)
+        ids, key_column = result["ID"], result["KEY"]
+        type_rows = pc.equal(key_column, "Type")
+        type_ids, type_values = ids.filter(type_rows), result["VALUE"].filter(type_rows)
+        header_ids = type_ids.filter(isin(type_values, METADATA_TYPES))
+        selected = type_ids.filter(isin(type_values, types)) if types is not None else type_ids
+        if instances is not None:
+            selected = selected.filter(isin(selected, instances))
+        mask = isin(ids, selected)
+        if keys is not None:
+            mask = pc.and_(mask, pc.or_(type_rows, isin(key_column, keys)))
+        return result.filter(pc.or_(mask, isin(ids, header_ids)))
+    type_rows = result["KEY"] == "Type"
+    types_by_id = result.loc[type_rows, ["ID", "VALUE"]]
+    header_ids = types_by_id.loc[types_by_id["VALUE"].isin(METADATA_TYPES), "ID"]
+    if types is not None:
+        types_by_id = types_by_id[types_by_id["VALUE"].isin(types)]
+    if instances is not None:
+        types_by_id = types_by_id[types_by_id["ID"].isin(instances)]
+    mask = result["ID"].isin(types_by_id["ID"])
+    if keys is not None:
+        mask &= type_rows | result["KEY"].isin(keys)
+    return result[mask | result["ID"].isin(header_ids)].reset_index(drop=True)
+
+
 _STRING_TYPES = ("utf8", "large_utf8", "string_view")
 
 
@@ -244,7 +787,8 @@ def _string_target(string_type):
             "string_view": pa.string_view()}[string_type]
 
 
-def _empty(return_type, categorical_columns=(), string_type="utf8"):
+def _empty(return_type, categorical_columns=(), string_type="utf8", id_encoding="text", interner=None,
+           typed=False):
     """Empty result with the standard triplet columns, matching the non-empty schema.
 
     Arrow/polars empties carry the same string / dictionary-encoded columns as a
@@ -258,29 +802,49 @@ def _empty(return_type, categorical_columns=(), string_type="utf8"):
     target = _string_target(string_type)
     schema = pa.schema([(c, pa.dictionary(pa.int32(), pa.string()) if c in cats else target)
                         for c in ("ID", "KEY", "VALUE", "INSTANCE_ID")])
+    if typed:
+        schema = schema.append(pa.field("VALUE_NUM", pa.float64())).append(
+            pa.field("VALUE_ENUM", pa.dictionary(pa.int32(), pa.string())))
     table = schema.empty_table()
+    if id_encoding != "text":
+        table = encode_ids(table) if id_encoding == "uuid16" else intern_ids(table, interner)
+        table = table.cast(pa.schema([f.with_type(target) if f.type == pa.string() else f for f in table.schema]))
     if return_type == "polars":
         import polars as pl
         return pl.from_arrow(table)
     return table
 
 
-def _finalize_arrow(batches, return_type, categorical_columns, debug, string_type="utf8"):
-    """Combine Arrow RecordBatches, dictionary-encode, and convert to return_type."""
+def _finalize_arrow(batches, return_type, string_type="utf8", id_encoding="text", interner=None, statistics=False):
+    """Combine Arrow RecordBatches, unify their dictionaries, and convert to return_type
+    (with the merged parse-time statistics when statistics)."""
     import pyarrow as pa
 
-    table = pa.Table.from_batches(batches)
-
-    # Dictionary-encode repetitive columns
-    if categorical_columns:
-        for col_name in categorical_columns:
-            if col_name in table.column_names:
-                try:
-                    dict_arr = pa.compute.dictionary_encode(table[col_name])
-                    table = table.set_column(table.schema.get_field_index(col_name), col_name, dict_arr)
-                except Exception as e:
-                    if debug:
-                        logger.debug("Could not dictionary-encode %s: %s", col_name, e)
+    # One dictionary per encoded column for the whole table: the per-file
+    # dictionaries (built by the engine or by _encode_categorical on the parse
+    # workers) are merged and their indices remapped — no re-encode pass
+    # over the concatenated rows, and every chunk shares the final dictionary
+    schema = batches[0].schema
+    columns = []
+    for field in schema:
+        chunks = [batch.column(field.name) for batch in batches]
+        if pa.types.is_dictionary(field.type):
+            unifier = _DictionaryUnifier()
+            chunks = [unifier.encode(chunk).indices for chunk in chunks]
+            chunks = [pa.DictionaryArray.from_arrays(indices, unifier.dictionary, safe=False) for indices in chunks]
+        columns.append(pa.chunked_array(chunks))
+    table = pa.Table.from_arrays(columns, names=schema.names)
+    counted = None
+    if statistics:
+        # Per-file statistics (rows kept by reparse have none yet) → the table's
+        counted = _stats.merge([_stats.read(batch) or _stats.batch_statistics(batch) for batch in batches],
+                               f"{string_type}|{id_encoding}".encode())
+        if id_encoding == "interned":
+            counted["digest"] = None   # codes depend on the interner's state, not on the batches alone
+    if id_encoding == "uuid16":
+        table = encode_ids(table)
+    elif id_encoding == "interned":
+        table = intern_ids(table, interner)
 
     # Cast plain string columns to the requested layout (no-op when the engine
     # already built it natively; one pass for engines that emit utf8 only)
@@ -291,19 +855,23 @@ def _finalize_arrow(batches, return_type, categorical_columns, debug, string_typ
         if field_type in string_family and field_type != target:
             index = table.schema.get_field_index(col_name)
             table = table.set_column(index, col_name, table[col_name].cast(target))
+    if counted is not None:
+        table = _stats.attach(table, counted)
 
     if return_type == "pandas":
         import pandas as pd
         try:
-            return table.to_pandas(types_mapper=pd.ArrowDtype)  # zero-copy, Arrow-backed dtypes
+            result = table.to_pandas(types_mapper=pd.ArrowDtype)  # zero-copy, Arrow-backed dtypes
         except Exception:
-            return table.to_pandas()
-    if return_type == "arrow":
-        return table
-    if return_type == "polars":
+            result = table.to_pandas()
+    elif return_type == "arrow":
+        result = table
+    elif return_type == "polars":
         import polars as pl
-        return pl.from_arrow(table)
-    raise ValueError(f"Unknown return_type: {return_type}")
+        result = pl.from_arrow(table)
+    else:
+        raise ValueError(f"Unknown return_type: {return_type}")
+    return result if counted is None else _stats.remember(result, counted)
 
 
 def _finalize_pandas(dataframes, return_type, categorical_columns, debug):
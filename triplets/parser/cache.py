@@ -0,0 +1,240 @@
+"""Persistent parse cache — one Arrow IPC file per parsed XML document.
+
+``parse(..., cache_dir=...)`` (or ``$TRIPLETS_PARSE_CACHE``) stores each
+parsed XML file / zip member as ``<digest>.arrow`` in the cache directory.
+The digest covers the document bytes plus everything that shapes the parsed
+batch: engine, string layout (for engines that build it natively),
+shorten_resources and a format-version salt — bump _SALT whenever engine
+output changes. A hit memory-maps the IPC file instead of parsing, so the
+batch is zero-copy and flows through _finalize_arrow like a fresh parse.
+
+The key covers the bytes only, so identical files under different names
+share an entry. relabel() turns a hit into what parsing the current source
+would return: a fresh INSTANCE_ID, fresh Distribution / NamespaceMap IDs,
+the source's name as the Distribution label and, where it defaulted to the
+file path, a matching xml_base.
+
+Entries are published atomically (written to a private temp file, then
+renamed into place), so concurrent jobs sharing a directory never see a
+half-written file. Every hit touches the entry's mtime; prune() evicts
+entries older than max_age and then the least recently used ones until the
+directory fits max_bytes. parse() prunes after each call that stored new
+entries, with limits from $TRIPLETS_PARSE_CACHE_MAX_BYTES (default 10 GiB)
+and $TRIPLETS_PARSE_CACHE_MAX_AGE_DAYS (default 30).
+"""
+import os
+import time
+import uuid
+import hashlib
+import logging
+import tempfile
+
+from io import BytesIO
+
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SALT = b"triplets-parse-1"
+_SUFFIX = ".arrow"
+_HASH_BLOCK = 16 << 20
+_META_TYPES = ("Distribution", "NamespaceMap")   # per-parse objects with random IDs
+_META_HEAD = 4096   # rows searched for them before falling back to the whole batch
+
+
+def resolve_cache_dir(cache_dir):
+    """cache_dir argument → directory Path, or None when caching is off.
+    None falls back to $TRIPLETS_PARSE_CACHE; False disables it."""
+    if cache_dir is False:
+        return None
+    if cache_dir is None:
+        cache_dir = os.environ.get("TRIPLETS_PARSE_CACHE") or None
+    return Path(cache_dir) if cache_dir is not None else None
+
+
+def document_key(source, salt):
+    """Digest of one document (str path or file-like) mixed with the salt."""
+    digest = hashlib.sha256(_SALT + salt)
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            while block := file.read(_HASH_BLOCK):
+                digest.update(block)
+    elif isinstance(source, BytesIO):   # getvalue() shares the bytes; getbuffer() may copy them
+        digest.update(source.getvalue())
+    elif hasattr(source, "getbuffer"):   # zip members — hash in place
+        digest.update(source.getbuffer())
+    else:
+        source.seek(0)
+        content = source.read()
+        digest.update(content.encode("utf-8") if isinstance(content, str) else content)
+        source.seek(0)
+    return digest.hexdigest()[:32]
+
+
+def load(cache_dir, key):
+    """The cached RecordBatch for key (memory-mapped), or None on a miss."""
+    import pyarrow as pa
+    path = cache_dir / f"{key}{_SUFFIX}"
+    try:
+        batch = pa.ipc.open_file(pa.memory_map(str(path))).get_batch(0)
+    except (FileNotFoundError, pa.ArrowInvalid, OSError) as error:
+        if not isinstance(error, FileNotFoundError):
+            logger.warning("Ignoring unreadable parse cache entry %s: %s", path, error)
+        return None
+    try:
+        os.utime(path)   # recency for prune()
+    except OSError:
+        pass
+    return batch
+
+
+def store(cache_dir, key, batch):
+    """Publish batch under key (atomic rename; concurrent writers are harmless)."""
+    import pyarrow as pa
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=cache_dir)
+    try:
+        with os.fdopen(descriptor, "wb") as file, pa.ipc.new_file(file, batch.schema) as writer:
+            writer.write_batch(batch)
+        os.replace(temp_path, cache_dir / f"{key}{_SUFFIX}")
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def relabel(batch, source):
+    """A cached batch as parsing source would return it: new INSTANCE_ID and
+    meta-object IDs, source's name as the Distribution label and in an
+    xml_base derived from the stored label (an explicit xml:base elsewhere is
+    kept). A source without a name keeps the stored label.
+
+    Both engines emit the meta objects first, so only that leading block of
+    ID / VALUE is rewritten; the rest is concatenated back as it is."""
+    import numpy
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from . import stats as _stats
+
+    head = _meta_head(batch, _META_HEAD) or _meta_head(batch, batch.num_rows)
+    ids, keys, values = (_text(head.column(name)) for name in ("ID", "KEY", "VALUE"))
+    old_ids = pc.unique(ids)
+    new_ids = pa.array([str(uuid.uuid4()) for _ in range(len(old_ids))], ids.type)
+    ids = new_ids.take(pc.index_in(ids, value_set=old_ids))
+
+    old_label = _first(values.filter(pc.equal(keys, "label")))
+    label = _source_name(source)
+    if old_label is not None and label is not None and label != old_label:
+        old_dir, new_dir = os.path.dirname(old_label) + "/", os.path.dirname(label) + "/"
+        replaced = []
+        for key, value in zip(keys.to_pylist(), values.to_pylist()):
+            if key in ("label", "xml_base") and value == old_label:
+                value = label
+            elif key == "xml_base" and value is not None and old_dir != "/" and value.startswith(old_dir):
+                value = new_dir + value[len(old_dir):]
+            replaced.append(value)
+        values = pa.array(replaced, values.type)
+
+    instance_id = str(uuid.uuid4())
+    column = batch.column("INSTANCE_ID")
+    if pa.types.is_dictionary(column.type):
+        instances = pa.DictionaryArray.from_arrays(pa.array(numpy.zeros(len(column), numpy.int32)),
+                                                   pa.array([instance_id]))
+    else:
+        instances = pa.array([instance_id]).take(pa.array(numpy.zeros(len(column), numpy.int64)))
+    rewritten = {"ID": ids, "VALUE": values}
+    columns = []
+    for name in batch.schema.names:
+        field_type = batch.schema.field(name).type
+        if name in rewritten:
+            columns.append(pa.concat_arrays([rewritten[name].cast(field_type),
+                                             batch.column(name).slice(len(head))]))
+        elif name == "INSTANCE_ID":
+            columns.append(instances.cast(field_type))
+        else:
+            columns.append(batch.column(name))
+    relabeled = pa.RecordBatch.from_arrays(columns, schema=batch.schema)
+
+    statistics = _stats.read(batch)
+    if statistics is not None:
+        digest = hashlib.sha256(statistics["digest"].encode())
+        for part in [instance_id, label or "", *new_ids.to_pylist()]:
+            digest.update(part.encode())
+        statistics.update(instances={instance_id: batch.num_rows}, digest=digest.hexdigest()[:32])
+        relabeled = _stats.attach(relabeled, statistics)
+    return relabeled
+
+
+def _meta_head(batch, rows):
+    """The leading Distribution / NamespaceMap rows of batch, found within its
+    first rows; None when they may run past them."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    head = batch.slice(0, rows)
+    ids, keys, values = (_text(head.column(name)) for name in ("ID", "KEY", "VALUE"))
+    meta = ids.filter(pc.and_(pc.equal(keys, "Type"), pc.is_in(values, value_set=pa.array(_META_TYPES, values.type))))
+    outside = pc.invert(pc.is_in(ids, value_set=meta)).to_numpy(zero_copy_only=False).nonzero()[0]
+    if not len(outside):
+        return head if rows >= batch.num_rows else None
+    return head.slice(0, int(outside[0]))
+
+
+def _text(array):
+    """array as a string type the compute kernels accept (no string_view
+    kernels for filter / take / is_in / index_in)."""
+    import pyarrow as pa
+    if pa.types.is_dictionary(array.type):
+        array = array.cast(array.type.value_type)
+    return array.cast(pa.large_string()) if pa.types.is_string_view(array.type) else array
+
+
+def _first(array):
+    return array[0].as_py() if len(array) else None
+
+
+def _source_name(source):
+    """The file name the engines record for source (None for an unnamed file-like)."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return getattr(source, "name", None)
+
+
+def prune(cache_dir=None, max_bytes=None, max_age=None):
+    """Evict parse cache entries: first those not used for max_age seconds,
+    then the least recently used until the directory holds at most
+    max_bytes. None limits come from the environment (see module docstring).
+    Returns the number of entries removed."""
+    cache_dir = resolve_cache_dir(cache_dir)
+    if cache_dir is None or not cache_dir.is_dir():
+        return 0
+    if max_bytes is None:
+        max_bytes = int(os.environ.get("TRIPLETS_PARSE_CACHE_MAX_BYTES", 10 << 30))
+    if max_age is None:
+        max_age = float(os.environ.get("TRIPLETS_PARSE_CACHE_MAX_AGE_DAYS", 30)) * 86400
+
+    entries = []
+    for path in cache_dir.glob(f"*{_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except OSError:   # removed by a concurrent prune
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()   # least recently used first
+
+    now = time.time()
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, path in entries:
+        if now - mtime <= max_age and total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+        total -= size
+    if removed:
+        logger.debug("Pruned %d parse cache entries from %s", removed, cache_dir)
+    return removed
@@ -0,0 +1,282 @@
+"""Model catalog — header index of CIM files for dependency-aware loading.
+
+A ModelCatalog is a SQLite database (one file, safe to share between
+jobs) indexing the model headers of every XML file / zip member under some
+directory trees: the :func:`triplets.parser.scan_headers` row of each source
+plus a content digest. ``update()`` is incremental — a file whose size and
+mtime did not change is not opened again, and inside a changed zip only
+members with a new CRC-32 are rescanned.
+
+``closure(model_id)`` resolves the ``Model.DependentOn`` /
+``dcterms:requires`` closure of a model (SV → TP / SSH → EQ → boundary) with
+one recursive SQL query, and ``parse(model_id)`` hands exactly those
+sources to :func:`triplets.parser.parse`, so assembling a consistent model
+set no longer means parsing everything and calling
+``cgmes_tools.get_loaded_models`` afterwards.
+
+Tables (queryable directly through ``catalog.connection``):
+
+- files(path, fingerprint) — the files on disk the sources came from;
+- models(source, path, fingerprint, digest, size, file, ID, header, keyword,
+  scenarioTime, created, version, modelingAuthoritySet) — one row per
+  source; path is the file on disk (the outer zip for members);
+- profiles(source, profile), dependencies(source, DependentOn),
+  supersedes(source, Supersedes) — the list columns of the header.
+
+A model ID present in several sources (the same model in two archives;
+equal digests mean equal bytes) resolves to the shortest source label,
+then the first in sort order.
+"""
+import os
+import hashlib
+import logging
+import sqlite3
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .headers import HEADER_COLUMNS, _LISTS, _scan_one, matches
+from .utils import _iter_sources, _stat_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_MODEL_COLUMNS = ("source", "path", "fingerprint", "digest", "size", "file", "ID", "header", "keyword",
+                  "scenarioTime", "created", "version", "modelingAuthoritySet")
+_LIST_TABLES = {"profile": "profiles", "DependentOn": "dependencies", "Supersedes": "supersedes"}
+_SUFFIXES = (".xml", ".rdf", ".zip")
+_HASH_BLOCK = 16 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, fingerprint TEXT);
+CREATE TABLE IF NOT EXISTS models (
+    source TEXT PRIMARY KEY, path TEXT NOT NULL, fingerprint TEXT, digest TEXT, size INTEGER,
+    file TEXT, ID TEXT, header TEXT, keyword TEXT, scenarioTime TEXT, created TEXT, version TEXT,
+    modelingAuthoritySet TEXT);
+CREATE INDEX IF NOT EXISTS models_id ON models (ID);
+CREATE INDEX IF NOT EXISTS models_path ON models (path);
+CREATE TABLE IF NOT EXISTS profiles (source TEXT, profile TEXT);
+CREATE TABLE IF NOT EXISTS dependencies (source TEXT, DependentOn TEXT);
+CREATE TABLE IF NOT EXISTS supersedes (source TEXT, Supersedes TEXT);
+CREATE INDEX IF NOT EXISTS profiles_source ON profiles (source);
+CREATE INDEX IF NOT EXISTS dependencies_source ON dependencies (source);
+CREATE INDEX IF NOT EXISTS supersedes_source ON supersedes (source);
+"""
+
+# One source per model ID (see module docstring), then the DependentOn closure:
+# reached IDs first (UNION dedups them, so a DependentOn cycle ends), then each
+# one's shortest depth — a walk capped at the closure size, the longest
+# shortest path possible.
+_CLOSURE = """
+WITH RECURSIVE
+chosen AS (
+    SELECT ID, source FROM (
+        SELECT ID, source, ROW_NUMBER() OVER (PARTITION BY ID ORDER BY length(source), source) AS rank
+        FROM models WHERE ID IS NOT NULL)
+    WHERE rank = 1),
+closure (ID) AS (
+    SELECT value FROM json_each(?1)
+    UNION
+    SELECT dependencies.DependentOn
+    FROM closure
+    JOIN chosen ON chosen.ID = closure.ID
+    JOIN dependencies ON dependencies.source = chosen.source),
+walk (ID, depth) AS (
+    SELECT value, 0 FROM json_each(?1)
+    UNION
+    SELECT dependencies.DependentOn, walk.depth + 1
+    FROM walk
+    JOIN chosen ON chosen.ID = walk.ID
+    JOIN dependencies ON dependencies.source = chosen.source
+    WHERE walk.depth < (SELECT count(*) FROM closure))
+SELECT walk.ID, MIN(walk.depth) AS depth, chosen.source
+FROM walk LEFT JOIN chosen ON chosen.ID = walk.ID
+GROUP BY walk.ID
+ORDER BY depth DESC, walk.ID
+"""
+
+
+class ModelCatalog:
+    """Persistent header index of CIM model files (see module docstring).
+
+    Parameters
+    ----------
+    path : str or Path
+        SQLite database file (created when missing); ":memory:" for a
+        throwaway catalog.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+
+    def update(self, roots, max_workers=None, digests=True, debug=False):
+        """Index the CIM files under roots (directories, searched recursively,
+        or files) incrementally; sources of those roots that disappeared are
+        dropped. ``digests=False`` skips the content digest (it reads every
+        new or changed document whole). Returns counts of added, changed,
+        removed and unchanged sources."""
+        if isinstance(roots, (str, bytes, os.PathLike)):
+            roots = [roots]
+        roots = [os.path.abspath(os.fspath(root)) for root in roots]
+        known_files = dict(self.connection.execute("SELECT path, fingerprint FROM files"))
+        known = {source: fingerprint for source, fingerprint in
+                 self.connection.execute("SELECT source, fingerprint FROM models")}
+        seen_files, seen, pending = {}, set(), []
+        for path in _walk(roots):
+            fingerprint = _stat_fingerprint(path)
+            seen_files[path] = fingerprint
+            if fingerprint is not None and known_files.get(path) == fingerprint:
+                seen.update(source for (source,) in
+                            self.connection.execute("SELECT source FROM models WHERE path = ?", (path,)))
+                continue
+            for source, member_fingerprint, _, head in _iter_sources(path, debug=debug):
+                seen.add(source)
+                if known.get(source) == member_fingerprint:
+                    continue   # zip member with the same CRC-32 and size
+                pending.append((path, source, member_fingerprint, head))
+
+        scan = lambda entry: _index_one(*entry, digests)  # noqa: E731
+        if max_workers and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                rows = list(pool.map(scan, pending))
+        else:
+            rows = [scan(entry) for entry in pending]
+
+        removed = [source for source, path in self.connection.execute("SELECT source, path FROM models").fetchall()
+                   if source not in seen and _under(path, roots)]
+        with self.connection:
+            for source in removed + [row["source"] for row in rows]:
+                self._delete(source)
+            for row in rows:
+                self.connection.execute(
+                    f"INSERT INTO models ({', '.join(_MODEL_COLUMNS)}) VALUES ({', '.join('?' * len(_MODEL_COLUMNS))})",
+                    [row[column] for column in _MODEL_COLUMNS])
+                for column, table in _LIST_TABLES.items():
+                    self.connection.executemany(f"INSERT INTO {table} (source, {column}) VALUES (?, ?)",
+                                                [(row["source"], value) for value in row[column] if value])
+            gone = [path for path in known_files if path not in seen_files and _under(path, roots)]
+            self.connection.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in gone])
+            self.connection.executemany("INSERT OR REPLACE INTO files (path, fingerprint) VALUES (?, ?)",
+                                        seen_files.items())
+        changed = sum(row["source"] in known for row in rows)
+        counts = {"added": len(rows) - changed, "changed": changed, "removed": len(removed),
+                  "unchanged": len(seen) - len(rows)}
+        if debug:
+            logger.debug("Catalog %s update: %s", self.path, counts)
+        return counts
+
+    def models(self, header_filter=None):
+        """All indexed sources as a pandas DataFrame (the scan_headers
+        columns plus path and digest), optionally filtered like
+        ``parse(header_filter=...)``."""
+        import pandas
+        rows = [dict(zip(_MODEL_COLUMNS, values)) for values in
+                self.connection.execute(f"SELECT {', '.join(_MODEL_COLUMNS)} FROM models ORDER BY source")]
+        lists = {column: self._lists(table, column) for column, table in _LIST_TABLES.items()}
+        for row in rows:
+            for column in _LISTS:
+                row[column] = lists[column].get(row["source"], [])
+        if header_filter is not None:
+            rows = [row for row in rows if matches(row, header_filter)]
+        return pandas.DataFrame(rows, columns=list(HEADER_COLUMNS) + ["path", "digest"])
+
+    def closure(self, model_ids):
+        """The DependentOn closure of model_ids (one ID or several), deepest
+        dependencies first: a pandas DataFrame [ID, depth, source], depth 0
+        for the requested models. IDs referenced but not in the catalog have
+        a null source."""
+        import json
+        import pandas
+        if isinstance(model_ids, str):
+            model_ids = [model_ids]
+        rows = self.connection.execute(_CLOSURE, (json.dumps(list(model_ids)),)).fetchall()
+        return pandas.DataFrame(rows, columns=["ID", "depth", "source"])
+
+    def parse(self, model_ids, **kwargs):
+        """:func:`triplets.parser.parse` of exactly the closure of model_ids.
+
+        Only the files holding closure sources are opened, and inside zips
+        only the selected members are loaded (a ``header_filter`` on the
+        source label, which also guards against a member that changed
+        since the last update). Missing dependencies are logged, not fatal.
+        Keyword arguments go to parse(); a header_filter given there is
+        applied as well.
+        """
+        from . import parse
+        closure = self.closure(model_ids)
+        missing = closure.loc[closure["source"].isna(), "ID"].tolist()
+        if missing:
+            logger.warning("Models not in catalog %s: %s", self.path, ", ".join(missing))
+        sources = closure["source"].dropna().tolist()
+        placeholders = ", ".join("?" * len(sources))
+        selected = dict(self.connection.execute(
+            f"SELECT source, ID FROM models WHERE source IN ({placeholders})", sources))
+        paths = list(dict.fromkeys(path for path, in self.connection.execute(
+            f"SELECT path FROM models WHERE source IN ({placeholders}) ORDER BY source", sources)))
+        extra = kwargs.pop("header_filter", None)
+
+        def header_filter(header):
+            return (selected.get(header["source"], False) == header["ID"]
+                    and (extra is None or matches(header, extra)))
+
+        return parse(paths, header_filter=header_filter, **kwargs)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _delete(self, source):
+        self.connection.execute("DELETE FROM models WHERE source = ?", (source,))
+        for table in _LIST_TABLES.values():
+            self.connection.execute(f"DELETE FROM {table} WHERE source = ?", (source,))
+
+    def _lists(self, table, column):
+        values = {}
+        for source, value in self.connection.execute(f"SELECT source, {column} FROM {table} ORDER BY rowid"):
+            values.setdefault(source, []).append(value)
+        return values
+
+
+def _index_one(path, source, fingerprint, head, digests):
+    """Header row of one source plus its path and content digest."""
+    row = _scan_one(source, fingerprint, head)
+    row["path"] = path
+    row["digest"] = None
+    if digests:
+        try:
+            row["digest"] = _digest(head)
+        except Exception as error:
+            logger.warning("Digest failed for %s: %s", source, error)
+    return row
+
+
+def _digest(head):
+    """sha256 of the document (decompressed), streamed block by block."""
+    stream, _ = head()
+    digest = hashlib.sha256()
+    with open(stream, "rb") if isinstance(stream, str) else stream as file:
+        while block := file.read(_HASH_BLOCK):
+            digest.update(block)
+    return digest.hexdigest()[:32]
+
+
+def _walk(roots):
+    """CIM files under roots, sorted: paths whose name has .xml / .rdf / .zip."""
+    for root in roots:
+        if os.path.isfile(root):
+            yield root
+            continue
+        for directory, subdirectories, files in os.walk(root):
+            subdirectories.sort()
+            for name in sorted(files):
+                if any(suffix in name.lower() for suffix in _SUFFIXES):
+                    yield os.path.join(directory, name)
+
+
+def _under(path, roots):
+    return any(path == root or path.startswith(root.rstrip(os.sep) + os.sep) for root in roots)
@@ -20,16 +20,22 @@ IMPORTANT FOR MAINTAINERS:
 Build: pixi (see pixi.toml) or python setup_cython_parser.py build_ext --inplace
 (see setup.py / setup_cython_parser.py for Extension + vendor/pugixml).
 
-Exposes load_rdf_to_dataframe(...) which returns a pyarrow.RecordBatch.
+Exposes load_rdf_to_dataframe(...) which returns a pyarrow.RecordBatch,
+iter_rdf_batches(...), its bounded-memory streaming form, and the
+pack_uuid16 / format_uuid16 kernels behind parser.ids (id_encoding="uuid16"),
+the StringCodes hash table behind parser.ids.IDInterner (id_encoding="interned"),
+and the N-Quads tokenizer behind parser.nquads (iter_nquads_batches,
+nquads_terms_to_batch).
 """
 
 from libcpp.string cimport string
 from libcpp.string_view cimport string_view
 from libcpp.memory cimport shared_ptr, make_shared
 from libcpp.vector cimport vector
+from libcpp.set cimport set as cpp_set
 from libcpp cimport bool
-from libc.string cimport strrchr, strlen, memcmp
-from libc.stdint cimport int64_t
+from libc.string cimport strrchr, strlen, memcmp, memcpy, memchr
+from libc.stdint cimport int32_t, int64_t, uint32_t, uint64_t
 
 # Arrow C++ types from pyarrow's Cython API
 from pyarrow.includes.common cimport CStatus
@@ -42,13 +48,15 @@ from pyarrow.includes.libarrow cimport (
     CMemoryPool,
     c_default_memory_pool,
 )
-from pyarrow.lib cimport pyarrow_wrap_batch, pyarrow_wrap_array
+from pyarrow.lib cimport pyarrow_wrap_batch, pyarrow_wrap_array, pyarrow_unwrap_array
 
 from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
 
 import mmap
 import os
 
+from .utils import MemberBuffer
+
 cdef extern from "arrow/type.h" namespace "arrow":
     shared_ptr[CDataType] utf8()
     shared_ptr[CDataType] int32()
@@ -63,7 +71,10 @@ cdef extern from "arrow/type.h" namespace "arrow":
 #   - appends an int32 index instead of the string data
 # This is what gives us dictionary-encoded KEY "for free" during extraction
 # (no post-hoc pa.compute.dictionary_encode on 1M+ rows).
-cdef extern from *:
+#
+# Declared nogil: the builders touch no Python objects (the memory pool is
+# thread-safe), so one builder set per worker thread runs without the GIL.
+cdef extern from * nogil:
     """
     #include <stdexcept>
     #include <string_view>
@@ -82,6 +93,9 @@ cdef extern from *:
         arrow::Status Append(const char* value, int length) {
             return inner_.Append(value, length);
         }
+        arrow::Status AppendNull() {
+            return inner_.AppendNull();
+        }
         arrow::Status Finish(std::shared_ptr<arrow::Array>* out) {
             return inner_.Finish(out);
         }
@@ -169,19 +183,11 @@ cdef extern from *:
     inline arrow::Status Append(KeyDictBuilder* b, const char* s, int len) {
         return b->Append(s, len);
     }
-
-    // Convenience for Python bytes objects (used for file_name_bytes etc.)
-    // This is only for the few non-hot-path appends.
-    inline arrow::Status Append(StringColBuilder* b, PyObject* pybytes) {
-        if (PyBytes_Check(pybytes)) {
-            return b->Append(PyBytes_AS_STRING(pybytes), (int)PyBytes_GET_SIZE(pybytes));
-        }
-        return arrow::Status::Invalid("Append expected bytes");
-    }
     """
     cdef cppclass KeyDictBuilder:
         KeyDictBuilder(CMemoryPool* pool) except +
         CStatus Append(const char* value, int length)
+        CStatus AppendNull()
         CStatus Finish(shared_ptr[CArray]* out)
 
     cdef cppclass StringColBuilder:
@@ -200,11 +206,8 @@ cdef extern from *:
     CStatus Append(StringColBuilder* b, const char* s, int len)
     CStatus Append(KeyDictBuilder* b, const char* s, int len)
 
-    # Overload for Python bytes (so we can write Append(val_b, file_name_bytes) directly)
-    CStatus Append(StringColBuilder* b, object pybytes)
-
 # pugixml C++ types (compiled from source via setup_cython.py)
-cdef extern from "pugixml.hpp" namespace "pugi":
+cdef extern from "pugixml.hpp" namespace "pugi" nogil:
     const unsigned int parse_minimal
     const unsigned int parse_embed_pcdata
     const unsigned int parse_escapes
@@ -233,13 +236,15 @@ cdef extern from "pugixml.hpp" namespace "pugi":
         xml_document() except +
         xml_parse_result load_file(const char* path, unsigned int options)
         xml_parse_result load_buffer(const void* contents, size_t size, unsigned int options)
+        xml_parse_result load_buffer_inplace(void* contents, size_t size, unsigned int options)
         xml_node first_child() const
 
 
 # ── C++ helpers for string processing (all happen without Python objects) ─────
-cdef extern from *:
+cdef extern from * nogil:
     """
     #include <cstring>
+    #include <set>
     #include <string>
     #include <string_view>
 
@@ -277,11 +282,162 @@ cdef extern from *:
         const char* colon = strrchr(name, ':');
         return colon ? colon + 1 : name;
     }
+
+    // Parse-time pushdown (types= / keys= / instances=): which objects and
+    // property elements reach the builders. Small ordered sets with
+    // transparent lookup — string_view probes, no allocation per element.
+    struct ObjectFilter {
+        bool by_type = false, by_key = false, by_id = false;
+        std::set<std::string, std::less<>> types, keys, ids, headers;
+
+        // 0 = skip the object, 1 = keep it (keys filtered), 2 = keep it whole
+        // (header objects, e.g. FullModel — exports need them)
+        int keep_object(std::string_view type, std::string_view id) const {
+            if (headers.count(type)) return 2;
+            if (by_type && !types.count(type)) return 0;
+            if (by_id && !ids.count(id)) return 0;
+            return 1;
+        }
+        bool keep_key(std::string_view key) const {
+            return !by_key || keys.count(key);
+        }
+    };
     """
     string_view clean_id(string_view sv) noexcept
     string_view clean_ref_value(string_view sv) noexcept
     const char* local_name(const char* name) noexcept
 
+    cdef cppclass ObjectFilter:
+        bool by_type, by_key, by_id
+        cpp_set[string] types, keys, ids, headers
+        int keep_object(string_view type_name, string_view obj_id) noexcept
+        bool keep_key(string_view key) noexcept
+
+
+# ── Intra-file splitting: cut one document on top-level object boundaries ────
+# A multi-GB CGM is one XML document, so file-level threads cannot help it.
+# These helpers find byte offsets where a top-level RDF object (a child of
+# rdf:RDF) starts; each slice between two offsets is re-wrapped in the
+# document's prolog + root start tag and the root end tag, which makes it a
+# well-formed document of its own that pugixml parses independently.
+#
+# The boundary test is a cheap lexical one — a start tag carrying rdf:ID or
+# rdf:about (CIM property elements carry rdf:resource / rdf:nodeID or text,
+# never an identity). A boundary that is not top-level after all (a nested
+# object, a tag inside a comment or CDATA) always leaves a slice with an
+# unclosed element, so its parse fails and the caller falls back to the
+# sequential parse — a wrong split can cost time, never change rows.
+cdef extern from * nogil:
+    """
+    #include <algorithm>
+    #include <cstring>
+    #include <string>
+    #include <string_view>
+    #include <vector>
+
+    static inline bool xml_space(char c) {
+        return c == ' ' || c == '\\t' || c == '\\n' || c == '\\r';
+    }
+
+    // Content span [*begin, *end) of the root element: *begin is just past
+    // the root start tag (so buf[0:*begin] is the prolog — declaration,
+    // comments, root start tag with its namespace declarations), *end is the
+    // root end tag, copied to *end_tag. false when the document has no
+    // splittable root (self-closing root, DOCTYPE internal subset, truncated).
+    static bool root_content(const char* buf, size_t len, size_t* begin, size_t* end,
+                             std::string* end_tag) {
+        std::string_view text(buf, len);
+        size_t i = 0;
+        while ((i = text.find('<', i)) != std::string_view::npos && i + 1 < len) {
+            char c = buf[i + 1];
+            if (c == '?' || c == '!') {
+                std::string_view close = c == '?' ? "?>" : text.substr(i, 4) == "<!--" ? "-->" : ">";
+                size_t stop = text.find(close, i);
+                if (stop == std::string_view::npos) return false;
+                if (close == ">" && text.substr(i, stop - i).find('[') != std::string_view::npos) {
+                    return false;                      // DOCTYPE internal subset
+                }
+                i = stop + close.size();
+                continue;
+            }
+            if (c == '/') return false;
+            size_t j = i + 1;
+            while (j < len && !xml_space(buf[j]) && buf[j] != '>' && buf[j] != '/') ++j;
+            *end_tag = "</" + std::string(buf + i + 1, j - i - 1);
+            char quote = 0;
+            for (; j < len; ++j) {
+                char ch = buf[j];
+                if (quote) {
+                    if (ch == quote) quote = 0;
+                } else if (ch == '"' || ch == '\\'') {
+                    quote = ch;
+                } else if (ch == '>') {
+                    if (buf[j - 1] == '/') return false;   // <rdf:RDF/> — nothing to split
+                    *begin = j + 1;
+                    *end = text.rfind(*end_tag);
+                    if (*end == std::string_view::npos || *end < *begin) return false;
+                    *end_tag += '>';
+                    return true;
+                }
+            }
+            return false;
+        }
+        return false;
+    }
+
+    // Does an identity attribute (rdf:ID / rdf:about) start at buf[j]?
+    static inline bool identity_attribute_at(const char* buf, size_t j, size_t end) {
+        for (std::string_view attr : {std::string_view("rdf:ID"), std::string_view("rdf:about")}) {
+            if (end - j > attr.size() && std::string_view(buf + j, attr.size()) == attr) {
+                char next = buf[j + attr.size()];
+                if (next == '=' || xml_space(next)) return true;
+            }
+        }
+        return false;
+    }
+
+    // Offset of the first start tag in [from, end) that carries rdf:ID /
+    // rdf:about — the opening of a top-level RDF object. end when none.
+    static size_t next_object_start(const char* buf, size_t from, size_t end) {
+        const char* stop = buf + end;
+        for (const char* lt = buf + from;
+             lt < stop && (lt = (const char*)memchr(lt, '<', stop - lt)) != nullptr; ++lt) {
+            if (lt + 1 >= stop || lt[1] == '/' || lt[1] == '!' || lt[1] == '?') continue;
+            char quote = 0;
+            for (const char* p = lt + 1; p < stop; ++p) {
+                if (quote) {
+                    if (*p == quote) quote = 0;
+                } else if (*p == '"' || *p == '\\'') {
+                    quote = *p;
+                } else if (*p == '>' || *p == '<') {
+                    break;
+                } else if (xml_space(*p) && identity_attribute_at(buf, p + 1 - buf, end)) {
+                    return lt - buf;
+                }
+            }
+        }
+        return end;
+    }
+
+    // Boundaries [begin, b1, ..., end] of up to `parts` roughly equal slices
+    // of the root content, each inner boundary the start of an RDF object.
+    // Fewer slices when the content has too few objects to cut.
+    static std::vector<size_t> split_points(const char* buf, size_t begin, size_t end, size_t parts) {
+        std::vector<size_t> points{begin};
+        size_t step = (end - begin) / std::max<size_t>(parts, 1);
+        for (size_t k = 1; k < parts; ++k) {
+            size_t point = next_object_start(buf, std::max(begin + k * step, points.back() + 1), end);
+            if (point >= end) break;
+            points.push_back(point);
+        }
+        points.push_back(end);
+        return points;
+    }
+    """
+    bool root_content(const char* buf, size_t len, size_t* begin, size_t* end, string* end_tag)
+    size_t next_object_start(const char* buf, size_t start, size_t end)
+    vector[size_t] split_points(const char* buf, size_t begin, size_t end, size_t parts)
+
 
 # parse_escapes: decode &gt; &amp; &#xNN; entities — parity with the lxml engines
 cdef unsigned int PARSE_FLAGS = parse_minimal | parse_embed_pcdata | parse_escapes
@@ -289,12 +445,548 @@ cdef unsigned int PARSE_FLAGS = parse_minimal | parse_embed_pcdata | parse_escap
 
 _STRING_TYPE_LAYOUTS = {"utf8": 0, "large_utf8": 1, "string_view": 2}
 
+# Smallest slice worth a worker thread when splitting one document
+# (max_workers > 1): below this the thread hand-off costs more than it saves.
+_MIN_CHUNK_BYTES = 16 << 20
+
+# Smallest window of the streaming parse (iter_rdf_batches); the window grows
+# from here to about batch_rows rows' worth of bytes.
+_MIN_WINDOW_BYTES = 64 << 10
+
+
+# Namespace attribute prefixes (lengths derived from definitions, not hardcoded)
+cdef const char* XMLNS_COLON = b"xmlns:"
+cdef size_t XMLNS_COLON_LEN = strlen(XMLNS_COLON)
+cdef const char* XMLNS = b"xmlns"
+cdef size_t XMLNS_LEN = strlen(XMLNS)
+cdef const char* XML_BASE = b"xml:base"
+cdef size_t XML_BASE_LEN = strlen(XML_BASE)
+
+
+cdef void _append_header(xml_node root, StringColBuilder* id_b, KeyDictBuilder* key_b,
+                         StringColBuilder* val_b, const string& meta_id, const string& nsmap_id,
+                         const string& file_name) noexcept nogil:
+    """Distribution + NamespaceMap rows (only a handful per file, not performance critical)."""
+    cdef xml_attribute attr
+    cdef const char* aname
+    cdef const char* aval
+    cdef bint has_xml_base = False
+
+    # Thanks to the Append() overloads, we no longer need to manually
+    # write lengths or .c_str() + .size() for every call.
+    # Distribution header
+    Append(id_b, meta_id)
+    Append(key_b, b"Type")
+    Append(val_b, b"Distribution")
+
+    Append(id_b, meta_id)
+    Append(key_b, b"label")
+    Append(val_b, file_name)
+
+    # NamespaceMap header
+    Append(id_b, nsmap_id)
+    Append(key_b, b"Type")
+    Append(val_b, b"NamespaceMap")
+
+    # ── Namespace declarations from root attributes ──────────────────
+    attr = root.first_attribute()
+    while not attr.empty():
+        aname = attr.name()
+        if memcmp(aname, XMLNS_COLON, XMLNS_COLON_LEN) == 0:
+            Append(id_b, nsmap_id)
+            aval = aname + XMLNS_COLON_LEN
+            Append(key_b, aval)
+            aval = attr.value()
+            Append(val_b, aval)
+        elif memcmp(aname, XMLNS, XMLNS_LEN) == 0 and aname[XMLNS_LEN] == 0:
+            Append(id_b, nsmap_id)
+            Append(key_b, b"")
+            aval = attr.value()
+            Append(val_b, aval)
+        elif memcmp(aname, XML_BASE, XML_BASE_LEN) == 0:
+            Append(id_b, nsmap_id)
+            Append(key_b, b"xml_base")
+            aval = attr.value()
+            Append(val_b, aval)
+            has_xml_base = True
+        attr = attr.next_attribute()
+
+    if not has_xml_base:
+        Append(id_b, nsmap_id)
+        Append(key_b, b"xml_base")
+        Append(val_b, file_name)
+
+
+cdef void _append_objects(xml_node rdf_object, StringColBuilder* id_b, KeyDictBuilder* key_b,
+                          StringColBuilder* val_b, const ObjectFilter* filt) noexcept nogil:
+    """RDF objects from rdf_object on (the hot loop — every row is processed here).
+
+    We deliberately avoid:
+      - appending the same INSTANCE_ID string millions of times
+      - using std::string for the high-frequency KEY column (use KeyDictBuilder instead)
+      - Python objects or GIL
+
+    filt (NULL = keep everything) drops objects and property elements
+    before any builder append — the pushdown behind parse(types=, keys=,
+    instances=).
+    """
+    cdef xml_node element
+    cdef const char* raw_id_ptr
+    cdef const char* tag_name
+    cdef const char* child_text
+    cdef const char* ref_val
+    cdef string_view obj_id, val_str     # string_view into the XML buffer (zero-copy after clean)
+    cdef size_t text_len, name_len
+    cdef int keep = 2
+
+    while not rdf_object.empty():
+
+        # Choose best ID source (rdf:ID > rdf:about > rdf:nodeID)
+        raw_id_ptr = rdf_object.attribute(b"rdf:ID").value()
+        if raw_id_ptr[0] == 0:
+            raw_id_ptr = rdf_object.attribute(b"rdf:about").value()
+        if raw_id_ptr[0] == 0:
+            raw_id_ptr = rdf_object.attribute(b"rdf:nodeID").value()
+
+        if raw_id_ptr[0] != 0:
+            obj_id = clean_id(string_view(raw_id_ptr, strlen(raw_id_ptr)))
+        else:
+            obj_id = string_view()
+
+        # "Type" row for this object
+        tag_name = local_name(rdf_object.name())
+        name_len = strlen(tag_name)
+        if filt != NULL:
+            keep = filt.keep_object(string_view(tag_name, name_len), obj_id)
+            if keep == 0:
+                rdf_object = rdf_object.next_sibling()
+                continue
+        Append(id_b, obj_id.data(), <int>obj_id.size())
+        Append(key_b, b"Type")
+        Append(val_b, tag_name, <int>name_len)
+
+        # All property rows for this object
+        element = rdf_object.first_child()
+        while not element.empty():
+            tag_name = local_name(element.name())
+            name_len = strlen(tag_name)
+            if keep == 1 and not filt.keep_key(string_view(tag_name, name_len)):
+                element = element.next_sibling()
+                continue
+
+            Append(id_b, obj_id.data(), <int>obj_id.size())
+            Append(key_b, tag_name, <int>name_len)
+
+            # Value is either text content or an rdf:resource / rdf:nodeID reference
+            child_text = element.child_value()
+            text_len = strlen(child_text)
+
+            if text_len > 0:
+                Append(val_b, child_text, <int>text_len)
+            else:
+                ref_val = element.attribute(b"rdf:resource").value()
+                if ref_val[0] == 0:
+                    ref_val = element.attribute(b"rdf:nodeID").value()
+
+                if ref_val[0] != 0:
+                    val_str = clean_ref_value(string_view(ref_val, strlen(ref_val)))
+                    Append(val_b, val_str.data(), <int>val_str.size())
+                else:
+                    Append(val_b, b"")
+
+            element = element.next_sibling()
+
+        rdf_object = rdf_object.next_sibling()
+
+
+cdef list _finish_columns(StringColBuilder* id_b, KeyDictBuilder* key_b, StringColBuilder* val_b):
+    """Finish the three builders into pyarrow arrays [ID, KEY, VALUE] (zero-copy wrap)."""
+    cdef shared_ptr[CArray] id_arr, key_arr, val_arr
+    id_b.Finish(&id_arr)
+    key_b.Finish(&key_arr)      # already dictionary-encoded via KeyDictBuilder (int32 indices)
+    val_b.Finish(&val_arr)
+    # We use the low-level pyarrow_wrap_array so we stay zero-copy from the
+    # StringColBuilder / KeyDictBuilder data.
+    return [pyarrow_wrap_array(id_arr), pyarrow_wrap_array(key_arr), pyarrow_wrap_array(val_arr)]
+
+
+cdef bint _parse_slice(const char* buf, size_t prolog_len, size_t begin, size_t end,
+                       const string& end_tag, StringColBuilder* id_b, KeyDictBuilder* key_b,
+                       StringColBuilder* val_b, const ObjectFilter* filt) noexcept nogil:
+    """Parse buf[begin:end] as prolog + slice + root end tag; False if not well-formed."""
+    cdef string text
+    cdef xml_document doc
+    text.reserve(prolog_len + (end - begin) + end_tag.size())
+    text.append(buf, prolog_len)
+    text.append(buf + begin, end - begin)
+    text.append(end_tag)
+    # inplace: the slice copy is ours, pugixml parses it without a second copy
+    if not <bool>doc.load_buffer_inplace(&text[0], text.size(), PARSE_FLAGS):
+        return False
+    _append_objects(doc.first_child().first_child(), id_b, key_b, val_b, filt)
+    return True
+
+
+cdef class _Slice:
+    """One top-level slice of a document, parsed on a worker thread without the GIL."""
+    cdef const char* buf
+    cdef size_t prolog_len, begin, end
+    cdef string end_tag
+    cdef StringColBuilder* id_b
+    cdef KeyDictBuilder* key_b
+    cdef StringColBuilder* val_b
+    cdef const ObjectFilter* filt
+    cdef bint ok
+
+    def __dealloc__(self):
+        del self.id_b
+        del self.key_b
+        del self.val_b
+
+    def run(self):
+        cdef const char* buf = self.buf
+        cdef size_t prolog_len = self.prolog_len, begin = self.begin, end = self.end
+        cdef bint ok
+        with nogil:
+            ok = _parse_slice(buf, prolog_len, begin, end, self.end_tag,
+                              self.id_b, self.key_b, self.val_b, self.filt)
+        self.ok = ok
+
+
+cdef object _parse_split(const char* buf, size_t buf_len, int layout, size_t parts, int max_workers,
+                         const string& meta_id, const string& nsmap_id, const string& file_name,
+                         const ObjectFilter* filt):
+    """Columns [ID, KEY, VALUE] of the document parsed as up to `parts` slices
+    on max_workers threads, or None when it cannot be split safely."""
+    cdef size_t begin, end
+    cdef string end_tag
+    cdef string prolog
+    cdef xml_document header_doc
+    cdef CMemoryPool* pool = c_default_memory_pool()
+    cdef vector[size_t] points
+    cdef size_t k
+    cdef _Slice piece
+
+    if not root_content(buf, buf_len, &begin, &end, &end_tag):
+        return None
+    points = split_points(buf, begin, end, parts)
+    if points.size() < 3:
+        return None
+
+    # Header rows come from the root start tag alone (a document with no objects)
+    prolog.append(buf, begin)
+    prolog.append(end_tag)
+    if not <bool>header_doc.load_buffer_inplace(&prolog[0], prolog.size(), PARSE_FLAGS):
+        return None
+    header = _Slice()
+    header.id_b = new StringColBuilder(pool, layout)
+    header.key_b = new KeyDictBuilder(pool)
+    header.val_b = new StringColBuilder(pool, layout)
+    _append_header(header_doc.first_child(), header.id_b, header.key_b, header.val_b,
+                   meta_id, nsmap_id, file_name)
+
+    slices = []
+    for k in range(points.size() - 1):
+        piece = _Slice()
+        piece.buf = buf
+        piece.prolog_len = begin
+        piece.begin = points[k]
+        piece.end = points[k + 1]
+        piece.end_tag = end_tag
+        piece.filt = filt
+        piece.id_b = new StringColBuilder(pool, layout)
+        piece.key_b = new KeyDictBuilder(pool)
+        piece.val_b = new StringColBuilder(pool, layout)
+        slices.append(piece)
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers) as pool_executor:
+        list(pool_executor.map(_Slice.run, slices))
+    for piece in slices:
+        if not piece.ok:
+            return None
+
+    # Document order: header, then the slices in buffer order. KEY dictionaries
+    # unify in first-seen order, so the result equals the sequential parse.
+    import pyarrow as pa
+    parts_columns = [_finish_columns(header.id_b, header.key_b, header.val_b)]
+    for piece in slices:
+        parts_columns.append(_finish_columns(piece.id_b, piece.key_b, piece.val_b))
+    return [pa.concat_arrays([columns[i] for columns in parts_columns]) for i in range(3)]
+
+
+cdef list _parse_whole(const char* buf, size_t buf_len, int layout, const string& meta_id,
+                       const string& nsmap_id, const string& file_name, str file_name_py,
+                       object timer, const ObjectFilter* filt):
+    """Columns [ID, KEY, VALUE] of the document parsed as one DOM.
+
+    The document load and the whole extraction run without the GIL, so
+    file-level threads (parse(max_workers=...), the parse_batches prefetch)
+    parse concurrently instead of taking turns.
+    """
+    cdef xml_document doc
+    cdef bint loaded
+    with nogil:
+        loaded = <bool>doc.load_buffer(buf, buf_len, PARSE_FLAGS)
+    if not loaded:
+        raise ValueError(f"Failed to parse XML: {file_name_py}")
+    timer("XML parse")
+
+    cdef xml_node root = doc.first_child()
+
+    # ------------------------------------------------------------------
+    # Arrow column builders (allocated on the C++ heap for the hot path)
+    # ------------------------------------------------------------------
+    # ID    : high cardinality (mostly unique) → StringColBuilder (layout-selected)
+    # KEY   : very low cardinality (~hundreds of property names + "Type")
+    #         → KeyDictBuilder (our wrapper around StringDictionary32Builder)
+    #         builds a DictionaryArray *during* the loop. No post-processing.
+    # VALUE : mixed cardinality → StringColBuilder (layout-selected)
+    # INSTANCE_ID : constant per file → deliberately *not* built in the loop.
+    #               See the post-loop construction in load_rdf_to_dataframe.
+    cdef CMemoryPool* pool = c_default_memory_pool()
+    cdef StringColBuilder* id_b = new StringColBuilder(pool, layout)
+    cdef KeyDictBuilder* key_b = new KeyDictBuilder(pool)
+    cdef StringColBuilder* val_b = new StringColBuilder(pool, layout)
+    try:
+        with nogil:
+            _append_header(root, id_b, key_b, val_b, meta_id, nsmap_id, file_name)
+            _append_objects(root.first_child(), id_b, key_b, val_b, filt)
+        timer("Extraction")
+        return _finish_columns(id_b, key_b, val_b)
+    finally:
+        del id_b
+        del key_b
+        del val_b
+
 
-def load_rdf_to_dataframe(path_or_fileobject, debug=False, string_type="utf8"):
+cdef class _Buffer:
+    """The document bytes, valid until close(): a read-only mmap for a local
+    path (pugixml parses straight from the kernel page cache, no user-space
+    copy of the document), the buffer of a zip member (inflated bytes, or a
+    view into the mapped archive), else the bytes read from the file-like."""
+    cdef const char* buf
+    cdef size_t buf_len
+    cdef const unsigned char[::1] _view
+    cdef bytes _content
+    cdef object _file, _mmap
+
+    def __cinit__(self, source):
+        if isinstance(source, str):
+            try:
+                self._file = open(source, "rb")
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = self._mmap
+                self.buf = <const char*>&self._view[0]
+                self.buf_len = len(self._view)
+                return
+            except Exception:
+                self.close()   # e.g. empty files cannot be mapped — read instead
+            with open(source, "rb") as f:
+                self._content = f.read()
+        elif isinstance(source, MemberBuffer):
+            self._view = source.getbuffer()
+            self.buf_len = len(self._view)
+            if self.buf_len:
+                self.buf = <const char*>&self._view[0]
+                return
+            self._content = b""
+        else:
+            source.seek(0)
+            content = source.read()
+            self._content = content.encode('utf-8') if isinstance(content, str) else content
+        self.buf = self._content
+        self.buf_len = len(self._content)
+
+    def close(self):
+        """Release the mmap and the file (the view first — a mapping with a
+        live export cannot be closed)."""
+        self._view = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except Exception:
+                pass
+            self._mmap = None
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+
+cdef class _Stream:
+    """One document as consecutive object-aligned windows of the root content.
+
+    Each window is parsed as its own small DOM (prolog + window + root end
+    tag, the same mechanism as the split parse), so memory stays bounded by
+    the window, not the document. The window size adapts to the rows per
+    byte seen so far; a window that does not parse (its cut fell inside a
+    nested object, comment or CDATA) is widened until it does.
+    """
+    cdef _Buffer source
+    cdef int layout
+    cdef string end_tag, meta_id, nsmap_id, file_name
+    cdef size_t begin, cursor, end, window
+    cdef const ObjectFilter* filt
+    cdef readonly bint splittable
+
+    def __cinit__(self, _Buffer source, int layout, bytes meta_id, bytes nsmap_id, bytes file_name):
+        self.source = source
+        self.layout = layout
+        self.meta_id = meta_id
+        self.nsmap_id = nsmap_id
+        self.file_name = file_name
+        self.window = _MIN_WINDOW_BYTES
+        self.splittable = root_content(source.buf, source.buf_len, &self.begin, &self.end,
+                                       &self.end_tag)
+        self.cursor = self.begin
+
+    cdef list header(self):
+        """Header rows, from the root start tag alone (a document with no objects)."""
+        cdef string prolog
+        cdef xml_document doc
+        cdef CMemoryPool* pool = c_default_memory_pool()
+        prolog.append(self.source.buf, self.begin)
+        prolog.append(self.end_tag)
+        if not <bool>doc.load_buffer_inplace(&prolog[0], prolog.size(), PARSE_FLAGS):
+            raise ValueError(f"Failed to parse XML: {self.file_name.decode('utf-8')}")
+        cdef StringColBuilder* id_b = new StringColBuilder(pool, self.layout)
+        cdef KeyDictBuilder* key_b = new KeyDictBuilder(pool)
+        cdef StringColBuilder* val_b = new StringColBuilder(pool, self.layout)
+        try:
+            _append_header(doc.first_child(), id_b, key_b, val_b,
+                           self.meta_id, self.nsmap_id, self.file_name)
+            return _finish_columns(id_b, key_b, val_b)
+        finally:
+            del id_b
+            del key_b
+            del val_b
+
+    cdef list read(self, size_t target_rows):
+        """Columns [ID, KEY, VALUE] of the next window (about target_rows
+        rows), or None at the end of the document."""
+        cdef const char* buf = self.source.buf
+        cdef size_t begin = self.begin, cursor = self.cursor, end = self.end
+        cdef size_t window = self.window, stop, rows
+        cdef bint ok
+        cdef CMemoryPool* pool = c_default_memory_pool()
+        cdef StringColBuilder* id_b
+        cdef KeyDictBuilder* key_b
+        cdef StringColBuilder* val_b
+        if cursor >= end:
+            return None
+        while True:
+            stop = end if end - cursor <= window else next_object_start(buf, cursor + window, end)
+            id_b = new StringColBuilder(pool, self.layout)
+            key_b = new KeyDictBuilder(pool)
+            val_b = new StringColBuilder(pool, self.layout)
+            try:
+                with nogil:
+                    ok = _parse_slice(buf, begin, cursor, stop, self.end_tag, id_b, key_b, val_b,
+                                      self.filt)
+                if ok:
+                    columns = _finish_columns(id_b, key_b, val_b)
+                    break
+            finally:
+                del id_b
+                del key_b
+                del val_b
+            if stop >= end:
+                raise ValueError(f"Failed to parse XML: {self.file_name.decode('utf-8')}")
+            window *= 2
+        rows = len(columns[0])
+        if rows:
+            self.window = max(<size_t>_MIN_WINDOW_BYTES, (stop - cursor) * target_rows // rows)
+        self.cursor = stop
+        return columns
+
+
+cdef class _Filter:
+    """Owns the ObjectFilter of one parse (see _make_filter)."""
+    cdef ObjectFilter* ptr
+
+    def __cinit__(self):
+        self.ptr = new ObjectFilter()
+
+    def __dealloc__(self):
+        del self.ptr
+
+
+cdef _Filter _make_filter(types, keys, instances):
+    """Pushdown filter from the types / keys / instances arguments, None when
+    nothing is pushed down. Header objects (METADATA_TYPES) are kept whole."""
+    if types is None and keys is None and instances is None:
+        return None
+    from .utils import METADATA_TYPES
+    cdef _Filter pushdown = _Filter()
+    for type_name in METADATA_TYPES:
+        pushdown.ptr.headers.insert(type_name.encode('utf-8'))
+    if types is not None:
+        pushdown.ptr.by_type = True
+        for value in ([types] if isinstance(types, str) else types):
+            pushdown.ptr.types.insert(value.encode('utf-8'))
+    if keys is not None:
+        pushdown.ptr.by_key = True
+        for value in ([keys] if isinstance(keys, str) else keys):
+            pushdown.ptr.keys.insert(value.encode('utf-8'))
+    if instances is not None:
+        pushdown.ptr.by_id = True
+        for value in ([instances] if isinstance(instances, str) else instances):
+            pushdown.ptr.ids.insert(value.encode('utf-8'))
+    return pushdown
+
+
+cdef inline const ObjectFilter* _filter_ptr(_Filter pushdown):
+    return pushdown.ptr if pushdown is not None else NULL
+
+
+def _layout(string_type):
+    layout = _STRING_TYPE_LAYOUTS.get(string_type)
+    if layout is None:
+        raise ValueError(f"Unknown string_type: {string_type!r}. "
+                         f"Known: {', '.join(_STRING_TYPE_LAYOUTS)}")
+    return layout
+
+
+def _source_name(path_or_fileobject):
+    """(source, file name): pathlib.Path → str (the mmap fast path)."""
+    if hasattr(path_or_fileobject, "__fspath__"):
+        path_or_fileobject = os.fspath(path_or_fileobject)
+    if isinstance(path_or_fileobject, str):
+        return path_or_fileobject, path_or_fileobject
+    return path_or_fileobject, getattr(path_or_fileobject, 'name', '<file-like>')
+
+
+def _record_batch(columns, str instance_id):
+    """RecordBatch [ID, KEY, VALUE, INSTANCE_ID] from the three built columns.
+
+    INSTANCE_ID is a constant value repeated for every row in this file.
+    We deliberately did *not* append it N times in the hot loop (that was the
+    big win for cat=ON). Instead we construct a minimal DictionaryArray here:
+      - one dictionary entry (the UUID string)
+      - an indices array of all zeros (size = nrows)
+    This small Python-side construction happens only once per batch.
+    """
+    import pyarrow as pa
+    id_col, key_col, val_col = columns
+    inst_dict = pa.array([instance_id])
+    inst_indices = pa.repeat(pa.scalar(0, type=pa.int32()), len(id_col))
+    inst_col = pa.DictionaryArray.from_arrays(inst_indices, inst_dict)
+    return pa.RecordBatch.from_arrays(
+        [id_col, key_col, val_col, inst_col],
+        names=["ID", "KEY", "VALUE", "INSTANCE_ID"],
+    )
+
+
+def load_rdf_to_dataframe(path_or_fileobject, debug=False, string_type="utf8", max_workers=None,
+                          types=None, keys=None, instances=None):
     """Parse RDF XML and return a PyArrow RecordBatch directly.
 
     The entire pipeline — XML parse, element iteration, Arrow building —
-    happens in C++ via Cython. Returns a PyArrow RecordBatch (zero-copy).
+    happens in C++ via Cython, with the GIL released. Returns a PyArrow
+    RecordBatch (zero-copy).
 
     string_type selects the Arrow layout of the ID and VALUE columns:
     "utf8" (32-bit offsets, the default), "large_utf8" (64-bit) or
@@ -302,318 +994,673 @@ def load_rdf_to_dataframe(path_or_fileobject, debug=False, string_type="utf8"):
     KEY and INSTANCE_ID stay dictionary-encoded regardless: consumers use
     the indices, not the value buffer layout.
 
+    max_workers > 1 parses one large document on several threads: the
+    buffer is cut on top-level object boundaries (children of rdf:RDF) into
+    up to max_workers slices of at least _MIN_CHUNK_BYTES, each slice is
+    parsed and extracted without the GIL, and the per-slice columns are
+    concatenated in document order — the same rows, in the same order, as
+    the sequential parse. Smaller documents, and documents the splitter
+    cannot cut safely, take the sequential path.
+
+    types / keys / instances push a filter into the object loop: only
+    objects of those classes (tag local names) / with those IDs (ID column
+    values) are emitted, with only those property KEYs (plus "Type").
+    Skipped objects and elements never reach the Arrow builders. The
+    Distribution / NamespaceMap rows and header objects (FullModel) are
+    always emitted whole.
+
     Special optimization: when path_or_fileobject is a str (real local filesystem path),
     the file is memory-mapped. pugixml then parses directly from the kernel page cache
     with no extra user-space copy of the full document. This makes loading from actual
     on-disk files even faster / lower memory than reading everything into Python bytes first.
     File-like objects fall back to an explicit read() + load_buffer.
     """
-    layout_py = _STRING_TYPE_LAYOUTS.get(string_type)
-    if layout_py is None:
-        raise ValueError(f"Unknown string_type: {string_type!r}. "
-                         f"Known: {', '.join(_STRING_TYPE_LAYOUTS)}")
-    cdef int layout = layout_py
+    cdef int layout = _layout(string_type)
+    cdef _Filter pushdown = _make_filter(types, keys, instances)
 
     # We import uuid here (inside the function) so the module can be imported
     # even if someone never calls the cython path. The import is cheap after
     # the first time.
     import uuid as uuid_mod
 
-    if hasattr(path_or_fileobject, "__fspath__"):
-        import os
-        path_or_fileobject = os.fspath(path_or_fileobject)  # pathlib.Path → mmap fast path
+    path_or_fileobject, file_name = _source_name(path_or_fileobject)
 
-    cdef str file_name
-    if isinstance(path_or_fileobject, str):
-        file_name = path_or_fileobject
-    else:
-        file_name = getattr(path_or_fileobject, 'name', '<file-like>')
-
-    # Debug timing and per-file identity
-    cdef object start_time
-    cdef object _dt  # lazy datetime module, only when debug=True
-    cdef object _logger = None
-    if debug:
-        import datetime as _dt_mod
-        import logging as _logging_mod
-        _dt = _dt_mod
-        _logger = _logging_mod.getLogger("triplets.parser.cython_pugixml_arrow")
-        start_time = _dt.datetime.now()
+    # Debug timing: timer(step) logs the time since the previous step
+    timer = _step_timer(file_name) if debug else _no_timer
 
     # Per-file identity (used for INSTANCE_ID column and for metadata rows).
     # We generate the UUIDs here (once per XML file) rather than on every row.
-    cdef string instance_id = str(uuid_mod.uuid4()).encode('utf-8')
+    instance_id = str(uuid_mod.uuid4())
     cdef string meta_id = str(uuid_mod.uuid4()).encode('utf-8')
     cdef string nsmap_id = str(uuid_mod.uuid4()).encode('utf-8')
-    cdef bytes file_name_bytes = file_name.encode('utf-8')
+    cdef string file_name_bytes = file_name.encode('utf-8')
 
-    # Parse XML with pugixml
-    cdef xml_document doc
-    cdef xml_parse_result result
-    cdef bytes content_bytes
-    cdef const char* buf
-    cdef size_t buf_len
-    cdef const unsigned char[::1] _mm_view
-    _mmap_keepalive = None   # keep mmap and file open while we parse + build
+    cdef size_t parts = 0
+    cdef _Buffer source = _Buffer(path_or_fileobject)   # kept open while we parse + build
+    try:
+        columns = None
+        if max_workers is not None and max_workers > 1:
+            parts = min(<size_t>max_workers, source.buf_len // _MIN_CHUNK_BYTES)
+        if parts > 1:
+            columns = _parse_split(source.buf, source.buf_len, layout, parts, max_workers,
+                                   meta_id, nsmap_id, file_name_bytes, _filter_ptr(pushdown))
+            if columns is None:
+                timer("Split failed, parsing sequentially")
+            else:
+                timer(f"Parse + extraction ({parts} slices)")
+        if columns is None:
+            columns = _parse_whole(source.buf, source.buf_len, layout, meta_id, nsmap_id,
+                                   file_name_bytes, file_name, timer, _filter_ptr(pushdown))
+        batch_py = _record_batch(columns, instance_id)
+        timer("Arrow finalize")
+        return batch_py
+    finally:
+        source.close()
+
+
+def iter_rdf_batches(path_or_fileobject, batch_rows, debug=False, string_type="utf8",
+                     types=None, keys=None, instances=None):
+    """Parse RDF XML as a stream of RecordBatches of at most batch_rows rows.
+
+    Bounded-memory counterpart of load_rdf_to_dataframe: instead of one DOM
+    for the whole document, the root content is scanned in object-aligned
+    windows (see _Stream), each parsed and extracted without the GIL, and
+    the rows are re-chunked into batches of exactly batch_rows (the last one
+    shorter). Peak memory is a window's DOM plus about two batches,
+    regardless of the document size. Concatenated, the batches hold the same
+    rows in the same order as load_rdf_to_dataframe; each batch carries its
+    own KEY dictionary. Documents without a splittable root (a self-closing
+    rdf:RDF, a DOCTYPE internal subset) are parsed whole and sliced.
+    types / keys / instances push down as in load_rdf_to_dataframe.
+    """
+    if batch_rows is None or batch_rows < 1:
+        raise ValueError(f"batch_rows must be a positive integer, got {batch_rows!r}")
+    cdef int layout = _layout(string_type)
+    cdef _Filter pushdown = _make_filter(types, keys, instances)
+    import uuid as uuid_mod
+    import pyarrow as pa
 
-    if isinstance(path_or_fileobject, str):
-        # mmap path for real local files (the optimization)
-        try:
-            f = open(path_or_fileobject, "rb")
-            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
-            _mmap_keepalive = (f, mm)
-            _mm_view = mm
-            buf = <const char*>&_mm_view[0]
-            buf_len = len(_mm_view)
-            result = doc.load_buffer(buf, buf_len, PARSE_FLAGS)
-        except Exception:
-            # fallback
-            if _mmap_keepalive is not None:
-                try:
-                    ff, mmm = _mmap_keepalive
-                    mmm.close()
-                    ff.close()
-                except Exception:
-                    pass
-            _mmap_keepalive = None
-            # fall back to read
-            with open(path_or_fileobject, "rb") as ff:
-                content_bytes = ff.read()
-            buf = content_bytes
-            buf_len = len(content_bytes)
-            result = doc.load_buffer(buf, buf_len, PARSE_FLAGS)
-    else:
-        # file-like: read into memory
-        path_or_fileobject.seek(0)
-        content = path_or_fileobject.read()
-        if isinstance(content, str):
-            content_bytes = content.encode('utf-8')
-        else:
-            content_bytes = content
-        buf = content_bytes
-        buf_len = len(content_bytes)
-        result = doc.load_buffer(buf, buf_len, PARSE_FLAGS)
+    path_or_fileobject, file_name = _source_name(path_or_fileobject)
+    timer = _step_timer(file_name) if debug else _no_timer
+    instance_id = str(uuid_mod.uuid4())
+    meta_id = str(uuid_mod.uuid4()).encode('utf-8')
+    nsmap_id = str(uuid_mod.uuid4()).encode('utf-8')
 
-    if not <bool>result:
-        raise ValueError(f"Failed to parse XML: {file_name}")
+    cdef _Buffer source = _Buffer(path_or_fileobject)
+    cdef _Stream stream
+    try:
+        stream = _Stream(source, layout, meta_id, nsmap_id, file_name.encode('utf-8'))
+        stream.filt = _filter_ptr(pushdown)
+        if not stream.splittable:
+            batch = _record_batch(_parse_whole(source.buf, source.buf_len, layout, meta_id,
+                                               nsmap_id, file_name.encode('utf-8'), file_name,
+                                               timer, _filter_ptr(pushdown)), instance_id)
+            for offset in range(0, batch.num_rows, batch_rows):
+                yield batch.slice(offset, batch_rows)
+            return
+
+        pending = [stream.header()]   # column lists not yet emitted, in document order
+        rows = len(pending[0][0])
+        done = False
+        while not done:
+            columns = stream.read(batch_rows)
+            if columns is None:
+                done = True
+            else:
+                pending.append(columns)
+                rows += len(columns[0])
+            while rows >= batch_rows or (done and rows):
+                merged = (pending[0] if len(pending) == 1 else
+                          [pa.concat_arrays([part[i] for part in pending]) for i in range(3)])
+                take = min(rows, batch_rows)
+                yield _record_batch([column.slice(0, take) for column in merged], instance_id)
+                timer(f"Batch of {take} rows")
+                rows -= take
+                pending = [[column.slice(take) for column in merged]] if rows else []
+    finally:
+        source.close()
+
+
+# ── uuid16 kernels (parse(..., id_encoding="uuid16"), see ids.py) ─────────────
+
+# ASCII → hex digit value, -1 for anything else (canonical UUIDs are
+# lowercase). A table, not comparisons: random digits defeat branch prediction
+cdef signed char _HEX_VALUES[256]
+for _c in range(256):
+    _HEX_VALUES[_c] = _c - 48 if 48 <= _c <= 57 else _c - 87 if 97 <= _c <= 102 else -1
+
+
+def pack_uuid16(const unsigned char[::1] data, const int32_t[::1] offsets,
+                unsigned char[:, ::1] packed, unsigned char[::1] is_uuid):
+    """Pack each canonical UUID string (utf8 data + offsets) into 16 bytes
+    of ``packed``; ``is_uuid`` marks the rows that were packed."""
+    cdef Py_ssize_t row, count = offsets.shape[0] - 1
+    cdef int position, byte, high, low
+    # Raw pointers: byte stores through a memoryview would alias its own
+    # descriptor and force reloads on every iteration
+    cdef const unsigned char* text = &data[0] if data.shape[0] else NULL
+    cdef const int32_t* bounds = &offsets[0]
+    cdef unsigned char* out = &packed[0, 0] if count else NULL
+    cdef unsigned char* flags = &is_uuid[0] if count else NULL
+    cdef const unsigned char* uuid
+    with nogil:
+        for row in range(count):
+            flags[row] = 0
+            if bounds[row + 1] - bounds[row] != 36:
+                continue
+            uuid = text + bounds[row]
+            if uuid[8] != 45 or uuid[13] != 45 or uuid[18] != 45 or uuid[23] != 45:
+                continue
+            position = 0
+            byte = 0
+            while byte < 16:
+                if position == 8 or position == 13 or position == 18 or position == 23:
+                    position += 1
+                high = _HEX_VALUES[uuid[position]]
+                low = _HEX_VALUES[uuid[position + 1]]
+                if (high | low) < 0:
+                    break
+                out[row * 16 + byte] = <unsigned char>(high << 4 | low)
+                byte += 1
+                position += 2
+            flags[row] = byte == 16
+
+
+def format_uuid16(const unsigned char[:, ::1] packed, const unsigned char[::1] is_uuid,
+                  const unsigned char[::1] text, const int32_t[::1] text_offsets,
+                  const int64_t[::1] offsets, unsigned char[::1] out):
+    """Write each row's string into ``out`` at ``offsets``: the UUID in
+    ``packed`` formatted back to 36 characters, else the row's text bytes."""
+    cdef Py_ssize_t row, count = offsets.shape[0] - 1
+    cdef int position, byte
+    cdef const char* digits = b"0123456789abcdef"
+    cdef const unsigned char* uuids = &packed[0, 0] if count else NULL
+    cdef const unsigned char* flags = &is_uuid[0] if count else NULL
+    cdef const unsigned char* source = &text[0] if text.shape[0] else NULL
+    cdef const int32_t* source_bounds = &text_offsets[0]
+    cdef const int64_t* bounds = &offsets[0]
+    cdef unsigned char* target = &out[0] if out.shape[0] else NULL
+    cdef unsigned char* string
+    with nogil:
+        for row in range(count):
+            string = target + bounds[row]
+            if flags[row]:
+                position = 0
+                for byte in range(16):
+                    if position == 8 or position == 13 or position == 18 or position == 23:
+                        string[position] = 45
+                        position += 1
+                    string[position] = digits[uuids[row * 16 + byte] >> 4]
+                    string[position + 1] = digits[uuids[row * 16 + byte] & 15]
+                    position += 2
+            elif bounds[row + 1] > bounds[row]:
+                memcpy(string, source + source_bounds[row], bounds[row + 1] - bounds[row])
+
+
+# ── ID interner table (id_encoding="interned", see ids.IDInterner) ───────────
+
+cdef inline uint64_t _hash_bytes(const unsigned char* text, Py_ssize_t length) noexcept nogil:
+    """Multiply-xorshift over 8-byte words (an ID is ~5 words)."""
+    cdef uint64_t hashed = 0x9E3779B97F4A7C15ULL ^ <uint64_t>length, word
+    while length >= 8:
+        memcpy(&word, text, 8)
+        hashed = (hashed ^ word) * 0xBF58476D1CE4E5B9ULL
+        hashed ^= hashed >> 31
+        text += 8
+        length -= 8
+    if length:
+        word = 0
+        memcpy(&word, text, length)
+        hashed = (hashed ^ word) * 0x94D049BB133111EBULL
+        hashed ^= hashed >> 29
+    return hashed ^ (hashed >> 32)
 
-    if debug:
-        end = _dt.datetime.now()
-        _logger.debug("[%s] XML parse: %s", file_name, end - start_time)
-        start_time = end
 
-    cdef xml_node root = doc.first_child()
+cdef extern from *:
+    void __builtin_prefetch(const void* address) nogil
 
-    # ------------------------------------------------------------------
-    # Arrow column builders (allocated on the C++ heap for the hot path)
-    # ------------------------------------------------------------------
-    # ID    : high cardinality (mostly unique) → StringColBuilder (layout-selected)
-    # KEY   : very low cardinality (~hundreds of property names + "Type")
-    #         → KeyDictBuilder (our wrapper around StringDictionary32Builder)
-    #         builds a DictionaryArray *during* the loop. No post-processing.
-    # VALUE : mixed cardinality → StringColBuilder (layout-selected)
-    # INSTANCE_ID : constant per file → deliberately *not* built in the loop.
-    #               See the post-loop construction below for why.
-    cdef CMemoryPool* pool = c_default_memory_pool()
-    cdef StringColBuilder* id_b = new StringColBuilder(pool, layout)
-    cdef KeyDictBuilder* key_b = new KeyDictBuilder(pool)
-    cdef StringColBuilder* val_b = new StringColBuilder(pool, layout)
 
-    # Namespace attribute prefixes (lengths derived from definitions, not hardcoded)
-    cdef const char* XMLNS_COLON = b"xmlns:"
-    cdef size_t XMLNS_COLON_LEN = strlen(XMLNS_COLON)
-    cdef const char* XMLNS = b"xmlns"
-    cdef size_t XMLNS_LEN = strlen(XMLNS)
-    cdef const char* XML_BASE = b"xml:base"
-    cdef size_t XML_BASE_LEN = strlen(XML_BASE)
+cdef struct _Slot:
+    uint32_t code_plus_one   # 0 = empty
+    uint32_t tag             # high hash bits: most mismatches never touch the string
 
-    # Cython requires all C/C++ declarations before the try: block
-    cdef xml_attribute attr
-    cdef const char* aname
-    cdef const char* aval
-    cdef bint has_xml_base = False
-    cdef xml_node rdf_object
-    cdef xml_node element
-    cdef const char* raw_id
-    cdef const char* tag_name
-    cdef const char* child_text
-    cdef const char* ref_val
-    cdef string_view obj_id, val_str     # string_view into the XML buffer (zero-copy after clean)
-    cdef size_t text_len, name_len
-    cdef shared_ptr[CArray] id_arr, key_arr, val_arr
-    cdef int64_t nrows
-    cdef vector[shared_ptr[CField]] fields
-    cdef shared_ptr[CSchema] schema
-    cdef vector[shared_ptr[CArray]] columns
-    cdef shared_ptr[CRecordBatch] batch
 
-    try:
-        # ── Metadata rows (only a handful per file, not performance critical) ──
-        # Thanks to the Append() overloads, we no longer need to manually
-        # write lengths or .c_str() + .size() for every call.
-        # Distribution header
-        Append(id_b, meta_id)
-        Append(key_b, b"Type")
-        Append(val_b, b"Distribution")
+# Rows hashed (and their first slot prefetched) ahead of the probes, so the
+# table's cache misses overlap instead of running one after another
+DEF _LOOKAHEAD = 16
 
-        Append(id_b, meta_id)
-        Append(key_b, b"label")
-        Append(val_b, file_name_bytes)
 
-        # NamespaceMap header
-        Append(id_b, nsmap_id)
-        Append(key_b, b"Type")
-        Append(val_b, b"NamespaceMap")
-
-        # ── Namespace declarations from root attributes ──────────────────
-        attr = root.first_attribute()
-        while not attr.empty():
-            aname = attr.name()
-            if memcmp(aname, XMLNS_COLON, XMLNS_COLON_LEN) == 0:
-                Append(id_b, nsmap_id)
-                aval = aname + XMLNS_COLON_LEN
-                Append(key_b, aval)
-                aval = attr.value()
-                Append(val_b, aval)
-            elif memcmp(aname, XMLNS, XMLNS_LEN) == 0 and aname[XMLNS_LEN] == 0:
-                Append(id_b, nsmap_id)
-                Append(key_b, b"")
-                aval = attr.value()
-                Append(val_b, aval)
-            elif memcmp(aname, XML_BASE, XML_BASE_LEN) == 0:
-                Append(id_b, nsmap_id)
-                Append(key_b, b"xml_base")
-                aval = attr.value()
-                Append(val_b, aval)
-                has_xml_base = True
-            attr = attr.next_attribute()
-
-        if not has_xml_base:
-            Append(id_b, nsmap_id)
-            Append(key_b, b"xml_base")
-            Append(val_b, file_name_bytes)
-
-        # ── RDF objects (the hot loop — every row is processed here) ──────
-        # We deliberately avoid:
-        #   - appending the same INSTANCE_ID string millions of times
-        #   - using std::string for the high-frequency KEY column (use KeyDictBuilder instead)
-        #   - Python objects or GIL
-        rdf_object = root.first_child()
-        while not rdf_object.empty():
-
-            # Choose best ID source (rdf:ID > rdf:about > rdf:nodeID)
-            raw_id_ptr = rdf_object.attribute(b"rdf:ID").value()
-            if raw_id_ptr[0] == 0:
-                raw_id_ptr = rdf_object.attribute(b"rdf:about").value()
-            if raw_id_ptr[0] == 0:
-                raw_id_ptr = rdf_object.attribute(b"rdf:nodeID").value()
-
-            if raw_id_ptr[0] != 0:
-                raw_len = strlen(raw_id_ptr)
-                obj_id = clean_id(string_view(raw_id_ptr, raw_len))
-            else:
-                obj_id = string_view()
+cdef class StringCodes:
+    """string → code open-addressing table behind ids.IDInterner.
 
-            # "Type" row for this object
-            tag_name = local_name(rdf_object.name())
-            Append(id_b, obj_id.data(), <int>obj_id.size())
-            Append(key_b, b"Type")
-            name_len = strlen(tag_name)
-            Append(val_b, tag_name, <int>name_len)
+    The strings are not copied: code i is bytes ``data[offsets[i]:offsets[i+1]]``
+    of the interner's own large_string array, which adopt() points the table
+    at after each growth. Strings added by codes() are read from the caller's
+    input until then. 8 bytes per slot (load factor <= 0.7) plus each code's
+    hash for growth; never rebuilt between calls — a lookup costs the new
+    rows, not the interner's size.
+    """
+    cdef vector[_Slot] _slots
+    cdef vector[uint64_t] _hashes     # per code
+    cdef uint64_t _mask
+    cdef const unsigned char* _data
+    cdef const int64_t* _offsets
+    cdef Py_ssize_t _adopted
+    cdef vector[const unsigned char*] _pending   # added since adopt(): input pointers
+    cdef vector[int64_t] _pending_lengths
+    cdef object _owner
+
+    def __cinit__(self):
+        self._slots.resize(1 << 16)
+        self._mask = (1 << 16) - 1
+        self._adopted = 0
+
+    def __len__(self):
+        return self._hashes.size()
+
+    cdef inline const unsigned char* _string(self, Py_ssize_t code, int64_t* length) noexcept nogil:
+        if code < self._adopted:
+            length[0] = self._offsets[code + 1] - self._offsets[code]
+            return self._data + self._offsets[code]
+        length[0] = self._pending_lengths[code - self._adopted]
+        return self._pending[code - self._adopted]
+
+    cdef void _grow(self) noexcept nogil:
+        cdef size_t code, size = self._slots.size() * 2
+        cdef uint64_t slot
+        self._slots.assign(size, _Slot(0, 0))
+        self._mask = size - 1
+        for code in range(self._hashes.size()):
+            slot = self._hashes[code] & self._mask
+            while self._slots[slot].code_plus_one:
+                slot = (slot + 1) & self._mask
+            self._slots[slot] = _Slot(<uint32_t>(code + 1), <uint32_t>(self._hashes[code] >> 32))
+
+    def codes(self, const unsigned char[::1] data, const int64_t[::1] offsets,
+              const unsigned char[::1] mode, int64_t[::1] out, int64_t[::1] added):
+        """Each row's code into ``out``. ``mode`` per row: 0 skips it (null,
+        -1), 1 looks the string up (-1 when unknown), 2 adds it when unknown.
+        Rows whose string was added are written to ``added``; returns their
+        count. Call adopt() before the input is released."""
+        cdef Py_ssize_t row, block, stop, count = offsets.shape[0] - 1, new = 0
+        cdef const unsigned char* text = &data[0] if data.shape[0] else <const unsigned char*>b""
+        cdef const int64_t* bounds = &offsets[0]
+        cdef const unsigned char* modes = &mode[0] if count else NULL
+        cdef int64_t* codes = &out[0] if count else NULL
+        cdef int64_t* first = &added[0] if count else NULL
+        cdef const unsigned char* string
+        cdef const unsigned char* known
+        cdef int64_t length, known_length, code
+        cdef uint64_t hashes[_LOOKAHEAD]
+        cdef uint64_t hashed, slot
+        cdef uint32_t tag
+        if len(self) + count >= 1 << 32:
+            raise OverflowError("StringCodes holds at most 2**32 - 1 strings")
+        with nogil:
+            for block in range(0, count, _LOOKAHEAD):
+                stop = min(block + _LOOKAHEAD, count)
+                for row in range(block, stop):
+                    length = bounds[row + 1] - bounds[row]
+                    hashes[row - block] = _hash_bytes(text + bounds[row], length)
+                    __builtin_prefetch(&self._slots[hashes[row - block] & self._mask])
+                for row in range(block, stop):
+                    if not modes[row]:
+                        codes[row] = -1
+                        continue
+                    string = text + bounds[row]
+                    length = bounds[row + 1] - bounds[row]
+                    # Rows of one object repeat its ID: reuse the previous row's code
+                    if (row and modes[row - 1] and codes[row - 1] >= 0
+                            and length == bounds[row] - bounds[row - 1]
+                            and memcmp(string, text + bounds[row - 1], length) == 0):
+                        codes[row] = codes[row - 1]
+                        continue
+                    hashed = hashes[row - block]
+                    tag = <uint32_t>(hashed >> 32)
+                    slot = hashed & self._mask
+                    code = -1
+                    while self._slots[slot].code_plus_one:
+                        if self._slots[slot].tag == tag:
+                            known = self._string(self._slots[slot].code_plus_one - 1, &known_length)
+                            if known_length == length and memcmp(known, string, length) == 0:
+                                code = self._slots[slot].code_plus_one - 1
+                                break
+                        slot = (slot + 1) & self._mask
+                    if code < 0 and modes[row] == 2:
+                        code = self._hashes.size()
+                        self._hashes.push_back(hashed)
+                        self._pending.push_back(string)
+                        self._pending_lengths.push_back(length)
+                        self._slots[slot] = _Slot(<uint32_t>(code + 1), tag)
+                        first[new] = row
+                        new += 1
+                        if (code + 1) * 10 > <int64_t>self._slots.size() * 7:
+                            self._grow()
+                    codes[row] = code
+        return new
+
+    def adopt(self, owner, const unsigned char[::1] data, const int64_t[::1] offsets):
+        """Point the table at the interner's strings (data + offsets, one
+        entry per code, ``owner`` kept alive); the pending strings must be
+        at their codes by now."""
+        if offsets.shape[0] - 1 != len(self):
+            raise ValueError("adopt() needs one string per code")
+        self._owner = owner
+        self._data = &data[0] if data.shape[0] else <const unsigned char*>b""
+        self._offsets = &offsets[0]
+        self._adopted = offsets.shape[0] - 1
+        self._pending.clear()
+        self._pending_lengths.clear()
+
+
+# ── N-Quads / N-Triples → triplet columns (see parser.nquads) ────────────────
+
+cdef extern from * nogil:
+    """
+    #include <stdexcept>
+    #include "string_column.h"
 
-            # All property rows for this object
-            element = rdf_object.first_child()
-            while not element.empty():
-                tag_name = local_name(element.name())
-                name_len = strlen(tag_name)
+    // The inverse of the N-Quads export conventions, as parser/nquads.py
+    // terms_to_triplets applies them with pandas string ops: IRIs lose <>,
+    // then a leading _:, urn:uuid: and the CIM namespace; rdf:type → Type;
+    // literals keep their lexical form (escapes decoded, ^^<datatype> and
+    // @lang dropped); bare (turtle shorthand) terms pass through.
+    static const std::string_view NQ_RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>";
 
-                Append(id_b, obj_id.data(), <int>obj_id.size())
-                Append(key_b, tag_name, <int>name_len)
+    static inline bool nq_space(char c) { return c == ' ' || c == '\\t' || c == '\\r'; }
 
-                # Value is either text content or an rdf:resource / rdf:nodeID reference
-                child_text = element.child_value()
-                text_len = strlen(child_text)
+    static inline std::string_view nq_strip(std::string_view term, std::string_view prefix) {
+        return term.substr(0, prefix.size()) == prefix ? term.substr(prefix.size()) : term;
+    }
 
-                if text_len > 0:
-                    Append(val_b, child_text, <int>text_len)
-                else:
-                    ref_val = element.attribute(b"rdf:resource").value()
-                    if ref_val[0] == 0:
-                        ref_val = element.attribute(b"rdf:nodeID").value()
+    static inline std::string_view nq_iri(std::string_view term, std::string_view cim_ns) {
+        if (term.size() >= 2 && term.front() == '<' && term.back() == '>') term = term.substr(1, term.size() - 2);
+        return nq_strip(nq_strip(nq_strip(term, "_:"), "urn:uuid:"), cim_ns);
+    }
 
-                    if ref_val[0] != 0:
-                        ref_len = strlen(ref_val)
-                        val_str = clean_ref_value(string_view(ref_val, ref_len))
-                        Append(val_b, val_str.data(), <int>val_str.size())
-                    else:
-                        Append(val_b, b"")
+    static inline int nq_hex(char c) {
+        if (c >= '0' && c <= '9') return c - '0';
+        if (c >= 'a' && c <= 'f') return c - 'a' + 10;
+        if (c >= 'A' && c <= 'F') return c - 'A' + 10;
+        return -1;
+    }
 
-                element = element.next_sibling()
+    static void nq_utf8(std::string& out, uint32_t cp) {
+        if (cp < 0x80) {
+            out += (char)cp;
+        } else if (cp < 0x800) {
+            out += (char)(0xC0 | cp >> 6);
+            out += (char)(0x80 | (cp & 0x3F));
+        } else if (cp < 0x10000) {
+            out += (char)(0xE0 | cp >> 12);
+            out += (char)(0x80 | (cp >> 6 & 0x3F));
+            out += (char)(0x80 | (cp & 0x3F));
+        } else {
+            out += (char)(0xF0 | cp >> 18);
+            out += (char)(0x80 | (cp >> 12 & 0x3F));
+            out += (char)(0x80 | (cp >> 6 & 0x3F));
+            out += (char)(0x80 | (cp & 0x3F));
+        }
+    }
 
-            rdf_object = rdf_object.next_sibling()
-
-        if debug:
-            end = _dt.datetime.now()
-            _logger.debug("[%s] Extraction: %s", file_name, end - start_time)
-            start_time = end
-
-        # ── Build Arrow RecordBatch ──────────────────────────────────────
-        id_b.Finish(&id_arr)
-        key_b.Finish(&key_arr)      # already dictionary-encoded via KeyDictBuilder (int32 indices)
-        val_b.Finish(&val_arr)
-
-        nrows = id_arr.get().length()
-
-        # Wrap the three C++-built arrays (ID, KEY dict, VALUE) into pyarrow objects.
-        # We use the low-level pyarrow_wrap_array so we stay zero-copy from the
-        # StringColBuilder / KeyDictBuilder data.
-        id_col = pyarrow_wrap_array(id_arr)
-        key_col = pyarrow_wrap_array(key_arr)
-        val_col = pyarrow_wrap_array(val_arr)
-
-        # INSTANCE_ID is a constant value repeated for every row in this file.
-        # We deliberately did *not* append it N times in the hot loop (that was the
-        # big win for cat=ON). Instead we construct a minimal DictionaryArray here:
-        #   - one dictionary entry (the UUID string)
-        #   - an indices array of all zeros (size = nrows)
-        #
-        # Using numpy + pa.DictionaryArray.from_arrays is fast for this "constant
-        # column" case because the heavy lifting (1.14M string appends) was avoided.
-        # This small Python-side construction happens only once per XML file.
-        import pyarrow as pa
-        inst_dict = pa.array([instance_id.decode('utf-8')])
-        inst_indices = pa.repeat(pa.scalar(0, type=pa.int32()), nrows)
-        inst_col = pa.DictionaryArray.from_arrays(inst_indices, inst_dict)
-
-        batch_py = pa.RecordBatch.from_arrays(
-            [id_col, key_col, val_col, inst_col],
-            names=["ID", "KEY", "VALUE", "INSTANCE_ID"],
-        )
-
-        if debug:
-            end = _dt.datetime.now()
-            _logger.debug("[%s] Arrow finalize: %s", file_name, end - start_time)
+    // \\uXXXX / \\UXXXXXXXX, \\n \\r \\t \\b \\f, and \\c → c for anything else
+    static void nq_unescape(std::string_view body, std::string& out) {
+        out.clear();
+        for (size_t i = 0; i < body.size(); ++i) {
+            if (body[i] != '\\\\' || i + 1 == body.size()) {
+                out += body[i];
+                continue;
+            }
+            char escape = body[++i];
+            size_t digits = escape == 'u' ? 4 : escape == 'U' ? 8 : 0;
+            uint32_t cp = 0;
+            for (size_t d = 1; d <= digits; ++d) {
+                int value = i + d < body.size() ? nq_hex(body[i + d]) : -1;
+                if (value < 0) { digits = 0; break; }
+                cp = cp << 4 | (uint32_t)value;
+            }
+            if (digits) {
+                nq_utf8(out, cp);
+                i += digits;
+                continue;
+            }
+            switch (escape) {
+                case 'n': out += '\\n'; break;
+                case 'r': out += '\\r'; break;
+                case 't': out += '\\t'; break;
+                case 'b': out += '\\b'; break;
+                case 'f': out += '\\f'; break;
+                default: out += escape;
+            }
+        }
+    }
 
-        return batch_py
+    // Triplet value of an object term; unescaped literals go through scratch
+    static std::string_view nq_value(std::string_view term, std::string_view cim_ns, std::string& scratch) {
+        if (term.empty() || term[0] != '"') return nq_iri(term, cim_ns);
+        size_t close = 1;
+        while (close < term.size() && term[close] != '"') close += term[close] == '\\\\' ? 2 : 1;
+        std::string_view body = term.substr(1, std::min(close, term.size()) - 1);
+        if (body.find('\\\\') == std::string_view::npos) return body;
+        nq_unescape(body, scratch);
+        return scratch;
+    }
 
+    // One past the term starting at p (a literal with its suffix, an <IRI>,
+    // or a space-free token); nullptr when a literal or IRI is unterminated
+    static const char* nq_term_end(const char* p, const char* end) {
+        if (*p == '"') {
+            for (++p; p < end && *p != '"'; p += *p == '\\\\' ? 2 : 1) {}
+            if (p >= end) return nullptr;
+            ++p;
+            if (p < end && *p == '@') {
+                for (++p; p < end && (isalnum((unsigned char)*p) || *p == '-'); ++p) {}
+            } else if (end - p >= 3 && p[0] == '^' && p[1] == '^' && p[2] == '<') {
+                const char* close = (const char*)memchr(p + 3, '>', end - p - 3);
+                if (close == nullptr) return nullptr;
+                p = close + 1;
+            }
+            return p;
+        }
+        if (*p == '<') {
+            const char* close = (const char*)memchr(p, '>', end - p);
+            return close ? close + 1 : nullptr;
+        }
+        while (p < end && !nq_space(*p)) ++p;
+        return p;
+    }
+
+    static inline void nq_check(const arrow::Status& status) {
+        if (!status.ok()) throw std::runtime_error(status.ToString());
+    }
+
+    static inline void nq_append(StringColBuilder* b, std::string_view value) {
+        nq_check(b->Append(value.data(), (int)value.size()));
+    }
+
+    static inline void nq_append(KeyDictBuilder* b, std::string_view value) {
+        nq_check(b->Append(value.data(), (int)value.size()));
+    }
+
+    static inline void nq_append_triple(std::string_view subject, std::string_view predicate,
+                                        std::string_view object, std::string_view cim_ns, std::string& scratch,
+                                        StringColBuilder* id_b, KeyDictBuilder* key_b, StringColBuilder* val_b) {
+        nq_append(id_b, nq_iri(subject, cim_ns));
+        nq_append(key_b, predicate == NQ_RDF_TYPE ? std::string_view("Type") : nq_iri(predicate, cim_ns));
+        nq_append(val_b, nq_value(object, cim_ns, scratch));
+    }
+
+    // Tokenize the lines of buf[0, len) into the builders (graph → INSTANCE_ID,
+    // null for N-Triples lines). Blank and # comment lines are skipped.
+    // Returns -1, or the offset of the first line that is not a quad / triple.
+    static int64_t nq_read(const char* buf, size_t len, std::string_view cim_ns, StringColBuilder* id_b,
+                           KeyDictBuilder* key_b, StringColBuilder* val_b, KeyDictBuilder* graph_b) {
+        std::string scratch;
+        const char* stop = buf + len;
+        for (const char* line = buf; line < stop;) {
+            const char* newline = (const char*)memchr(line, '\\n', stop - line);
+            const char* end = newline ? newline : stop;
+            const char* next = newline ? newline + 1 : stop;
+            const char* p = line;
+            while (p < end && nq_space(*p)) ++p;
+            if (p == end || *p == '#') {
+                line = next;
+                continue;
+            }
+            std::string_view terms[4];
+            int count = 0;
+            bool closed = false;
+            while (p < end) {
+                if (*p == '.') {   // the statement's end: only whitespace may follow
+                    for (++p; p < end && nq_space(*p); ++p) {}
+                    closed = p == end;
+                    break;
+                }
+                const char* term_end = count < 4 ? nq_term_end(p, end) : nullptr;
+                if (term_end == nullptr || term_end == p) break;
+                if (term_end == end && term_end[-1] == '.' && term_end - p > 1 && *p != '"' && *p != '<') {
+                    terms[count++] = std::string_view(p, term_end - 1 - p);   // a token glued to the '.'
+                    closed = true;
+                    break;
+                }
+                terms[count++] = std::string_view(p, term_end - p);
+                p = term_end;
+                if (p < end && !nq_space(*p) && *p != '.') break;
+                while (p < end && nq_space(*p)) ++p;
+            }
+            if (!closed || count < 3 || (count == 4 && terms[3][0] != '<' && nq_strip(terms[3], "_:") == terms[3])) {
+                return line - buf;
+            }
+            nq_append_triple(terms[0], terms[1], terms[2], cim_ns, scratch, id_b, key_b, val_b);
+            if (count == 4) {
+                nq_append(graph_b, nq_iri(terms[3], cim_ns));
+            } else {
+                nq_check(graph_b->AppendNull());
+            }
+            line = next;
+        }
+        return -1;
+    }
+
+    // N-Triples-form term columns (e.g. a SPARQL CONSTRUCT result) → the
+    // same conversion, row by row. Any string layout, dictionary-encoded or not.
+    static void nq_convert_terms(std::shared_ptr<arrow::Array> subjects, std::shared_ptr<arrow::Array> predicates,
+                                 std::shared_ptr<arrow::Array> objects, std::string_view cim_ns,
+                                 StringColBuilder* id_b, KeyDictBuilder* key_b, StringColBuilder* val_b) {
+        using triplets_arrow::StringColumn;
+        StringColumn ids = StringColumn::resolve(subjects, "ID");
+        StringColumn keys = StringColumn::resolve(predicates, "KEY");
+        StringColumn values = StringColumn::resolve(objects, "VALUE");
+        std::string scratch;
+        for (int64_t row = 0; row < subjects->length(); ++row) {
+            nq_append_triple(ids.value(row), keys.value(row), values.value(row), cim_ns, scratch,
+                             id_b, key_b, val_b);
+        }
+    }
+    """
+    int64_t nq_read(const char* buf, size_t len, string_view cim_ns, StringColBuilder* id_b,
+                    KeyDictBuilder* key_b, StringColBuilder* val_b, KeyDictBuilder* graph_b) except +
+    void nq_convert_terms(shared_ptr[CArray] subjects, shared_ptr[CArray] predicates,
+                          shared_ptr[CArray] objects, string_view cim_ns, StringColBuilder* id_b,
+                          KeyDictBuilder* key_b, StringColBuilder* val_b) except +
+
+
+# Bytes per N-Quads block before the first batch_rows estimate
+DEF _NQ_BLOCK_BYTES = 64 << 20
+
+
+cdef object _nquads_block(_Buffer source, size_t begin, size_t end, string cim_ns):
+    """RecordBatch [ID, KEY, VALUE, INSTANCE_ID] of the lines in buf[begin:end]."""
+    import pyarrow as pa
+    cdef CMemoryPool* pool = c_default_memory_pool()
+    cdef StringColBuilder* id_b = new StringColBuilder(pool, 0)
+    cdef KeyDictBuilder* key_b = new KeyDictBuilder(pool)
+    cdef StringColBuilder* val_b = new StringColBuilder(pool, 0)
+    cdef KeyDictBuilder* graph_b = new KeyDictBuilder(pool)
+    cdef shared_ptr[CArray] graph_arr
+    cdef int64_t bad
+    try:
+        with nogil:
+            bad = nq_read(source.buf + begin, end - begin, string_view(cim_ns.data(), cim_ns.size()),
+                          id_b, key_b, val_b, graph_b)
+        if bad >= 0:
+            line = source.buf[begin + bad:end].split(b"\n", 1)[0]
+            raise ValueError(f"not N-Quads: {line.decode('utf-8', 'replace')[:200]!r}")
+        columns = _finish_columns(id_b, key_b, val_b)
+        graph_b.Finish(&graph_arr)
+    finally:
+        del id_b
+        del key_b
+        del val_b
+        del graph_b
+    return pa.RecordBatch.from_arrays(columns + [pyarrow_wrap_array(graph_arr)],
+                                      names=["ID", "KEY", "VALUE", "INSTANCE_ID"])
+
+
+def iter_nquads_batches(path_or_fileobject, bytes cim_ns, batch_rows=None):
+    """Tokenize N-Quads / N-Triples into RecordBatches [ID, KEY, VALUE,
+    INSTANCE_ID] (KEY / INSTANCE_ID dictionary-encoded per batch), one per
+    block of whole lines — about ``batch_rows`` rows each, else 64 MB of
+    text. A path is memory-mapped; the GIL is released while tokenizing."""
+    cdef _Buffer source = _Buffer(_source_name(path_or_fileobject)[0])
+    cdef size_t cursor = 0, stop, block = _NQ_BLOCK_BYTES
+    cdef const char* newline
+    if batch_rows is not None:
+        block = max(<size_t>batch_rows * 128, 4096)   # ~a CGMES quad; refined per block
+    try:
+        while cursor < source.buf_len:
+            stop = source.buf_len
+            if source.buf_len - cursor > block:
+                newline = <const char*>memchr(source.buf + cursor + block, 10, source.buf_len - cursor - block)
+                if newline != NULL:
+                    stop = newline + 1 - source.buf
+            batch = _nquads_block(source, cursor, stop, cim_ns)
+            if batch_rows is not None and batch.num_rows:
+                block = max((stop - cursor) * <size_t>batch_rows // <size_t>batch.num_rows, 1)
+            cursor = stop
+            yield batch
+    finally:
+        source.close()
+
+
+def nquads_terms_to_batch(subjects, predicates, objects, bytes cim_ns):
+    """N-Triples-form term arrays → RecordBatch [ID, KEY, VALUE, INSTANCE_ID]
+    (INSTANCE_ID null: a constructed graph has no source instance)."""
+    import pyarrow as pa
+    cdef CMemoryPool* pool = c_default_memory_pool()
+    cdef StringColBuilder* id_b = new StringColBuilder(pool, 0)
+    cdef KeyDictBuilder* key_b = new KeyDictBuilder(pool)
+    cdef StringColBuilder* val_b = new StringColBuilder(pool, 0)
+    cdef shared_ptr[CArray] subject_arr = pyarrow_unwrap_array(subjects)
+    cdef shared_ptr[CArray] predicate_arr = pyarrow_unwrap_array(predicates)
+    cdef shared_ptr[CArray] object_arr = pyarrow_unwrap_array(objects)
+    cdef string namespace = cim_ns
+    try:
+        with nogil:
+            nq_convert_terms(subject_arr, predicate_arr, object_arr,
+                             string_view(namespace.data(), namespace.size()), id_b, key_b, val_b)
+        columns = _finish_columns(id_b, key_b, val_b)
     finally:
         del id_b
         del key_b
         del val_b
+    return pa.RecordBatch.from_arrays(columns + [pa.nulls(len(columns[0]), pa.string())],
+                                      names=["ID", "KEY", "VALUE", "INSTANCE_ID"])
 
-        # Always release mmap resources (even on exception paths).
-        # We kept the reference in _mmap_keepalive so the memory stayed valid
-        # during pugixml load + our walking + Arrow builder appends.
-        if _mmap_keepalive is not None:
-            f, mm = _mmap_keepalive
-            try:
-                mm.close()
-            except Exception:
-                pass
-            try:
-                f.close()
-            except Exception:
-                pass
+
+def _no_timer(step):
+    pass
 
 
+def _step_timer(file_name):
+    """Debug timer: each call logs the time since the previous one."""
+    import datetime
+    import logging
+    logger = logging.getLogger("triplets.parser.cython_pugixml_arrow")
+    last = [datetime.datetime.now()]
 
+    def timer(step):
+        now = datetime.datetime.now()
+        logger.debug("[%s] %s: %s", file_name, step, now - last[0])
+        last[0] = now
+    return timer
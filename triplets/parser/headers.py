@@ -0,0 +1,213 @@
+"""Header scan — the model header of CIM files without parsing them.
+
+scan_headers reads each XML file / zip member only up to the end of its
+model header (``md:FullModel`` in CGMES 2.4 / 3.0, ``dcat:Dataset`` in the
+newer header) and stops at the first other object, so cataloguing a
+directory of models costs a few KB per file: zip members are inflated by
+zipfile's streaming reader only as far as they are read, compressed files
+likewise. libxml2's pull parser tokenizes the chunks.
+
+Both header vocabularies map onto one row per file:
+
+========================  ==========================  =====================
+column                    md:FullModel                dcat:Dataset
+========================  ==========================  =====================
+ID                        rdf:about                   rdf:about
+profile (list)            Model.profile               dcterms:conformsTo
+keyword                   (from Model.profile)        dcat:keyword
+scenarioTime              Model.scenarioTime          dcat:startDate
+created                   Model.created               dcterms:issued
+version                   Model.version               owl:versionInfo
+modelingAuthoritySet      Model.modelingAuthoritySet  dcterms:publisher
+DependentOn (list)        Model.DependentOn           dcterms:requires
+Supersedes (list)         Model.Supersedes            dcterms:replaces
+========================  ==========================  =====================
+
+The CGMES 2.4 header has no keyword; it is derived from the profile URIs
+with the export's PROFILE_URL_MAP ("EquipmentCore" → "EQ"). IDs in ID /
+DependentOn / Supersedes are cleaned like the parser's (``urn:uuid:``
+stripped). Files without a header get a row with only source, file and size.
+
+``parse(..., header_filter=...)`` scans the same way and skips files whose
+header does not match, before their content is loaded (see :func:`matches`).
+"""
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import RDF_ABOUT, RDF_ID, RDF_RESOURCE, _iter_sources, clean_ID
+
+logger = logging.getLogger(__name__)
+
+HEADER_COLUMNS = ("source", "file", "size", "fingerprint", "ID", "header", "profile", "keyword",
+                  "scenarioTime", "created", "version", "modelingAuthoritySet", "DependentOn", "Supersedes")
+
+# header element local name → property local name → column
+_HEADER_TYPES = ("FullModel", "Dataset")
+_PROPERTIES = {
+    "Model.profile": "profile", "conformsTo": "profile",
+    "keyword": "keyword",
+    "Model.scenarioTime": "scenarioTime", "startDate": "scenarioTime",
+    "Model.created": "created", "issued": "created",
+    "Model.version": "version", "versionInfo": "version",
+    "Model.modelingAuthoritySet": "modelingAuthoritySet", "publisher": "modelingAuthoritySet",
+    "Model.DependentOn": "DependentOn", "requires": "DependentOn",
+    "Model.Supersedes": "Supersedes", "replaces": "Supersedes",
+}
+_LISTS = ("profile", "DependentOn", "Supersedes")
+_REFERENCES = ("DependentOn", "Supersedes")
+
+# Bytes fed to the pull parser per read — headers are a few KB
+_CHUNK = 16 << 10
+
+
+def scan_headers(list_of_paths_to_zip_globalzip_xml, max_workers=None, return_type="pandas", debug=False):
+    """Model headers of CIM RDF/XML files, one row per file.
+
+    Parameters
+    ----------
+    list_of_paths_to_zip_globalzip_xml : str, Path, file-like or list
+        The inputs of :func:`triplets.parser.parse` — .xml / .rdf files,
+        compressed files, zips (nested zips included).
+    max_workers : int, optional
+        Scan that many files at once on a thread pool (zip member inflation
+        and file reads release the GIL).
+    return_type : str, default "pandas"
+        "pandas", "polars", or "arrow" (list columns as ``list<string>``).
+
+    Returns
+    -------
+    Table with :data:`HEADER_COLUMNS`: source (stable label, as in
+    :func:`triplets.parser.reparse`), file (member / file name), size (bytes;
+    uncompressed for zip members), fingerprint, the header ID and ``header``
+    type ("FullModel" / "Dataset", None without one), then the fields of the
+    table in the module docstring.
+    """
+    sources = list(_iter_sources(list_of_paths_to_zip_globalzip_xml, debug=debug))
+    scan = lambda entry: _scan_one(entry[0], entry[1], entry[3])  # noqa: E731
+    if max_workers and len(sources) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(scan, sources))
+    else:
+        rows = [scan(entry) for entry in sources]
+    return _to_table(rows, return_type)
+
+
+def matches(header, header_filter):
+    """Whether one scanned header row passes header_filter.
+
+    header_filter is a callable taking the row dict, or a dict of
+    column → condition, all of which must hold: a ``(start, end)`` tuple is
+    an inclusive range (ISO timestamps compare as text; either end may be
+    None), a list / set the allowed values, anything else the one allowed
+    value. For the list columns (profile, DependentOn, Supersedes) one
+    matching element is enough; ``"profile"`` also matches the keyword, so
+    ``{"profile": ["EQ", "SSH"]}`` works for both header vocabularies.
+    """
+    if callable(header_filter):
+        return bool(header_filter(header))
+    for column, condition in header_filter.items():
+        if column not in HEADER_COLUMNS:
+            raise ValueError(f"header_filter column must be one of {HEADER_COLUMNS}, got {column!r}")
+        values = header.get(column)
+        values = list(values or ()) if column in _LISTS else [values]
+        if column == "profile":
+            values.append(header.get("keyword"))
+        values = [value for value in values if value is not None]
+        if isinstance(condition, tuple):
+            start, end = condition
+            ok = any((start is None or value >= start) and (end is None or value <= end) for value in values)
+        elif isinstance(condition, (list, set, frozenset)):
+            ok = any(value in condition for value in values)
+        else:
+            ok = condition in values
+        if not ok:
+            return False
+    return True
+
+
+def _scan_one(source, fingerprint, head):
+    """Header row of one source; head() → (stream or str path, size)."""
+    from pathlib import PurePosixPath
+    row = dict.fromkeys(HEADER_COLUMNS)
+    row.update(source=source, file=PurePosixPath(source.replace("\\", "/").rsplit("!", 1)[-1]).name,
+               fingerprint=fingerprint)
+    for column in _LISTS:
+        row[column] = []
+    try:
+        stream, row["size"] = head()
+        row.update(_read_header(stream))
+    except Exception as error:   # unreadable member / not XML — still catalogued
+        logger.warning("Header scan failed for %s: %s", source, error)
+    if row["keyword"] is None and row["profile"]:
+        row["keyword"] = _keyword(row["profile"])
+    return row
+
+
+def _read_header(stream):
+    """Header fields of the document in stream, read up to its first other object."""
+    from lxml import etree
+    with open(stream, "rb") if isinstance(stream, str) else stream as file:
+        return _pull_header(etree, file)
+
+
+def _pull_header(etree, stream):
+    parser = etree.XMLPullParser(events=("start", "end"), remove_comments=True, resolve_entities=False)
+    fields, depth, header = {}, 0, None
+    while chunk := stream.read(_CHUNK):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                depth += 1
+                if depth == 2:
+                    if _local(element.tag) not in _HEADER_TYPES or header is not None:
+                        return fields   # first non-header object (or a second header): done
+                    header = element
+                    about = element.get(RDF_ABOUT) or element.get(RDF_ID)
+                    fields.update(header=_local(element.tag), ID=clean_ID(about) if about else None)
+                continue
+            depth -= 1
+            if depth == 2:
+                column = _PROPERTIES.get(_local(element.tag))
+                if column is not None:
+                    value = element.get(RDF_RESOURCE) if element.get(RDF_RESOURCE) is not None else element.text
+                    value = value.strip() if value else value
+                    if column in _REFERENCES and value:
+                        value = clean_ID(value)
+                    if column in _LISTS:
+                        fields.setdefault(column, []).append(value)
+                    else:
+                        fields.setdefault(column, value)
+            elif depth == 1:
+                return fields   # header closed
+    return fields
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _keyword(profiles):
+    """Short profile name ("EQ") of CGMES 2.4 Model.profile URIs, or None."""
+    from ..export.cimxml_utils import PROFILE_URL_MAP
+    for profile in profiles:
+        for url_part, section in PROFILE_URL_MAP.items():
+            if url_part in (profile or ""):
+                return section
+    return None
+
+
+def _to_table(rows, return_type):
+    if return_type == "pandas":
+        import pandas
+        return pandas.DataFrame(rows, columns=list(HEADER_COLUMNS))
+    if return_type not in ("arrow", "polars"):
+        raise ValueError(f"return_type must be 'pandas', 'polars' or 'arrow', got {return_type!r}")
+    import pyarrow as pa
+    schema = pa.schema([(column, pa.list_(pa.string()) if column in _LISTS
+                         else pa.int64() if column == "size" else pa.string()) for column in HEADER_COLUMNS])
+    table = pa.Table.from_pylist(rows, schema=schema)
+    if return_type == "polars":
+        import polars
+        return polars.from_arrow(table)
+    return table
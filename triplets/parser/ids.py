@@ -0,0 +1,363 @@
+"""Compact UUID identifiers — ``parse(..., id_encoding="uuid16")``.
+
+Most CGMES IDs, and most reference VALUEs, are canonical UUID strings: 36
+characters plus a 4-byte offset per row. The uuid16 layout stores them as
+16 raw bytes instead:
+
+    ID          fixed_size_binary(16)  the UUID, null for other identifiers
+    ID_TEXT     string                 the identifier when it is not a UUID
+    KEY         (unchanged)
+    VALUE       string                 the value when it is not a UUID
+    VALUE_UUID  fixed_size_binary(16)  the UUID a reference VALUE points to
+    INSTANCE_ID (unchanged)
+
+Only canonical lowercase UUIDs (8-4-4-4-12 hex digits) are packed, so
+:func:`decode_ids` restores the exact original text. Packed columns join and
+filter as plain fixed-width keys (``table.join(..., keys="ID",
+right_keys="VALUE_UUID")``); decode at export / display boundaries — the
+triplet tools and exporters expect the text layout.
+
+``id_encoding="interned"`` instead maps every ID, and every reference
+VALUE, to an int64 code of an :class:`IDInterner`:
+
+    ID          int64   the ID's code
+    KEY         (unchanged)
+    VALUE       string  the value when it is not a reference
+    VALUE_ID    int64   the code of the object a reference VALUE points to
+    INSTANCE_ID (unchanged)
+
+A VALUE is a reference when it names an ID the interner knows, or is a
+canonical UUID (so a reference to an object another dataset will bring, e.g.
+a boundary node, gets its code now). Datasets parsed with the same interner
+(the process-wide :func:`default_interner` unless one is passed) share the
+codes: references between separately loaded models are integer joins
+(``igm.merge(boundary, left_on="VALUE_ID", right_on="ID")``), and each ID
+string is stored once, in the interner.
+"""
+import threading
+
+import numpy
+
+TEXT_COLUMNS = ("ID", "KEY", "VALUE", "INSTANCE_ID")
+UUID_COLUMNS = ("ID", "ID_TEXT", "KEY", "VALUE", "VALUE_UUID", "INSTANCE_ID")
+INTERNED_COLUMNS = ("ID", "KEY", "VALUE", "VALUE_ID", "INSTANCE_ID")
+
+_GROUPS = ((0, 8), (9, 13), (14, 18), (19, 23), (24, 36))   # hex digit runs between the dashes
+_DASHES = [8, 13, 18, 23]
+_HEX = b"0123456789abcdef"
+# two ASCII hex digits (read as one little-endian uint16) → byte value, 0xFFFF
+# when either is not a lowercase hex digit; and the reverse table
+_PAIR_VALUES = numpy.full(1 << 16, 0xFFFF, numpy.uint16)
+_PAIR_VALUES[[_HEX[i >> 4] | _HEX[i & 15] << 8 for i in range(256)]] = numpy.arange(256)
+_HEX_PAIRS = numpy.array([_HEX[i >> 4] | _HEX[i & 15] << 8 for i in range(256)], numpy.uint16)
+_BLOCK_ROWS = 1 << 20
+
+
+class IDInterner:
+    """ID string → int64 code table, shared by every dataset parsed with it.
+
+    Codes are assigned in first-seen order and never change, so frames
+    interned at different times line up. The strings live in one growing
+    Arrow array (``strings[code]`` is the ID), indexed by the compiled
+    ``StringCodes`` hash table of cython_pugixml_arrow; without it, lookups
+    hash the column's distinct values against the array, as the parse's
+    dictionary unifier does. Thread-safe.
+    """
+
+    def __init__(self):
+        import pyarrow as pa
+        self.strings = pa.array([], pa.large_string())
+        kernels = _kernels()
+        self._table = kernels.StringCodes() if kernels is not None else None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.strings)
+
+    def intern(self, column):
+        """int64 codes of a string column, adding the strings not seen before."""
+        return self._codes(column, add=True)
+
+    def lookup(self, column):
+        """int64 codes of a string column, null for strings not interned."""
+        return self._codes(column, add=False)
+
+    def decode(self, codes):
+        """int64 codes → the ID strings (null stays null)."""
+        import pyarrow as pa
+        return self.strings.take(codes).cast(pa.string())
+
+    def _codes(self, column, add):
+        """Codes of a string column; unknown strings are added where ``add``
+        is True (or set in an ``add`` boolean column of the same chunking),
+        else null."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        if isinstance(column, pa.Array):
+            column = pa.chunked_array([column])
+        column = column.cast(pa.large_string())
+        if self._table is not None:
+            adds = add.chunks if isinstance(add, pa.ChunkedArray) else [add] * column.num_chunks
+            with self._lock:
+                return pa.chunked_array([self._table_codes(chunk, chunk_add)
+                                         for chunk, chunk_add in zip(column.chunks, adds)], pa.int64())
+        if isinstance(add, pa.ChunkedArray):   # add the selected rows, then look every row up
+            self._codes(column.filter(add), True)
+            add = False
+        encoded = pc.dictionary_encode(column).unify_dictionaries()   # one dictionary for all chunks
+        if not encoded.num_chunks:
+            return pa.chunked_array([], pa.int64())
+        distinct = encoded.chunks[0].dictionary
+        with self._lock:
+            positions = pc.index_in(distinct, value_set=self.strings).cast(pa.int64())
+            if add and positions.null_count:
+                missing = positions.is_null()
+                fresh = numpy.cumsum(missing.to_numpy(zero_copy_only=False)) - 1 + len(self.strings)
+                positions = pc.if_else(missing, pa.array(fresh, pa.int64()), positions)
+                self.strings = pa.concat_arrays([self.strings, distinct.filter(missing)])
+        return pa.chunked_array([positions.take(chunk.indices) for chunk in encoded.chunks], pa.int64())
+
+    def _table_codes(self, chunk, add):
+        """One large_string chunk through the compiled table (lock held)."""
+        import pyarrow as pa
+        count = len(chunk)
+        offsets = numpy.frombuffer(chunk.buffers()[1], numpy.int64, count + 1, chunk.offset * 8)
+        mode = chunk.is_valid().to_numpy(zero_copy_only=False).view(numpy.uint8)
+        if add is True:
+            mode = mode * numpy.uint8(2)
+        elif add is not False:
+            mode = mode + (mode & add.to_numpy(zero_copy_only=False).view(numpy.uint8))
+        codes = numpy.empty(count, numpy.int64)
+        added = numpy.empty(count, numpy.int64)
+        new = self._table.codes(_bytes(chunk.buffers()[2]), offsets, mode, codes, added)
+        if new:
+            self.strings = pa.concat_arrays([self.strings, chunk.take(pa.array(added[:new]))])
+            self._table.adopt(self.strings, _bytes(self.strings.buffers()[2]),
+                              numpy.frombuffer(self.strings.buffers()[1], numpy.int64, len(self.strings) + 1))
+        return pa.Array.from_buffers(pa.int64(), count, [_bitmap(codes >= 0), pa.py_buffer(codes)])
+
+
+_DEFAULT_INTERNER = []
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_interner() -> IDInterner:
+    """The process-wide interner ``id_encoding="interned"`` uses by default
+    (created on first use; it lives as long as the process)."""
+    with _DEFAULT_LOCK:
+        if not _DEFAULT_INTERNER:
+            _DEFAULT_INTERNER.append(IDInterner())
+        return _DEFAULT_INTERNER[0]
+
+
+def is_uuid16(data) -> bool:
+    """True for a table in the uuid16 layout (has the ID_TEXT side column)."""
+    return "ID_TEXT" in _names(data)
+
+
+def is_interned(data) -> bool:
+    """True for a table in the interned layout (has the VALUE_ID column)."""
+    return "VALUE_ID" in _names(data)
+
+
+def _names(data):
+    return data.column_names if hasattr(data, "column_names") else getattr(data, "columns", ())
+
+
+def encode_ids(table):
+    """Text triplet Table → uuid16 layout (chunk by chunk, vectorized)."""
+    import pyarrow as pa
+    ids, id_text = _pack_column(table["ID"])
+    value_uuid, values = _pack_column(table["VALUE"])
+    extra = _extra_columns(table, TEXT_COLUMNS)
+    return pa.Table.from_arrays([ids, id_text, table["KEY"], values, value_uuid, table["INSTANCE_ID"]]
+                                + [table[name] for name in extra], names=list(UUID_COLUMNS) + extra)
+
+
+def intern_ids(table, interner):
+    """Text triplet Table → interned layout, adding its IDs to ``interner``."""
+    import pyarrow as pa
+    ids = interner.intern(table["ID"])   # first, so references within the table resolve
+    values = table["VALUE"].cast(pa.string())
+    uuids, _ = _pack_column(values)
+    value_ids = interner._codes(values, uuids.is_valid())   # known IDs resolve, UUIDs are added
+    texts = [_without(value, codes.is_valid().to_numpy(zero_copy_only=False))
+             for value, codes in zip(values.chunks, value_ids.chunks)]
+    extra = _extra_columns(table, TEXT_COLUMNS)
+    return pa.Table.from_arrays([ids, table["KEY"], pa.chunked_array(texts, pa.string()), value_ids,
+                                 table["INSTANCE_ID"]] + [table[name] for name in extra],
+                                names=list(INTERNED_COLUMNS) + extra)
+
+
+def decode_ids(data, interner=None):
+    """uuid16 or interned triplets → the standard [ID, KEY, VALUE,
+    INSTANCE_ID] text layout, in the input's flavor (pyarrow Table, polars
+    or pandas frame). Interned codes resolve against ``interner`` (default:
+    the process-wide one). Text-layout input is returned unchanged."""
+    from .._engine_detect import flavor, to_arrow
+    if not is_uuid16(data) and not is_interned(data):
+        return data
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    table = to_arrow(data)
+    if isinstance(table, pa.RecordBatch):
+        table = pa.Table.from_batches([table])
+    if is_uuid16(table):
+        ids = _unpack_column(table["ID"], table["ID_TEXT"])
+        values = _unpack_column(table["VALUE_UUID"], table["VALUE"])
+    else:
+        interner = default_interner() if interner is None else interner
+        ids = interner.decode(table["ID"])
+        values = pc.coalesce(table["VALUE"].cast(pa.string()), interner.decode(table["VALUE_ID"]))
+    extra = _extra_columns(table, UUID_COLUMNS if is_uuid16(table) else INTERNED_COLUMNS)
+    table = pa.Table.from_arrays([ids, table["KEY"], values, table["INSTANCE_ID"]] + [table[name] for name in extra],
+                                 names=list(TEXT_COLUMNS) + extra)
+    kind = flavor(data)
+    if kind == "polars":
+        import polars
+        return polars.from_arrow(table)
+    if kind == "pandas":
+        import pandas
+        return table.to_pandas(types_mapper=pandas.ArrowDtype)
+    return table
+
+
+def _extra_columns(table, layout):
+    """Columns beyond the ID layout (e.g. the rdf_map VALUE_NUM / VALUE_ENUM
+    sidecars), carried through unchanged after it."""
+    return [name for name in table.column_names if name not in layout]
+
+
+def _pack_column(column):
+    """ChunkedArray of strings → (fixed_size_binary(16) UUIDs, remaining text)."""
+    import pyarrow as pa
+    packed = [_pack(chunk) for chunk in column.chunks]
+    return (pa.chunked_array([uuids for uuids, _ in packed], pa.binary(16)),
+            pa.chunked_array([text for _, text in packed], pa.string()))
+
+
+def _kernels():
+    """The compiled pack/format loops (cython_pugixml_arrow), or None."""
+    try:
+        from . import cython_pugixml_arrow
+    except ImportError:
+        return None
+    return cython_pugixml_arrow
+
+
+def _pack(chunk):
+    import pyarrow as pa
+    if pa.types.is_dictionary(chunk.type):
+        chunk = chunk.dictionary_decode()
+    chunk = chunk.cast(pa.string())
+    count = len(chunk)
+    if not count:
+        return pa.array([], pa.binary(16)), chunk
+    offsets = numpy.frombuffer(chunk.buffers()[1], numpy.int32, count + 1, chunk.offset * 4)
+    lengths = numpy.diff(offsets)
+    valid = chunk.is_valid().to_numpy(zero_copy_only=False)
+    packed = numpy.zeros((count, 16), numpy.uint8)
+    is_uuid = numpy.zeros(count, numpy.uint8)
+    kernels = _kernels()
+    if kernels is not None:
+        kernels.pack_uuid16(_bytes(chunk.buffers()[2]), offsets, packed, is_uuid)
+    else:
+        _pack_numpy(chunk, lengths, packed, is_uuid)
+    is_uuid = is_uuid.view(bool) & valid
+    uuids = pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(16), count, [_bitmap(is_uuid), pa.py_buffer(packed)])
+
+    return uuids, _without(chunk, is_uuid, lengths, valid)
+
+
+def _without(chunk, mask, lengths=None, valid=None):
+    """Text side column: a string chunk nulled where mask is set, holding only
+    the remaining strings' bytes (not the whole data buffer, as if_else would)."""
+    import pyarrow as pa
+    count = len(chunk)
+    if lengths is None:
+        lengths = numpy.diff(numpy.frombuffer(chunk.buffers()[1], numpy.int32, count + 1, chunk.offset * 4))
+        valid = chunk.is_valid().to_numpy(zero_copy_only=False)
+    rest = chunk.filter(pa.array(~mask))
+    text_offsets = numpy.zeros(count + 1, numpy.int32)
+    numpy.cumsum(numpy.where(mask, 0, lengths), out=text_offsets[1:])
+    data = rest.buffers()[2]
+    if data is not None and _first_offset(rest):
+        data = data.slice(_first_offset(rest))
+    return pa.StringArray.from_buffers(count, pa.py_buffer(text_offsets), data, _bitmap(valid & ~mask))
+
+
+def _pack_numpy(chunk, lengths, packed, is_uuid):
+    """pack_uuid16 without the compiled engine, vectorized in blocks."""
+    import pyarrow as pa
+    candidates = numpy.flatnonzero(lengths == 36)
+    block = chunk.take(pa.array(candidates))   # the length-36 strings as one contiguous (k, 36) block
+    chars = numpy.frombuffer(block.buffers()[2] or b"", numpy.uint8, 36 * len(candidates),
+                             _first_offset(block)).reshape(-1, 36)
+    for begin in range(0, len(candidates), _BLOCK_ROWS):   # bounded temporaries
+        part = chars[begin:begin + _BLOCK_ROWS]
+        rows = candidates[begin:begin + _BLOCK_ROWS]
+        digits = numpy.concatenate([part[:, start:stop] for start, stop in _GROUPS], axis=1)
+        values = _PAIR_VALUES[digits.view(numpy.uint16)]
+        packed[rows] = values
+        is_uuid[rows] = (part[:, _DASHES] == ord("-")).all(axis=1) & (values < 256).all(axis=1)
+
+
+def _unpack_column(uuids, text):
+    """(UUID column, text column) → one string column, UUIDs formatted back."""
+    import pyarrow as pa
+    uuids = uuids.cast(pa.binary(16))   # polars round-trips fixed_size_binary as variable binary
+    text = text.cast(pa.string())
+    return pa.chunked_array([_unpack(u, t) for u, t in zip(uuids.chunks, _rechunk(text, uuids))], pa.string())
+
+
+def _rechunk(column, like):
+    """column's chunks aligned to like's chunk lengths (both come from one table)."""
+    offset = 0
+    for chunk in like.chunks:
+        yield column.slice(offset, len(chunk)).combine_chunks()
+        offset += len(chunk)
+
+
+def _unpack(uuids, text):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    count = len(uuids)
+    valid = uuids.is_valid().to_numpy(zero_copy_only=False)
+    raw = numpy.frombuffer(uuids.buffers()[1], numpy.uint8, (uuids.offset + count) * 16)
+    raw = raw[uuids.offset * 16:].reshape(count, 16)
+    if not valid.any():
+        return text
+    kernels = _kernels()
+    if kernels is not None:
+        text_offsets = numpy.frombuffer(text.buffers()[1], numpy.int32, count + 1, text.offset * 4)
+        offsets = numpy.zeros(count + 1, numpy.int64)
+        numpy.cumsum(numpy.where(valid, 36, numpy.diff(text_offsets)), out=offsets[1:])
+        out = numpy.empty(offsets[-1], numpy.uint8)
+        kernels.format_uuid16(raw, valid.view(numpy.uint8), _bytes(text.buffers()[2]), text_offsets, offsets, out)
+        strings = pa.Array.from_buffers(pa.large_string(), count, [
+            _bitmap(valid | text.is_valid().to_numpy(zero_copy_only=False)), pa.py_buffer(offsets), pa.py_buffer(out)])
+        return strings.cast(pa.string())
+    raw = raw[valid]
+    found = len(raw)
+    digits = _HEX_PAIRS[raw].view(numpy.uint8)
+    dash = numpy.full((found, 1), ord("-"), numpy.uint8)
+    chars = numpy.concatenate([digits[:, 0:8], dash, digits[:, 8:12], dash, digits[:, 12:16], dash,
+                               digits[:, 16:20], dash, digits[:, 20:32]], axis=1)
+    offsets = numpy.arange(0, 36 * (found + 1), 36, dtype=numpy.int64 if 36 * found >= 2 ** 31 else numpy.int32)
+    kind = pa.large_string() if offsets.dtype == numpy.int64 else pa.string()
+    formatted = pa.Array.from_buffers(kind, found, [None, pa.py_buffer(offsets), pa.py_buffer(chars)])
+    return pc.replace_with_mask(text.cast(kind), pa.array(valid), formatted).cast(pa.string())
+
+
+def _bytes(buffer):
+    return numpy.frombuffer(buffer, numpy.uint8) if buffer is not None else numpy.empty(0, numpy.uint8)
+
+
+def _first_offset(array):
+    return int(numpy.frombuffer(array.buffers()[1], numpy.int32, 1, array.offset * 4)[0]) if len(array) else 0
+
+
+def _bitmap(mask):
+    import pyarrow as pa
+    return pa.py_buffer(numpy.packbits(mask, bitorder="little"))
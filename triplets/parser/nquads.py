@@ -6,11 +6,17 @@ of the export conventions (triplets.export.nquads_utils): urn:uuid: stripped,
 CIM namespace shortened, rdf:type → 'Type', datatype / language annotations
 dropped (values keep their lexical form), graph → INSTANCE_ID (absent → None).
 
-Everything is vectorized pandas string ops. terms_to_triplets is the shared
-term-level conversion, also used by the SPARQL engines to decode
-CONSTRUCT/DESCRIBE results: the qlever engine feeds it Arrow-decoded term
-columns, the oxigraph engine feeds read_nquads its serialized result bytes.
+With the compiled parser extension (cython_pugixml_arrow) the text is
+tokenized in C++ straight into Arrow builders, block by block of whole
+lines (a path is memory-mapped, the GIL is released): read_nquads_batches
+streams those blocks as a RecordBatchReader, read_nquads collects them.
+Without it, vectorized pandas string ops do the same conversion.
+terms_to_triplets / terms_to_batch are the shared term-level conversion,
+also used by the SPARQL engines to decode CONSTRUCT/DESCRIBE results: the
+qlever engine feeds terms_to_batch its Arrow-decoded term columns, the
+oxigraph engine feeds read_nquads its serialized result bytes.
 """
+import io
 import re
 
 from pathlib import Path
@@ -48,8 +54,86 @@ def read_nquads(source, return_type="pandas"):
     Triplet DataFrame [ID, KEY, VALUE, INSTANCE_ID] — the round-trip inverse
     of export_to_nquads (datatype annotations drop to lexical form, which is
     the triplets convention: everything is a string). Lines without a graph
-    term (N-Triples) get INSTANCE_ID null.
+    term (N-Triples) get INSTANCE_ID null. With the compiled tokenizer KEY
+    and INSTANCE_ID are dictionary-encoded and pandas columns Arrow-backed,
+    as from :func:`triplets.parser.parse`.
     """
+    if _kernels() is not None:
+        table = read_nquads_batches(source, categorical_columns=("INSTANCE_ID", "KEY")).read_all()
+        return _from_arrow(table, return_type)
+    return to_return_type(_read_pandas(source), return_type)
+
+
+def read_nquads_batches(source, batch_rows=None, categorical_columns=None):
+    """Parse N-Quads (or N-Triples) lazily into a ``pyarrow.RecordBatchReader``.
+
+    The counterpart of :func:`triplets.parser.parse_batches`: fixed utf8
+    schema [ID, KEY, VALUE, INSTANCE_ID], one batch per block of whole lines
+    — about ``batch_rows`` rows each, else 64 MB of text — so memory stays
+    bounded by a block whatever the size of the dump. ``categorical_columns``
+    emits those columns as ``dictionary<int32, utf8>`` with one dictionary
+    shared by the whole stream (each batch's extends the previous one).
+
+    Needs pyarrow; without the compiled extension the text is parsed whole
+    with pandas and sliced.
+    """
+    if batch_rows is not None and batch_rows < 1:
+        raise ValueError("batch_rows must be a positive integer")
+    return _batch_reader(lambda: _raw_batches(source, batch_rows), categorical_columns)
+
+
+def _raw_batches(source, batch_rows=None):
+    """Triplet RecordBatches of source as tokenized, before _batch_reader conforms them."""
+    import pyarrow as pa
+    kernels = _kernels()
+    if kernels is not None:
+        yield from kernels.iter_nquads_batches(_source(source), CIM_NS.encode(), batch_rows)
+        return
+    whole = pa.RecordBatch.from_pandas(_read_pandas(source), preserve_index=False)
+    for offset in range(0, whole.num_rows, batch_rows or max(whole.num_rows, 1)):
+        yield whole.slice(offset, batch_rows or whole.num_rows)
+
+
+def _batch_reader(parts, categorical_columns=None):
+    """RecordBatchReader over the batches of parts() on the fixed triplet
+    schema; categorical_columns share one growing dictionary per column."""
+    import pyarrow as pa
+    from . import _DictionaryUnifier
+
+    columns = ("ID", "KEY", "VALUE", "INSTANCE_ID")
+    categorical_columns = tuple(categorical_columns or ())
+    if not set(categorical_columns) <= set(columns):
+        raise ValueError(f"categorical_columns must be among {columns}, got {categorical_columns!r}")
+    schema = pa.schema([(c, pa.dictionary(pa.int32(), pa.string()) if c in categorical_columns else pa.string())
+                        for c in columns])
+    unifiers = {c: _DictionaryUnifier() for c in categorical_columns}
+
+    def conform(batch):
+        arrays = [unifiers[c].encode(batch.column(c)) if c in unifiers
+                  else batch.column(c).cast(pa.string()) for c in columns]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    return pa.RecordBatchReader.from_batches(schema, (conform(batch) for batch in parts()))
+
+
+def terms_to_batch(subjects, predicates, objects):
+    """N-Triples-form term arrays (e.g. a SPARQL CONSTRUCT result) →
+    RecordBatch [ID, KEY, VALUE, INSTANCE_ID] with the conversion of
+    :func:`terms_to_triplets` (compiled when available); INSTANCE_ID is null."""
+    import pyarrow as pa
+    kernels = _kernels()
+    if kernels is not None:
+        return kernels.nquads_terms_to_batch(subjects, predicates, objects, CIM_NS.encode())
+    frame = pandas.DataFrame({"ID": subjects.to_pandas(), "KEY": predicates.to_pandas(),
+                              "VALUE": objects.to_pandas()}, dtype="object")
+    frame = terms_to_triplets(frame)
+    frame["INSTANCE_ID"] = frame["INSTANCE_ID"].astype("object")
+    return pa.RecordBatch.from_pandas(frame, schema=pa.schema([(c, pa.string()) for c in frame.columns]),
+                                      preserve_index=False)
+
+
+def _read_pandas(source):
+    """read_nquads with vectorized pandas string ops → object-dtype frame."""
     lines = pandas.Series(_read_text(source).splitlines(), dtype="object")
     lines = lines[lines.str.strip().ne("") & ~lines.str.lstrip().str.startswith("#")]
 
@@ -59,7 +143,7 @@ def read_nquads(source, return_type="pandas"):
     if bad.any():
         raise ValueError(f"not N-Quads: {lines[bad].iloc[0][:200]!r}")
 
-    return to_return_type(terms_to_triplets(terms).reset_index(drop=True), return_type)
+    return terms_to_triplets(terms).reset_index(drop=True)
 
 
 def terms_to_triplets(frame):
@@ -107,11 +191,43 @@ def _escape_char(match):
     return _CONTROL_ESCAPES.get(match.group(3), match.group(3))
 
 
+def _kernels():
+    """The compiled tokenizer (cython_pugixml_arrow), or None."""
+    try:
+        from . import cython_pugixml_arrow
+    except ImportError:
+        return None
+    return cython_pugixml_arrow
+
+
+def _source(source):
+    """Path (memory-mapped by the tokenizer) or file-like; content → BytesIO."""
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    if _is_content(source):
+        return io.BytesIO(source.encode("utf-8"))
+    return source
+
+
+def _is_content(source):
+    """A str holding serialized N-Quads rather than a path."""
+    return isinstance(source, str) and ("\n" in source or source.lstrip().startswith(("<", "_:", "#")))
+
+
+def _from_arrow(table, return_type):
+    if return_type == "polars":
+        import polars
+        return polars.from_arrow(table)
+    if return_type == "arrow":
+        return table
+    return table.to_pandas(types_mapper=pandas.ArrowDtype)
+
+
 def _read_text(source):
     if isinstance(source, bytes):
         return source.decode("utf-8")
-    if isinstance(source, str) and ("\n" in source or source.lstrip().startswith(("<", "_:", "#"))):
-        return source  # serialized content, not a path
+    if _is_content(source):
+        return source
     if hasattr(source, "read"):
         content = source.read()
         return content.decode("utf-8") if isinstance(content, bytes) else content
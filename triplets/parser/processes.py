@@ -0,0 +1,159 @@
+"""Process-pool parsing — ``parse(..., max_workers=N, executor="process")``.
+
+The lxml engines extract rows in a Python loop that holds the GIL, so a
+thread pool parses their files one at a time. ProcessParser runs the engine
+in worker processes instead: each worker parses one XML file (a path, a
+member of a zip on disk or a compressed file on disk is read by the worker
+itself, the archive memory-mapped; only other file-likes are sent as their
+bytes) and writes the result as an Arrow IPC file to a private spill
+directory — in /dev/shm when it exists, so the IPC file lives in shared
+memory. The parent memory-maps it and unlinks it right away, so the columns
+reach the parent zero-copy and are never pickled as Python objects. The
+python_lxml_pandas DataFrame travels as Arrow too and is converted back.
+
+Workers start from a forkserver (spawn where there is none) with the parser
+package preloaded: forking the threaded parent itself is unsafe (polars /
+duckdb pools, the parse() thread pool that submits the jobs).
+"""
+import os
+import shutil
+import logging
+import tempfile
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+# Engines whose extraction loop holds the GIL: "auto" parses them in processes
+GIL_BOUND_ENGINES = {"python_lxml_pandas", "python_lxml_arrow"}
+
+_EXECUTORS = ("auto", "thread", "process")
+_SHM_DIR = "/dev/shm"
+
+
+def resolve_executor(executor, engine_name):
+    """executor argument → "thread" or "process" for engine_name."""
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {_EXECUTORS}, got {executor!r}")
+    if executor == "auto":
+        # one CPU gains nothing from processes, only their transfer cost
+        executor = ("process" if engine_name in GIL_BOUND_ENGINES and _cpu_count() > 1 and _has_pyarrow()
+                    else "thread")
+    if executor == "process" and not _has_pyarrow():
+        raise ValueError("executor='process' returns results as Arrow IPC and needs pyarrow. "
+                         "Install with: pip install triplets[arrow].")
+    return executor
+
+
+class ProcessParser:
+    """A pool of max_workers parser processes and their spill directory."""
+
+    def __init__(self, max_workers):
+        context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+        if context.get_start_method() == "forkserver":
+            context.set_forkserver_preload(["triplets.parser"])
+        self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        self._broken = False
+        self._directory = tempfile.mkdtemp(prefix="triplets-parse-",
+                                           dir=_SHM_DIR if os.path.isdir(_SHM_DIR) else None)
+
+    def parse(self, engine_name, source, debug, kwargs, pushdown):
+        """The engine result for one file (str path, load origin or file-like),
+        parsed in a worker; None when an origin's member is unreadable."""
+        if not self._broken:
+            try:
+                path = self._pool.submit(_work, engine_name, _job(source), debug, kwargs, pushdown,
+                                         self._directory).result()
+                return None if path is None else _read(path, engine_name)
+            except (BrokenProcessPool, OSError) as error:
+                # workers that cannot start (a __main__ spawn cannot re-import,
+                # resource limits) — degrade to threads instead of failing the parse
+                if not self._broken:
+                    self._broken = True
+                    logger.warning("parse process pool failed (%s) — parsing on threads", error)
+        from . import get_engine, _load_one
+        from .utils import _Origin, _reload
+        if isinstance(source, _Origin):
+            source = _reload(source, debug)
+            if source is None:
+                return None
+        return _load_one(get_engine(engine_name)[1], source, debug, kwargs, pushdown)
+
+    def close(self):
+        self._pool.shutdown()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _job(source):
+    """Picklable form of a source: the path or load origin, or (name, bytes)."""
+    from .utils import _Origin
+    if isinstance(source, (str, _Origin)):
+        return source
+    if hasattr(source, "getbuffer"):   # MemberBuffer — zip member / decompressed file
+        return source.name, bytes(source.getbuffer())
+    source.seek(0)
+    content = source.read()
+    return getattr(source, "name", ""), content.encode("utf-8") if isinstance(content, str) else content
+
+
+def _work(engine_name, job, debug, kwargs, pushdown, directory):
+    """Worker side: parse one job and spill the result; returns the IPC path
+    (None when an origin's member is unreadable)."""
+    import pyarrow as pa
+    from . import get_engine, _load_one
+    from .utils import MemberBuffer, _Origin, _reload
+
+    _, engine_mod = get_engine(engine_name)
+    if isinstance(job, _Origin):
+        source = _reload(job, debug)   # the member straight from the worker's mapping of the archive
+        if source is None:
+            return None
+    else:
+        source = job if isinstance(job, str) else MemberBuffer(job[1], job[0])
+    result = _load_one(engine_mod, source, debug, kwargs, pushdown)
+    table = (pa.Table.from_batches([result]) if isinstance(result, pa.RecordBatch)
+             else pa.Table.from_pandas(result, preserve_index=False))
+    descriptor, path = tempfile.mkstemp(suffix=".arrow", dir=directory)
+    with os.fdopen(descriptor, "wb") as file, pa.ipc.new_file(file, table.schema) as writer:
+        writer.write_table(table)
+    return path
+
+
+def _read(path, engine_name):
+    """Parent side: map the spilled IPC file (zero-copy) and unlink it."""
+    import pyarrow as pa
+    reader = pa.ipc.open_file(pa.memory_map(path))
+    try:
+        os.unlink(path)   # the mapping keeps the pages alive (POSIX)
+    except OSError:
+        pass              # Windows: mapped files stay until close() removes the directory
+    if engine_name == "python_lxml_pandas":
+        return reader.read_all().to_pandas()
+    # the worker wrote the engine's one RecordBatch (none when empty): returned as mapped
+    if reader.num_record_batches:
+        return reader.get_batch(0)
+    return pa.RecordBatch.from_pylist([], schema=reader.schema)
+
+
+def _cpu_count():
+    """CPUs this process may run on (its affinity mask where the OS has one)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -3,19 +3,23 @@
 Uses lxml for XML parsing but streams to Arrow StringBuilder builders
 instead of Python lists, producing pa.RecordBatch. Better for polars interop
 and dictionary-encoding (categorical columns). Requires pyarrow.
+
+The document is parsed incrementally (utils.iterparse_rdf): each rdf:RDF
+child is cleared once its rows are appended, so the lxml tree never holds
+more than about one object. iter_rdf_batches streams a file in batches of
+batch_rows for parse_batches.
 """
 
 import os
 import uuid
 import logging
-from typing import Union, IO, Any
+from typing import Union, IO, Any, Iterator, Optional
 
-from lxml import etree
 import pyarrow as pa
 
 from .utils import (
     RDF_NS, RDF_ID, RDF_ABOUT, RDF_NODEID, RDF_RESOURCE,
-    clean_ID, _split_prefixed_name,
+    clean_ID, _split_prefixed_name, iterparse_rdf,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,24 +27,53 @@ logger = logging.getLogger(__name__)
 
 def load_rdf_to_dataframe(path_or_fileobject: Union[str, IO], debug: bool = False,
                           shorten_resources: bool = True) -> pa.RecordBatch:
-    """Parse single RDF/XML (path or fileobj) to pyarrow RecordBatch using lxml + lists.
+    """Parse single RDF/XML (path or fileobj) to pyarrow RecordBatch using lxml + Arrow builders.
+
+    Streaming in the sense of column-wise collection then direct Arrow (no 4-tuple list);
+    the document is parsed incrementally (iterparse_rdf), so the lxml tree is never whole.
+    """
+    return next(_blocks(path_or_fileobject, None, debug, shorten_resources))
+
 
-    Streaming in the sense of column-wise collection then direct Arrow (no 4-tuple list).
+def iter_rdf_batches(path_or_fileobject: Union[str, IO], batch_rows: int, debug: bool = False,
+                     shorten_resources: bool = True, types=None, keys=None,
+                     instances=None) -> Iterator[pa.RecordBatch]:
+    """Parse RDF XML as a stream of RecordBatches of exactly batch_rows rows (the last shorter).
+
+    Bounded-memory counterpart of load_rdf_to_dataframe: the rows are built
+    in object-aligned blocks of about batch_rows and re-chunked, so memory
+    stays bounded by about two batches plus one lxml object. Concatenated,
+    the batches hold the same rows in the same order as load_rdf_to_dataframe.
+    types / keys / instances filter each block as parse() filters a file.
     """
-    parser = etree.XMLParser(remove_comments=True, collect_ids=False, remove_blank_text=True)
+    if batch_rows is None or batch_rows < 1:
+        raise ValueError(f"batch_rows must be a positive integer, got {batch_rows!r}")
+    from . import _filter_objects
+
+    pending, pending_rows = [], 0
+    for block in _blocks(path_or_fileobject, batch_rows, debug, shorten_resources):
+        block = _filter_objects(block, types=types, keys=keys, instances=instances)
+        pending.append(block)
+        pending_rows += block.num_rows
+        if pending_rows < batch_rows:
+            continue
+        rows = pa.concat_batches(pending)
+        full = pending_rows - pending_rows % batch_rows
+        for offset in range(0, full, batch_rows):
+            yield rows.slice(offset, batch_rows)
+        pending, pending_rows = [rows.slice(full)], pending_rows - full
+    if pending_rows:
+        yield pa.concat_batches(pending)
+
+
+def _blocks(path_or_fileobject: Union[str, IO], block_rows: Optional[int], debug: bool,
+            shorten_resources: bool) -> Iterator[pa.RecordBatch]:
+    """RecordBatches of whole objects, each closed once it holds at least
+    block_rows rows (None: one batch for the document, empty or not)."""
+    if isinstance(path_or_fileobject, os.PathLike):
+        path_or_fileobject = os.fspath(path_or_fileobject)
     try:
-        if isinstance(path_or_fileobject, os.PathLike):
-            path_or_fileobject = os.fspath(path_or_fileobject)
-        if isinstance(path_or_fileobject, str):
-            parsed = etree.parse(path_or_fileobject, parser=parser)
-        else:
-            # ensure seekable for safety
-            try:
-                path_or_fileobject.seek(0)
-            except Exception:
-                pass
-            parsed = etree.parse(path_or_fileobject, parser=parser)
-        root = parsed.getroot()
+        root, objects = iterparse_rdf(path_or_fileobject)
     except Exception as e:
         logger.error("lxml parse failed for %s: %s", path_or_fileobject, e)
         raise
@@ -63,6 +96,13 @@ def load_rdf_to_dataframe(path_or_fileobject: Union[str, IO], debug: bool = Fals
     val_b = pa.lib.StringBuilder()
     inst_b = pa.lib.StringBuilder()
 
+    def finish():
+        # Finish builders to arrays (direct to Arrow); the builders start over
+        return pa.RecordBatch.from_arrays(
+            [id_b.finish(), key_b.finish(), val_b.finish(), inst_b.finish()],
+            ["ID", "KEY", "VALUE", "INSTANCE_ID"],
+        )
+
     # Meta: Distribution + NamespaceMap (matches legacy)
     dist_id = str(uuid.uuid4())
     nsmap_id = str(uuid.uuid4())
@@ -76,8 +116,9 @@ def load_rdf_to_dataframe(path_or_fileobject: Union[str, IO], debug: bool = Fals
         val_b.append(str(v) if v is not None else "")
         inst_b.append(instance_id)
 
+    rows = 0
     # RDF objects
-    for rdf_object in root.iterchildren():
+    for rdf_object in objects:
         attribs = rdf_object.attrib
         obj_id = clean_ID(
             attribs.get(RDF_ID)
@@ -107,11 +148,12 @@ def load_rdf_to_dataframe(path_or_fileobject: Union[str, IO], debug: bool = Fals
             val_b.append(value if value is not None else "")
             inst_b.append(instance_id)
 
-    # Finish builders to arrays (direct to Arrow)
-    batch = pa.RecordBatch.from_arrays(
-        [id_b.finish(), key_b.finish(), val_b.finish(), inst_b.finish()],
-        ["ID", "KEY", "VALUE", "INSTANCE_ID"],
-    )
+        if block_rows is not None and len(id_b) >= block_rows:
+            rows += len(id_b)
+            yield finish()
+
+    if block_rows is None or len(id_b):
+        rows += len(id_b)
+        yield finish()
     if debug:
-        logger.debug("python_lxml produced batch with %d rows for %s", batch.num_rows, file_name)
-    return batch
+        logger.debug("python_lxml produced %d rows for %s", rows, file_name)
@@ -13,11 +13,10 @@ import logging
 from typing import Union, IO
 
 import pandas as pd
-from lxml import etree
 
 from .utils import (
     RDF_NS, RDF_ID, RDF_ABOUT, RDF_NODEID, RDF_RESOURCE,
-    clean_ID, _split_prefixed_name,
+    clean_ID, _split_prefixed_name, iterparse_rdf,
 )
 
 logger = logging.getLogger(__name__)
@@ -28,21 +27,13 @@ def load_rdf_to_dataframe(path_or_fileobject: Union[str, IO], debug: bool = Fals
     """Parse single RDF/XML file to pandas DataFrame using lxml + list-of-tuples.
 
     This is the old proven path: lxml parse → iterate → build Python list → pd.DataFrame.
-    No pyarrow dependency.
+    No pyarrow dependency. The document is parsed incrementally (iterparse_rdf):
+    only the rows are kept, not the lxml tree.
     """
-    parser = etree.XMLParser(remove_comments=True, collect_ids=False, remove_blank_text=True)
+    if isinstance(path_or_fileobject, os.PathLike):
+        path_or_fileobject = os.fspath(path_or_fileobject)
     try:
-        if isinstance(path_or_fileobject, os.PathLike):
-            path_or_fileobject = os.fspath(path_or_fileobject)
-        if isinstance(path_or_fileobject, str):
-            parsed = etree.parse(path_or_fileobject, parser=parser)
-        else:
-            try:
-                path_or_fileobject.seek(0)
-            except Exception:
-                pass
-            parsed = etree.parse(path_or_fileobject, parser=parser)
-        root = parsed.getroot()
+        root, objects = iterparse_rdf(path_or_fileobject)
     except Exception as e:
         logger.error("lxml parse failed for %s: %s", path_or_fileobject, e)
         raise
@@ -70,7 +61,7 @@ def load_rdf_to_dataframe(path_or_fileobject: Union[str, IO], debug: bool = Fals
         data_list.append((nsmap_id, str(k) if k is not None else "", str(v) if v is not None else "", instance_id))
 
     # RDF objects
-    for rdf_object in root.iterchildren():
+    for rdf_object in objects:
         attribs = rdf_object.attrib
         obj_id = clean_ID(
             attribs.get(RDF_ID)
@@ -0,0 +1,107 @@
+"""Turtle / TriG reader — Rust parse, N-Quads term conversion.
+
+read_turtle / read_trig turn Turtle or TriG (path, bytes, str content, or
+file-like) into a triplet DataFrame [ID, KEY, VALUE, INSTANCE_ID] with the
+conventions of the N-Quads reader (triplets.parser.nquads): urn:uuid:
+stripped, CIM namespace shortened, rdf:type → 'Type', literals in lexical
+form, TriG graph → INSTANCE_ID (default graph → None).
+
+pyoxigraph's Rust parser does the syntax (prefixes, ``;`` / ``,`` lists,
+``[]`` blank nodes, collections). Every ``batch_rows`` quads it serializes
+the parsed terms back to N-Quads, Rust-side, and the N-Quads tokenizer
+builds the Arrow columns from that text — no per-term Python conversion.
+Blank nodes keep their labels (``[]`` gets fresh ones); relative IRIs
+resolve against ``base_iri``.
+"""
+import itertools
+import os
+
+from .nquads import _batch_reader, _from_arrow, _raw_batches
+
+# Quads per Rust parse → N-Quads chunk when batch_rows is not given
+_CHUNK_QUADS = 1_000_000
+
+
+def read_turtle(source, return_type="pandas", base_iri=None):
+    """Parse Turtle into a triplet DataFrame.
+
+    Parameters
+    ----------
+    source : str/Path, bytes, or file-like
+        Path to a .ttl file, the serialized content as bytes/str, or an
+        open file object (text or binary).
+    return_type : str, default "pandas"
+        "pandas", "polars", or "arrow".
+    base_iri : str, optional
+        Base for relative IRIs (``<#_id>``); None leaves them unresolved,
+        which the parser rejects.
+
+    Returns
+    -------
+    Triplet DataFrame [ID, KEY, VALUE, INSTANCE_ID] — INSTANCE_ID is null
+    (a Turtle document has no named graphs). KEY and INSTANCE_ID are
+    dictionary-encoded, pandas columns Arrow-backed, as from
+    :func:`triplets.parser.nquads.read_nquads`.
+
+    Needs pyoxigraph and pyarrow.
+    """
+    reader = read_turtle_batches(source, categorical_columns=("INSTANCE_ID", "KEY"), base_iri=base_iri)
+    return _from_arrow(reader.read_all(), return_type)
+
+
+def read_trig(source, return_type="pandas", base_iri=None):
+    """Parse TriG into a triplet DataFrame — :func:`read_turtle` with named
+    graphs: each graph's triples get INSTANCE_ID = the graph name, those of
+    the default graph INSTANCE_ID null."""
+    reader = read_trig_batches(source, categorical_columns=("INSTANCE_ID", "KEY"), base_iri=base_iri)
+    return _from_arrow(reader.read_all(), return_type)
+
+
+def read_turtle_batches(source, batch_rows=None, categorical_columns=None, base_iri=None):
+    """Parse Turtle lazily into a ``pyarrow.RecordBatchReader``.
+
+    The schema and ``categorical_columns`` are those of
+    :func:`triplets.parser.nquads.read_nquads_batches`; each batch holds at
+    most ``batch_rows`` triples (default 1M), so memory stays bounded by a
+    batch while the Rust parser streams the source.
+    """
+    return _read_batches(source, "TURTLE", batch_rows, categorical_columns, base_iri)
+
+
+def read_trig_batches(source, batch_rows=None, categorical_columns=None, base_iri=None):
+    """Parse TriG lazily into a ``pyarrow.RecordBatchReader`` — see
+    :func:`read_turtle_batches`."""
+    return _read_batches(source, "TRIG", batch_rows, categorical_columns, base_iri)
+
+
+def _read_batches(source, rdf_format, batch_rows, categorical_columns, base_iri):
+    import pyoxigraph
+
+    if batch_rows is not None and batch_rows < 1:
+        raise ValueError("batch_rows must be a positive integer")
+    rdf_format = getattr(pyoxigraph.RdfFormat, rdf_format)
+
+    def parts():
+        quads = _parse(pyoxigraph, source, rdf_format, base_iri)
+        while chunk := list(itertools.islice(quads, batch_rows or _CHUNK_QUADS)):
+            nquads = pyoxigraph.serialize(chunk, format=pyoxigraph.RdfFormat.N_QUADS)
+            yield from _raw_batches(nquads)
+
+    return _batch_reader(parts, categorical_columns)
+
+
+def _parse(pyoxigraph, source, rdf_format, base_iri):
+    """pyoxigraph quad iterator over source, syntax errors as ValueError."""
+    if isinstance(source, bytes) or hasattr(source, "read") or (isinstance(source, str) and _is_content(source)):
+        quads = pyoxigraph.parse(source, format=rdf_format, base_iri=base_iri)
+    else:
+        quads = pyoxigraph.parse(path=os.fspath(source), format=rdf_format, base_iri=base_iri)
+    try:
+        yield from quads
+    except SyntaxError as error:
+        raise ValueError(f"not {rdf_format.name}: {error}") from error
+
+
+def _is_content(source):
+    """A str holding serialized Turtle / TriG rather than a path."""
+    return "\n" in source or source.lstrip().startswith(("@", "<", "_:", "#", "[", "PREFIX", "BASE", "prefix", "base"))
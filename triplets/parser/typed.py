@@ -0,0 +1,114 @@
+"""Schema-typed value columns — ``parse(..., rdf_map=schema)``.
+
+The export schema's ``xsd:type`` (read by
+:func:`triplets.export.nquads_utils.build_key_metadata`, the same table the
+N-Quads and CIM/XML exports annotate literals from) says which KEYs hold
+numbers, booleans and enumerations. With it, every parsed file gets two
+sidecar columns next to the text VALUE:
+
+    VALUE_NUM   float64                  the number (xsd float / double /
+                                         decimal / integer kinds), 1.0 / 0.0
+                                         for xsd:boolean, else null
+    VALUE_ENUM  dictionary<int32, utf8>  the value of an Enumeration KEY,
+                                         else null
+
+The KEY column is dictionary-encoded per file, so the kinds are resolved
+once per KEY dictionary entry and spread over the rows by index — the rows
+themselves are only touched by one string → float64 cast. VALUE stays
+complete: everything that reads text keeps working. The tableviews still
+pivot VALUE; with string_to_number the sidecars only pick the columns — the
+pandas engine casts the KEYs VALUE_NUM marks as numeric without probing
+them, and neither engine probes Enumeration KEYs. (Casting the pivoted
+Arrow text is cheaper than a second pivot of VALUE_NUM.)
+
+The tableviews also take the schema directly (``type_tableview(...,
+rdf_map=schema)``): :func:`column_kinds` names the tableview columns to cast
+to numbers or booleans, cached per schema and column set.
+"""
+import numpy
+
+from .._caches import register_cache
+
+TYPED_COLUMNS = ("VALUE_NUM", "VALUE_ENUM")
+
+_NUMERIC_TYPES = {"float", "double", "decimal", "integer", "int", "long", "short", "byte",
+                  "nonNegativeInteger", "positiveInteger", "nonPositiveInteger", "negativeInteger",
+                  "unsignedLong", "unsignedInt", "unsignedShort", "unsignedByte"}
+_NUMBER = r"^([-+]?((\d+\.?\d*|\.\d+)([eE][-+]?\d+)?|INF)|NaN)$"   # xsd lexical forms, trimmed
+
+# kind codes per KEY
+_TEXT, _NUMBER_KIND, _BOOLEAN, _ENUM = 0, 1, 2, 3
+
+BOOLEANS = {"true": True, "1": True, "false": False, "0": False}   # xsd:boolean lexical forms
+
+_SCHEMAS = register_cache({})   # schema path / id(dict) → (schema, kinds, {columns: column kinds})
+
+
+def value_kinds(rdf_map):
+    """{KEY: kind} for the numeric, boolean and Enumeration KEYs of an export
+    schema (dict or path). The 'Type' KEY and untyped KEYs are text."""
+    from ..export.nquads_utils import XSD_NS, build_key_metadata
+    enum_keys, _, key_datatypes = build_key_metadata(rdf_map)
+    kinds = {key: _ENUM for key in enum_keys}
+    for key, datatype in key_datatypes.items():
+        name = (datatype or "").removeprefix(XSD_NS)
+        if name in _NUMERIC_TYPES:
+            kinds[key] = _NUMBER_KIND
+        elif name == "boolean":
+            kinds[key] = _BOOLEAN
+    return kinds
+
+
+def column_kinds(rdf_map, columns):
+    """{column: "number" | "boolean"} for the tableview columns the export
+    schema (dict or path) types as numbers or xsd:boolean; Enumeration and
+    untyped KEYs are left out — they stay text. The schema is read once and
+    the answer kept per column set (one per class, in practice)."""
+    key = id(rdf_map) if isinstance(rdf_map, dict) else str(rdf_map)
+    entry = _SCHEMAS.get(key)
+    if entry is None:
+        entry = _SCHEMAS[key] = (rdf_map, value_kinds(rdf_map), {})   # holding the dict keeps its id() unique
+    _, kinds, per_columns = entry
+    columns = tuple(columns)
+    if columns not in per_columns:
+        names = {_NUMBER_KIND: "number", _BOOLEAN: "boolean"}
+        per_columns[columns] = {column: names[kinds[column]] for column in columns
+                                if kinds.get(column) in names}
+    return per_columns[columns]
+
+
+def add_typed_columns(batch, kinds):
+    """One file's RecordBatch + VALUE_NUM / VALUE_ENUM per ``kinds``."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    row_kinds = _row_kinds(batch.column("KEY"), kinds)
+    values = batch.column("VALUE").cast(pa.string())
+    null = pa.scalar(None, pa.string())
+
+    # pretty-printed XML pads text content with whitespace ("\n   1\n")
+    numbers = pc.utf8_trim_whitespace(pc.if_else(pa.array(row_kinds == _NUMBER_KIND), values, null))
+    try:
+        value_num = numbers.cast(pa.float64())
+    except pa.ArrowInvalid:   # a malformed number: null it, like a failed TRY_CAST
+        value_num = pc.if_else(pc.match_substring_regex(numbers, _NUMBER), numbers, null).cast(pa.float64())
+    if (row_kinds == _BOOLEAN).any():
+        flags = pc.utf8_trim_whitespace(pc.if_else(pa.array(row_kinds == _BOOLEAN), values, null))
+        truth = pc.if_else(pc.is_in(flags, value_set=pa.array(["true", "1"])), 1.0,
+                           pc.if_else(pc.is_in(flags, value_set=pa.array(["false", "0"])), 0.0, None))
+        value_num = pc.coalesce(value_num, truth.cast(pa.float64()))
+
+    value_enum = pc.if_else(pa.array(row_kinds == _ENUM), values, null).dictionary_encode()
+    return pa.RecordBatch.from_arrays(
+        batch.columns + [value_num, value_enum.cast(pa.dictionary(pa.int32(), pa.string()))],
+        names=batch.schema.names + list(TYPED_COLUMNS))
+
+
+def _row_kinds(keys, kinds):
+    """Kind code per row: looked up per dictionary entry, spread by index."""
+    import pyarrow as pa
+    if not pa.types.is_dictionary(keys.type):
+        keys = keys.dictionary_encode()
+    names = keys.dictionary.cast(pa.string()).to_pylist()
+    table = numpy.array([kinds.get(name, _TEXT) for name in names] or [_TEXT], numpy.int8)
+    indices = keys.indices.fill_null(0).to_numpy(zero_copy_only=False)
+    return table[indices]
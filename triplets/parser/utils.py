@@ -5,10 +5,14 @@ Extracted/adapted from rdf_parser.py and rdf_parser_lxml_arrow.py cues.
 
 from io import BytesIO
 import os
+import mmap
 import uuid
+import struct
 import logging
 import zipfile
-from typing import List, Union, IO, Any
+import zlib
+import functools
+from typing import List, NamedTuple, Optional, Union, IO, Any
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,11 @@ RDF_ABOUT = f"{{{RDF_NS}}}about"
 RDF_NODEID = f"{{{RDF_NS}}}nodeID"
 RDF_RESOURCE = f"{{{RDF_NS}}}resource"
 
+# Object types parse-time pushdown (parse(types=, keys=, instances=)) always
+# keeps whole: the per-file metadata rows and the model header — exports and
+# content_hash rely on them.
+METADATA_TYPES = ("Distribution", "NamespaceMap", "FullModel")
+
 
 def clean_ID(ID: Any) -> str:
     """Removes ID prefixes used in CIM - urn:uuid:, #_, _ ."""
@@ -44,21 +53,40 @@ def _split_prefixed_name(name: str) -> str:
     return name
 
 
-def iter_all_xml(list_of_paths_to_zip_globalzip_xml: Union[str, List, Any], debug: bool = False):
-    """Yield XML file objects and/or str paths, one at a time (lazy).
+def iter_xml_sources(list_of_paths_to_zip_globalzip_xml: Union[str, List, Any], debug: bool = False):
+    """Yield (source, fingerprint, load) per XML input, without reading it.
 
-    Supports str paths, file-like, .xml/.rdf, .zip (recursive). Same items and
-    order as :func:`find_all_xml`: direct .xml/.rdf items first in input order,
-    then zip members in zip order. Zip members are read into memory only when
-    yielded, so a consumer that processes-and-drops each file keeps at most one
-    member in RAM (out-of-core ingest). Zip handles this function opens are
-    closed after their archive is exhausted.
+    The discovery behind :func:`iter_all_xml` (same items, same order).
+    ``source`` is a stable label: the absolute path, ``archive.zip!member.xml``
+    for zip members (nested zips chain with ``!``), the ``name`` of a
+    file-like. ``fingerprint`` is a change token taken without reading the
+    content: size and mtime for paths, CRC-32 and size from the zip
+    directory for members, None for file-like inputs (never assumed
+    unchanged). ``load()`` returns the str path or the member as a
+    :class:`MemberBuffer` (None when unreadable). Loads only hold the archive
+    buffer, so they may be called later and from other threads — prefetching
+    consumers decompress members in parallel.
+    """
+    for source, fingerprint, load, _ in _iter_sources(list_of_paths_to_zip_globalzip_xml, debug):
+        yield source, fingerprint, load
+
+
+def _iter_sources(list_of_paths_to_zip_globalzip_xml: Union[str, List, Any], debug: bool = False):
+    """iter_xml_sources plus ``head()`` per source: (stream, size) to read the
+    document from its start without loading it whole — the str path, or a
+    reader to close after use: a streaming decompressor for .gz/.zst/.xz,
+    zipfile's streaming member reader (inflates only what is read), a
+    rewinding wrapper of a caller's file-like. ``size`` is the
+    file size, or the uncompressed size of a zip member (None for
+    file-likes). Used by the header scan (:mod:`triplets.parser.headers`).
+    Loads of members of a zip on disk and of compressed files on disk carry
+    an ``origin`` (:class:`_Origin`) that a worker process loads itself.
     """
     items = list_of_paths_to_zip_globalzip_xml
     if isinstance(items, (str, bytes, os.PathLike)) or hasattr(items, "read"):
         items = [items]
 
-    pending_zips: List = []   # str paths (we open+close) or file-likes (caller owns)
+    pending_zips: List = []   # (zip source, label): str paths (memory-mapped), file-likes, nested members
 
     for item in items:
         if isinstance(item, os.PathLike):
@@ -70,66 +98,388 @@ def iter_all_xml(list_of_paths_to_zip_globalzip_xml: Union[str, List, Any], debu
         else:
             item_lower = str(item).lower()
 
-        if ".xml" in item_lower or ".rdf" in item_lower:
+        codec = _codec(item_lower)
+        if codec is not None and (".xml" in item_lower or ".rdf" in item_lower):
+            if debug:
+                logger.debug("Added (%s): %s", codec, getattr(item, "name", item))
+            load = lambda item=item, codec=codec: _decompressed(item, codec, _label(item))
+            if isinstance(item, str):
+                load.origin = _Origin(item, None)
+            yield (_label(item), _stat_fingerprint(item), load,
+                   lambda item=item, codec=codec: (_head_stream(item, codec), _stat_size(item)))
+        elif ".xml" in item_lower or ".rdf" in item_lower:
             # str paths stay str (no open fd; enables the cython mmap fast path)
-            yield item
             if debug:
                 logger.debug("Added: %s", getattr(item, "name", item))
+            yield (_label(item), _stat_fingerprint(item), lambda item=item: item,
+                   lambda item=item: (_head_stream(item), _stat_size(item)))
         elif ".zip" in item_lower:
-            pending_zips.append(item)
+            pending_zips.append((item, _label(item)))
             if debug:
                 logger.debug("Added for zip processing: %s", getattr(item, "name", item))
         else:
             logger.warning("Not supported file: %s", getattr(item, "name", item))
 
-    for zip_source in pending_zips:   # appends during iteration handle nested zips
-        opened = None
-        if isinstance(zip_source, str):
-            try:
-                opened = open(zip_source, "rb")
-            except Exception:
-                logger.warning("Could not open zip: %s", zip_source)
-                continue
+    for zip_source, zip_label in pending_zips:   # appends during iteration handle nested zips
         try:
+            buffer, zip_container = _open_archive(zip_source)
+        except OSError:
+            logger.warning("Could not open zip: %s", getattr(zip_source, "name", zip_source))
+            continue
+        except Exception as e:
+            logger.warning("Bad zip %s: %s", getattr(zip_source, "name", zip_source), e)
+            continue
+        for info in zip_container.infolist():
+            zipped_file = info.filename
+            zipped_file_lower = zipped_file.lower()
+            if ".xml" in zipped_file_lower or ".rdf" in zipped_file_lower:
+                load = (lambda buffer=buffer, zip_container=zip_container, info=info:
+                        _read_member(buffer, zip_container, info, debug, _codec(info.filename.lower())))
+                if isinstance(zip_source, str):
+                    load.origin = _Origin(zip_source, zipped_file)
+                yield (f"{zip_label}!{zipped_file}", f"{info.CRC:08x}:{info.file_size}", load,
+                       lambda zip_container=zip_container, info=info:
+                       (_member_reader(zip_container, info), info.file_size))
+            elif ".zip" in zipped_file_lower:
+                try:
+                    pending_zips.append((MemberBuffer(_member_content(buffer, zip_container, info), zipped_file),
+                                         f"{zip_label}!{zipped_file}"))
+                except Exception:
+                    pass
+            elif debug:
+                logger.debug("Skipped in zip: %s", zipped_file)
+
+
+class MemberBuffer:
+    """One zip member's content as a read-only, seekable file-like.
+
+    Wraps the inflated bytes of a compressed member, or a memoryview straight
+    into the memory-mapped archive for a STORED one. ``getbuffer()`` exposes
+    the content without a copy (the cython engine parses from it in place);
+    ``read()`` serves the lxml engines and other file-like consumers.
+    """
+
+    def __init__(self, content, name: str):
+        self._content = content
+        self._position = 0
+        self.name = name
+
+    def getbuffer(self) -> memoryview:
+        return memoryview(self._content)
+
+    def read(self, size: int = -1) -> bytes:
+        start, length = self._position, len(self._content)
+        end = length if size is None or size < 0 else min(start + size, length)
+        self._position = max(start, end)
+        if start == 0 and end == length and isinstance(self._content, bytes):
+            return self._content   # whole read of inflated bytes: no copy
+        return bytes(self._content[start:end])
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = (0, self._position, len(self._content))[whence]
+        self._position = max(base + offset, 0)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class _Origin(NamedTuple):
+    """Where a load() reads its document from, for a worker process to load
+    it itself: a zip on disk and a member name, or a compressed file on disk
+    (member None). The ``origin`` attribute of such loads."""
+    path: str
+    member: Optional[str]
+
+
+def _reload(origin: _Origin, debug: bool = False):
+    """What the load() of origin returns, loaded in this process."""
+    if origin.member is None:
+        return _decompressed(origin.path, _codec(origin.path.lower()), _label(origin.path))
+    stat = os.stat(origin.path)
+    buffer, zip_container = _mapped_archive(origin.path, stat.st_size, stat.st_mtime_ns)
+    return _read_member(buffer, zip_container, zip_container.getinfo(origin.member), debug,
+                        _codec(origin.member.lower()))
+
+
+@functools.lru_cache(maxsize=4)
+def _mapped_archive(path: str, size: int, mtime_ns: int):
+    """_open_archive(path), kept while size / mtime hold: a worker parsing
+    several members of one zip reads its directory once."""
+    return _open_archive(path)
+
+
+def _open_archive(zip_source: Any):
+    """(buffer, ZipFile) for a zip path or file-like.
+
+    buffer holds the whole archive — a read-only mmap for paths, the bytes
+    in memory otherwise — so member loads slice it directly and stay valid
+    after discovery moves on (no open file handle is kept).
+    """
+    if isinstance(zip_source, str):
+        with open(zip_source, "rb") as file:
             try:
-                zip_container = zipfile.ZipFile(opened if opened is not None else zip_source)
-            except Exception as e:
-                logger.warning("Bad zip %s: %s", getattr(zip_source, "name", zip_source), e)
-                continue
-            with zip_container:
-                for zipped_file in zip_container.namelist():
-                    zipped_file_lower = zipped_file.lower()
-                    if ".xml" in zipped_file_lower or ".rdf" in zipped_file_lower:
-                        try:
-                            file_object = BytesIO(zip_container.read(zipped_file))
-                            file_object.name = zipped_file
-                        except Exception as e:
-                            logger.warning("Zip member read fail %s: %s", zipped_file, e)
-                            continue
-                        if debug:
-                            logger.debug("Added from zip: %s", zipped_file)
-                        yield file_object
-                    elif ".zip" in zipped_file_lower:
-                        try:
-                            pending_zips.append(BytesIO(zip_container.read(zipped_file)))
-                        except Exception:
-                            pass
-                    elif debug:
-                        logger.debug("Skipped in zip: %s", zipped_file)
-        finally:
-            if opened is not None:
-                opened.close()
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:   # empty file: cannot be mapped
+                buffer = file.read()
+    elif isinstance(zip_source, MemberBuffer):   # nested zip
+        return zip_source.getbuffer(), zipfile.ZipFile(zip_source)
+    elif isinstance(zip_source, BytesIO):
+        buffer = zip_source.getvalue()
+    else:
+        buffer = zip_source.read()
+    if isinstance(buffer, mmap.mmap):   # zipfile wants seekable(), which mmap lacks
+        return buffer, zipfile.ZipFile(MemberBuffer(buffer, zip_source))
+    return buffer, zipfile.ZipFile(BytesIO(buffer))
+
+
+def _member_content(buffer, zip_container: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """Member content: a zero-copy slice of buffer for STORED members, inflated
+    bytes for DEFLATED ones (zlib releases the GIL, so prefetching loads on
+    worker threads decompress in parallel). Encrypted members and other
+    compression methods go through zipfile."""
+    header = bytes(buffer[info.header_offset:info.header_offset + zipfile.sizeFileHeader])
+    if (info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+            or len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader):
+        return zip_container.read(info)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    start = info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+    content = memoryview(buffer)[start:start + info.compress_size]
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        content = zlib.decompress(content, -zlib.MAX_WBITS, max(info.file_size, 1))
+    if len(content) != info.file_size or zlib.crc32(content) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return content
+
+
+def _label(item: Any) -> str:
+    if isinstance(item, str):
+        return os.path.abspath(item)
+    return getattr(item, "name", None) or f"<file-like {id(item):x}>"
+
+
+def _stat_size(item: Any) -> Optional[int]:
+    if not isinstance(item, str):
+        return None
+    try:
+        return os.stat(item).st_size
+    except OSError:
+        return None
+
+
+def _head_stream(item: Any, codec: Optional[str] = None):
+    """Reader of a direct input from its start: the str path, or a reader
+    that puts a file-like back where it was when closed (parse() reads the
+    same object afterwards)."""
+    if isinstance(item, str):
+        return item if codec is None else _decompressing_reader(item, codec)
+    return _Rewinding(item, codec)
+
+
+class _Rewinding:
+    """Reads a caller's file-like (decompressed with codec, if any) and seeks
+    it back to its starting position on close."""
+
+    def __init__(self, file: Any, codec: Optional[str] = None):
+        self._file = file
+        self._position = file.tell()
+        self._reader = file if codec is None else _decompressing_reader(file, codec)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._reader.read(size)
+
+    def close(self) -> None:
+        if self._reader is not self._file:
+            self._reader.close()
+        self._file.seek(self._position)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _member_reader(zip_container: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """Streaming reader of one member (compressed members decompressed on read)."""
+    reader = zip_container.open(info)
+    codec = _codec(info.filename.lower())
+    return reader if codec is None else _decompressing_reader(reader, codec)
+
+
+def _stat_fingerprint(item: Any):
+    if not isinstance(item, str):
+        return None
+    try:
+        stat = os.stat(item)
+    except OSError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _read_member(buffer, zip_container: zipfile.ZipFile, info: zipfile.ZipInfo, debug: bool,
+                 codec: Optional[str] = None):
+    try:
+        file_object = MemberBuffer(_member_content(buffer, zip_container, info), info.filename)
+    except Exception as e:
+        logger.warning("Zip member read fail %s: %s", info.filename, e)
+        return None
+    if debug:
+        logger.debug("Added from zip: %s", info.filename)
+    if codec is not None:
+        return _decompressed(file_object, codec, info.filename)
+    return file_object
+
+
+# Compressed single-document suffixes (a.xml.gz, b.rdf.zst, ...) → codec
+_CODECS = {".gz": "gzip", ".zst": "zstd", ".zstd": "zstd", ".xz": "xz"}
+_CHUNK = 4 << 20
+
+
+def _codec(name_lower: str) -> Optional[str]:
+    for suffix, codec in _CODECS.items():
+        if name_lower.endswith(suffix):
+            return codec
+    return None
+
+
+def _decompressing_reader(source: Any, codec: str):
+    """Binary reader yielding the decompressed document of source (path or file-like)."""
+    if codec == "zstd":
+        return _zstd_reader(source)
+    import gzip
+    import lzma
+    return (gzip.open if codec == "gzip" else lzma.open)(source, "rb")
+
+
+def _decompressed(source: Any, codec: str, name: str) -> MemberBuffer:
+    """The document inside a gzip/zstd/xz file (path or file-like), inflated
+    chunk by chunk into one buffer that the parser engines read in place —
+    no temp file, and the compressed input is never held whole. Named
+    without the codec suffix, so the result reads as plain XML."""
+    reader = _decompressing_reader(source, codec)
+    content = bytearray()
+    with reader:
+        while chunk := reader.read(_CHUNK):
+            content += chunk
+    return MemberBuffer(content, name[:name.lower().rfind(".")])
+
+
+def _zstd_reader(source: Any):
+    try:
+        from compression import zstd   # Python 3.14+
+        return zstd.open(source, "rb")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError("zstd-compressed XML needs the zstandard package. "
+                          "Install with: pip install triplets[zstd].") from error
+    if isinstance(source, str):
+        return zstandard.ZstdDecompressor().stream_reader(open(source, "rb"), read_across_frames=True,
+                                                          closefd=True)
+    return zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True, closefd=False)
+
+
+def iter_all_xml(list_of_paths_to_zip_globalzip_xml: Union[str, List, Any], debug: bool = False):
+    """Yield XML file objects and/or str paths, one at a time (lazy).
+
+    Supports str paths, file-like, .xml/.rdf, compressed .xml.gz/.xml.zst/.xml.xz
+    (on disk or in zips; yielded decompressed), .zip (recursive). Same items and
+    order as :func:`find_all_xml`: direct .xml/.rdf items first in input order,
+    then zip members in zip order. Zip members are read into memory only when
+    yielded, so a consumer that processes-and-drops each file keeps at most one
+    member in RAM (out-of-core ingest). Zip archives on disk are memory-mapped
+    and STORED members are yielded as zero-copy views into the mapping.
+    """
+    for _, _, load in iter_xml_sources(list_of_paths_to_zip_globalzip_xml, debug=debug):
+        xml_file = load()
+        if xml_file is not None:
+            yield xml_file
 
 
 def find_all_xml(list_of_paths_to_zip_globalzip_xml: Union[str, List, Any], debug: bool = False) -> List:
     """Returns list of XML file objects and/or paths in ZIP file.
 
-    Supports str paths, file-like, .xml/.rdf, .zip (recursive). Eager form of
-    :func:`iter_all_xml` — every zip member is read into memory up front.
+    Eager form of :func:`iter_all_xml` (same inputs) — every zip member and
+    compressed file is read into memory up front.
     """
     return list(iter_all_xml(list_of_paths_to_zip_globalzip_xml, debug=debug))
 
 
+def iterparse_rdf(path_or_fileobject: Union[str, IO]):
+    """(root, objects) of an RDF/XML document, parsed incrementally with lxml.
+
+    The bytes are fed to an lxml pull parser in _CHUNK pieces. ``objects``
+    yields the children of ``root`` (the rdf:RDF element) in document order
+    as each one completes (once a later sibling has started, or at the end);
+    after the consumer moves on, they are dropped from the tree, so memory
+    is bounded by a chunk plus about one object instead of the whole DOM.
+    ``root`` carries the namespace map and base from the start. Parser
+    options and base URL match the DOM parse the lxml engines used before
+    (comments and blank text removed, no ID table). A document whose root
+    is not rdf:RDF is parsed whole and its children yielded the same way.
+    """
+    from lxml import etree
+
+    if isinstance(path_or_fileobject, os.PathLike):
+        path_or_fileobject = os.fspath(path_or_fileobject)
+    if isinstance(path_or_fileobject, str):
+        stream, base_url = open(path_or_fileobject, "rb"), path_or_fileobject
+    else:
+        stream, base_url = path_or_fileobject, getattr(path_or_fileobject, "name", None)
+        try:
+            stream.seek(0)
+        except Exception:
+            pass
+    parser = etree.XMLPullParser(events=("start",), tag=f"{{{RDF_NS}}}RDF", base_url=base_url,
+                                 remove_comments=True, collect_ids=False, remove_blank_text=True)
+    try:
+        root, more = None, True
+        while root is None:
+            chunk = stream.read(_CHUNK)
+            if not chunk:
+                root, more = parser.close(), False   # no rdf:RDF root: the whole document
+                break
+            parser.feed(chunk)
+            root = next((element for _, element in parser.read_events()), None)
+    except BaseException:
+        if stream is not path_or_fileobject:
+            stream.close()
+        raise
+
+    def objects():
+        nonlocal more
+        try:
+            while True:
+                complete = root[:len(root) - 1] if more else list(root)
+                yield from complete
+                del root[:len(complete)]
+                if not more:
+                    return
+                chunk = stream.read(_CHUNK)
+                if chunk:
+                    parser.feed(chunk)
+                else:
+                    parser.close()
+                    more = False
+        finally:
+            if stream is not path_or_fileobject:
+                stream.close()
+
+    return root, objects()
+
+
 def get_namespace_map_from_root(root: Any) -> dict:
     """Best effort ns map + xml_base from element (lxml or pygixml style)."""
     nsmap = {}
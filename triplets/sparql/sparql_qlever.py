@@ -53,7 +53,7 @@ from .._caches import register_cache
 from .._content_key import content_key
 from .._engine_detect import flavor, to_pandas, to_return_type
 from ..export.nquads_utils import CIM_NS, build_key_metadata
-from ..parser.nquads import terms_to_triplets
+from ..parser.nquads import terms_to_batch
 
 logger = logging.getLogger(__name__)
 
@@ -106,8 +106,8 @@ def _run(call, query_string, *args):
 
 
 def _finalize(result, return_type):
-    """Canonical result (RecordBatch from the C++ decode, or the pandas
-    triplet frame from _terms_to_triplets) → requested flavor. Arrow is the
+    """Canonical result (RecordBatch from the C++ decode, or the triplet
+    batch from _terms_to_triplets) → requested flavor. Arrow is the
     hub: pandas/polars conversions are zero-copy buffer wraps."""
     if isinstance(result, pyarrow.RecordBatch):
         if return_type == "polars":
@@ -187,8 +187,6 @@ def _query_form(query_string):
 
 def _terms_to_triplets(batch):
     """CONSTRUCT/DESCRIBE term columns (N-Triples-form, decoded on the C++
-    side) → triplet DataFrame via the shared term conversion (the inverse of
-    the N-Quads export conventions, see parser.nquads.terms_to_triplets)."""
-    frame = batch.to_pandas(types_mapper=pandas.ArrowDtype)
-    frame.columns = ["ID", "KEY", "VALUE"]
-    return terms_to_triplets(frame)
+    side) → triplet RecordBatch via the shared term conversion (the inverse
+    of the N-Quads export conventions, see parser.nquads.terms_to_batch)."""
+    return terms_to_batch(batch.column(0), batch.column(1), batch.column(2))
@@ -23,6 +23,7 @@ import warnings
 
 from .._engine_detect import flavor
 from .._registry import EngineRegistry
+from .index import TripletIndex, triplet_index
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,7 @@ always uses double-quoted identifiers. ATTACHed extra catalogs are out of
 scope — the config lives in the default catalog.
 """
 import logging
+import uuid
 
 from weakref import WeakKeyDictionary
 
@@ -31,6 +32,7 @@ _DEFAULT_TABLE = "triplets"
 _DEFAULT_SCHEMA = None
 _UNSET = object()              # "caller passed nothing" (None is a real schema value)
 _config = WeakKeyDictionary()  # connection → (schema, table)
+_id_tables = WeakKeyDictionary()  # connection → {view: temp table of its ID list}
 
 _CONFIG_TABLE = 'main."_triplets_config"'
 
@@ -148,11 +150,38 @@ def _lit(value):
     return "'" + str(value).replace("'", "''") + "'"
 
 
+def _temp_name(prefix):
+    """A fresh temp table name: lazy results over a temp table must not see
+    it replaced by a later call."""
+    return f"{prefix}_{uuid.uuid4().hex}"
+
+
 def _in_list(values):
     """Comma-separated SQL literal list from an iterable of values."""
     return ", ".join(_lit(v) for v in values)
 
 
+_ID_LIST_MAX = 1000   # longer ID lists go through a temp table, not SQL literals
+
+
+def _id_set(self, ids):
+    """(SQL for a set of IDs for ``ID IN (...)``, its temp table or None): the
+    literal list, or past _ID_LIST_MAX IDs a subquery over a fresh temp
+    table loaded from a frame — a hash semi-join instead of parsing a
+    literal per ID. The caller owns (and drops) the table."""
+    if len(ids) <= _ID_LIST_MAX:
+        return _in_list(ids), None
+    import pandas
+    table = _quote(_temp_name("_triplets_ids"))
+    registered = _temp_name("_reg_ids")   # per call: concurrent callers share the connection
+    self.register(registered, pandas.DataFrame({"ID": ids}))
+    try:
+        self.execute(f"CREATE TEMP TABLE {table} AS SELECT DISTINCT ID FROM {_quote(registered)}")
+    finally:
+        self.unregister(registered)
+    return f"SELECT ID FROM {table}", table
+
+
 def _materialize(self, data, name):
     """Copy an external triplet dataset (pandas DataFrame / relation) into a temp
     table so later SQL is independent of the python object's lifetime."""
@@ -175,14 +204,29 @@ def _create_view(self, view_name, query, schema=None):
     return self.sql(f"SELECT * FROM {ref}")
 
 
-def _check_string_to_number(string_to_number):
-    if string_to_number:
+def _check_string_to_number(string_to_number, rdf_map=None):
+    if string_to_number and rdf_map is None:
         raise ValueError("string_to_number=True is not implemented for the duckdb engine "
-                         "(tableview columns are VARCHAR); pass string_to_number=False")
+                         "(tableview columns are VARCHAR); pass string_to_number=False, "
+                         "or rdf_map= to type the columns by the export schema")
+
+
+def _typed_pivot(pivot, keys, rdf_map, multivalue):
+    """pivot (a PIVOT statement) with the columns the export schema types as
+    numbers / xsd:boolean TRY_CAST to DOUBLE / BOOLEAN (malformed → NULL)."""
+    if rdf_map is None or multivalue:
+        return pivot
+    from ..parser.typed import column_kinds
+    kinds = column_kinds(rdf_map, keys)
+    if not kinds:
+        return pivot
+    casts = ", ".join(f"TRY_CAST({_quote(key)} AS {'DOUBLE' if kind == 'number' else 'BOOLEAN'}) AS {_quote(key)}"
+                      for key, kind in kinds.items())
+    return f"SELECT * REPLACE ({casts}) FROM ({pivot})"
 
 
 def _pivot_view(self, view_name, id_predicate, table_name, ord_expr, schema=None,
-                multivalue=False):
+                multivalue=False, rdf_map=None):
     """Create a named view pivoting the triplets of the IDs selected by
     id_predicate (a subquery or literal list usable inside ``ID IN (...)``).
 
@@ -190,7 +234,8 @@ def _pivot_view(self, view_name, id_predicate, table_name, ord_expr, schema=None
     up front: the column set is fixed at creation time, while the values stay lazy.
     With ``multivalue=True`` a key holding several values renders the literal
     ``['a', 'b']`` text (single values stay bare) — the same string encoding the
-    pandas/polars engines produce.
+    pandas/polars engines produce. With ``rdf_map`` the schema-typed columns
+    are TRY_CAST inside the view (see _typed_pivot).
     """
     keys = [row[0] for row in self.execute(
         f"SELECT DISTINCT KEY FROM {table_name} WHERE ID IN ({id_predicate})").fetchall()]
@@ -198,24 +243,28 @@ def _pivot_view(self, view_name, id_predicate, table_name, ord_expr, schema=None
         return _create_view(self, view_name,
                             f"SELECT ID FROM {table_name} WHERE ID IN ({id_predicate})", schema)
     in_list = ", ".join(_lit(k) for k in keys)
-    if multivalue:
-        # element order = load order (matches pandas/polars maintain_order)
-        value = ("CASE WHEN count(*) = 1 THEN any_value(VALUE) "
-                 "ELSE '[''' || string_agg(VALUE, ''', ''' ORDER BY _view_ord) || ''']' END")
-    else:
-        # Multi-valued keys take the load-order-first value so the single-value
-        # pick matches pandas/polars and the view is deterministic.
-        value = "arg_min(VALUE, _view_ord)"
+    value = _aggregate_value(multivalue)
     # ord_expr is computed in a subquery: a window (row_number fallback) can't
     # sit inside the aggregate directly.
     return _create_view(self, view_name, f"""
         WITH s AS (SELECT ID, KEY, VALUE, {ord_expr} AS _view_ord FROM {table_name}),
              d AS (SELECT ID, KEY, {value} AS VALUE FROM s
                    WHERE ID IN ({id_predicate}) GROUP BY ID, KEY)
-        PIVOT d ON KEY IN ({in_list}) USING FIRST(VALUE) GROUP BY ID
+        {_typed_pivot(f"PIVOT d ON KEY IN ({in_list}) USING FIRST(VALUE) GROUP BY ID", keys, rdf_map, multivalue)}
     """, schema)
 
 
+def _aggregate_value(multivalue):
+    """SQL aggregate for one (ID, KEY) cell, over rows carrying _view_ord."""
+    if multivalue:
+        # element order = load order (matches pandas/polars maintain_order)
+        return ("CASE WHEN count(*) = 1 THEN any_value(VALUE) "
+                "ELSE '[''' || string_agg(VALUE, ''', ''' ORDER BY _view_ord) || ''']' END")
+    # Multi-valued keys take the load-order-first value so the single-value
+    # pick matches pandas/polars and the view is deterministic.
+    return "arg_min(VALUE, _view_ord)"
+
+
 def types_dict(self, contains=None, case_insensitive=True, table=None, schema=None, table_name=None):
     """Return dict of {type_name: count}.
 
@@ -240,18 +289,19 @@ def types_dict(self, contains=None, case_insensitive=True, table=None, schema=No
 
 
 def type_tableview(self, type_name, table=None, schema=None, table_name=None, view_name=None,
-                   string_to_number=False, multivalue=False):
+                   string_to_number=False, multivalue=False, rdf_map=None):
     """Create a named SQL view pivoting all objects of a type; return a relation
     over it. The view defaults to the type name (override with view_name) and is
     created in the resolved schema, next to the data. multivalue=True renders
-    multi-valued keys as the literal ['a', 'b'] text (pandas/polars encoding);
+    multi-valued keys as the literal ['a', 'b'] text (pandas/polars encoding).
+    rdf_map (export schema) types the columns by xsd:type with TRY_CAST;
     string_to_number is accepted for signature parity but not implemented."""
-    _check_string_to_number(string_to_number)
+    _check_string_to_number(string_to_number, rdf_map)
     sch, tbl = _table_parts(self, table=table, schema=schema, table_name=table_name)
     ref = _sql_name(sch, tbl)
     ids = f"SELECT DISTINCT ID FROM {ref} WHERE KEY = 'Type' AND VALUE = {_lit(type_name)}"
     return _pivot_view(self, view_name or type_name, ids, ref, _ord_expr(self, sch, tbl), sch,
-                       multivalue=multivalue)
+                       multivalue=multivalue, rdf_map=rdf_map)
 
 
 def filter_triplets(self, ID=None, KEY=None, VALUE=None, INSTANCE_ID=None,
@@ -391,29 +441,39 @@ def references_from(self, reference, levels=1, table=None, schema=None, table_na
 # ── Query / view ─────────────────────────────────────────────────────────────
 
 def key_tableview(self, key, table=None, schema=None, table_name=None, view_name=None,
-                  string_to_number=False, multivalue=False):
+                  string_to_number=False, multivalue=False, rdf_map=None):
     """Create a named SQL view pivoting objects carrying a given KEY; return a
     relation over it. The view defaults to the key name (override with view_name)."""
-    _check_string_to_number(string_to_number)
+    _check_string_to_number(string_to_number, rdf_map)
     sch, tbl = _table_parts(self, table=table, schema=schema, table_name=table_name)
     ref = _sql_name(sch, tbl)
     ids = f"SELECT DISTINCT ID FROM {ref} WHERE KEY = {_lit(key)}"
     return _pivot_view(self, view_name or key, ids, ref, _ord_expr(self, sch, tbl), sch,
-                       multivalue=multivalue)
+                       multivalue=multivalue, rdf_map=rdf_map)
 
 
 def id_tableview(self, id, table=None, schema=None, table_name=None, view_name=None,
-                 string_to_number=False, multivalue=False):
+                 string_to_number=False, multivalue=False, rdf_map=None):
     """Create a named SQL view pivoting the given ID(s) — a single id or an
     iterable — and return a relation over it. The view defaults to the id when a
-    single one is given, else 'id_tableview' (override with view_name)."""
-    _check_string_to_number(string_to_number)
+    single one is given, else 'id_tableview' (override with view_name). Lists
+    of more than 1000 IDs are kept in a temp table of the view's own, so the
+    view lasts as long as the connection; replacing the view drops it."""
+    _check_string_to_number(string_to_number, rdf_map)
     sch, tbl = _table_parts(self, table=table, schema=schema, table_name=table_name)
     ids = [id] if isinstance(id, str) else list(id)
     if view_name is None:
         view_name = ids[0] if len(ids) == 1 else "id_tableview"
-    return _pivot_view(self, view_name, _in_list(ids), _sql_name(sch, tbl),
-                       _ord_expr(self, sch, tbl), sch, multivalue=multivalue)
+    id_set, id_table = _id_set(self, ids)
+    relation = _pivot_view(self, view_name, id_set, _sql_name(sch, tbl),
+                           _ord_expr(self, sch, tbl), sch, multivalue=multivalue, rdf_map=rdf_map)
+    tables = _id_tables.setdefault(self, {})
+    previous = tables.pop(_sql_name(sch, view_name), None)
+    if previous is not None:   # the replaced view's ID list
+        self.execute(f"DROP TABLE IF EXISTS {previous}")
+    if id_table is not None:
+        tables[_sql_name(sch, view_name)] = id_table
+    return relation
 
 
 def get_object_data(self, object_UUID, table=None, schema=None, table_name=None):
@@ -422,6 +482,23 @@ def get_object_data(self, object_UUID, table=None, schema=None, table_name=None)
     return self.sql(f"SELECT KEY, VALUE FROM {table_name} WHERE ID = {_lit(object_UUID)}")
 
 
+def get_objects_data(self, ids, table=None, schema=None, table_name=None):
+    """All rows of many objects at once (an ID or an iterable of IDs) — one
+    semi-join on ID instead of a query per object. Lists of more than 1000
+    IDs are joined as a relation over a frame instead of SQL literals; it
+    names nothing on the connection and is freed with the result. Returns
+    DuckDBPyRelation (lazy)."""
+    table_name = _resolve_table(self, table=table, schema=schema, table_name=table_name)
+    ids = [ids] if isinstance(ids, str) else list(ids)
+    if not ids:
+        return self.sql(f"SELECT * FROM {table_name} WHERE FALSE")
+    if len(ids) <= _ID_LIST_MAX:
+        return self.sql(f"SELECT * FROM {table_name} WHERE ID IN ({_in_list(ids)})")
+    import pandas
+    return self.sql(f"SELECT * FROM {table_name}").join(
+        self.from_df(pandas.DataFrame({"ID": ids})), "ID", how="semi")
+
+
 def get_namespace_map(self, table=None, schema=None, table_name=None):
     """Return (namespace_map dict, xml_base) from the NamespaceMap object."""
     table_name = _resolve_table(self, table=table, schema=schema, table_name=table_name)
@@ -437,11 +514,42 @@ def get_namespace_map(self, table=None, schema=None, table_name=None):
 
 
 def triplets_to_tableviews(self, table=None, schema=None, table_name=None,
-                           string_to_number=False, multivalue=False):
-    """Return {type_name: tableview relation} for every type in the dataset."""
-    return {name: type_tableview(self, name, table=table, schema=schema, table_name=table_name,
-                                 string_to_number=string_to_number, multivalue=multivalue)
-            for name in types_dict(self, table=table, schema=schema, table_name=table_name)}
+                           string_to_number=False, multivalue=False, rdf_map=None):
+    """Return {type_name: tableview relation} for every type in the dataset.
+
+    One pass over the table instead of a type_tableview per type: a temp
+    table holds each object's (ID, KEY) value, aggregated as in _pivot_view
+    and tagged with the object's Type, sorted by Type so each relation's
+    filter reads only its own row groups. Each type is one PIVOT over it;
+    the KEY lists of all types come from one GROUP BY. The tableviews are
+    materialized (relations over Arrow tables, a snapshot of the table at
+    call time) and the temp table is dropped before returning; no named
+    per-type views are created on the connection — use type_tableview for
+    those. rdf_map types the columns as in type_tableview.
+    """
+    _check_string_to_number(string_to_number, rdf_map)
+    sch, tbl = _table_parts(self, table=table, schema=schema, table_name=table_name)
+    ref = _sql_name(sch, tbl)
+    cells = _quote(_temp_name("_triplets_tableviews"))
+    self.execute(f"""
+        CREATE TEMP TABLE {cells} AS
+        WITH s AS (SELECT ID, KEY, VALUE, {_ord_expr(self, sch, tbl)} AS _view_ord FROM {ref}),
+             t AS (SELECT DISTINCT ID, VALUE AS _type FROM {ref} WHERE KEY = 'Type')
+        SELECT t._type, s.ID, s.KEY, {_aggregate_value(multivalue)} AS VALUE
+        FROM s JOIN t USING (ID)
+        GROUP BY t._type, s.ID, s.KEY
+        ORDER BY t._type
+    """)
+    try:
+        keys = dict(self.execute(f"SELECT _type, list(DISTINCT KEY) FROM {cells} GROUP BY _type").fetchall())
+        return {name: self.from_arrow(self.execute(_typed_pivot(
+                    f"PIVOT (SELECT ID, KEY, VALUE FROM {cells} WHERE _type = {_lit(name)}) "
+                    f"ON KEY IN ({_in_list(keys[name])}) USING FIRST(VALUE) GROUP BY ID",
+                    keys[name], rdf_map, multivalue)).to_arrow_table())
+                for name in types_dict(self, table=table, schema=schema, table_name=table_name)
+                if name in keys}
+    finally:
+        self.execute(f"DROP TABLE IF EXISTS {cells}")
 
 
 # ── References ───────────────────────────────────────────────────────────────
@@ -0,0 +1,396 @@
+"""Triplet indexes — row lookups by ID, KEY, Type and reference without a scan.
+
+A TripletIndex holds, for one triplet DataFrame, integer-coded lookup
+structures over its row positions, each built on first use:
+
+- ID → rows: the IDs factorized to codes, a stable sort permutation and the
+  start of every code's run in it (rows of one object, in frame order), and
+  a hash index ID → code;
+- KEY → rows: the same over the KEY column;
+- (KEY, VALUE) → rows: per KEY, its rows grouped by VALUE — Type → objects
+  for ``KEY == "Type"``;
+- VALUE → referencing rows: each row's VALUE resolved to an ID code (-1 when
+  it names no object in the frame) and the rows grouped by that target;
+- the reference graph: the rows that name an object (the links
+  ``references_all`` lists) in compressed-sparse-row form both ways — grouped
+  by target (who references an object) and by source object (what an object
+  references) — over the integer ID codes, so a level of ``references_to`` /
+  ``references_from`` is a few NumPy gathers over the frontier.
+
+The pandas and polars tools engines look their input up with
+:func:`triplet_index`: the first lookup on a frame scans as before and
+marks it, the second builds its index, and lookups from then on
+(``get_object_data``, the tableviews, ``filter_triplets_by_type``,
+``references_to`` / ``references_from``) gather row positions instead of
+scanning all rows. Indexes are cached per frame identity in an
+:class:`triplets._identity.IdentityCache` — modifying or replacing a column
+of the frame drops its index, and the next lookups scan and rebuild;
+``triplets.clear_caches()`` drops them all.
+
+Needs pyarrow (the codes come from Arrow's hash kernels); without it the
+tools scan as before.
+"""
+import numpy
+
+from .._identity import IdentityCache
+
+_INDEXES = IdentityCache(engine_state=True)   # frame → TripletIndex, _SEEN after its first lookup, or _UNINDEXABLE
+_SEEN = object()
+_UNINDEXABLE = object()
+
+
+def triplet_index(data, build=False):
+    """The TripletIndex of a pandas / polars triplet frame, or None.
+
+    None on the first lookup of a frame (one scan is cheaper than building),
+    for frames without ID / KEY / VALUE columns or whose columns are not all
+    text (the index compares strings), and without pyarrow. ``build=True``
+    builds it on the first call.
+    """
+    cached = _INDEXES.get(data)
+    if isinstance(cached, TripletIndex):
+        return cached
+    if cached is _UNINDEXABLE or not _indexable(data):
+        return None
+    if cached is None and not build:
+        _INDEXES.put(data, _SEEN)
+        return None
+    import pyarrow as pa
+    try:
+        index = TripletIndex(data)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):   # numbers mixed into an object column
+        _INDEXES.put(data, _UNINDEXABLE)
+        return None
+    return _INDEXES.put(data, index)
+
+
+class TripletIndex:
+    """Lookup structures over the rows of one triplet frame (see module docstring).
+
+    Row positions are numpy int64 arrays of positions in the frame (iloc /
+    row numbers), ascending within one ID / KEY / VALUE.
+    """
+
+    def __init__(self, data):
+        # Arrow views of the columns, not the frame: the cache holds frames weakly
+        self._columns = {name: _column(data, name) for name in ("ID", "KEY", "VALUE")}
+        self._ids = None
+        self._id_lookup = None
+        self._keys = None
+        self._key_values = {}
+        self._targets = None
+        self._sources = None
+
+    # ── ID ──────────────────────────────────────────────────────────────
+
+    @property
+    def id_codes(self):
+        """ID code of every row."""
+        return self._id_structure()[0]
+
+    @property
+    def ids(self):
+        """The distinct IDs, in code order (first appearance)."""
+        return self._id_structure()[1]
+
+    def id_code(self, ids):
+        """Codes of ids (one ID → int, a sequence → int64 array), -1 for IDs not in the frame."""
+        lookup = self._lookup()
+        if isinstance(ids, str):
+            try:
+                return int(lookup.get_loc(ids))
+            except KeyError:
+                return -1
+        return lookup.get_indexer(numpy.asarray(ids, dtype=object)).astype(numpy.int64)
+
+    def id_rows(self, id):
+        """Rows of one object (empty when the ID is not in the frame), or of
+        the objects of a sequence of IDs, in frame order."""
+        if not isinstance(id, str):
+            return numpy.sort(self.object_rows(self.id_code(id)))
+        code = self.id_code(id)
+        if code < 0:
+            return numpy.empty(0, numpy.int64)
+        _, _, order, offsets = self._id_structure()
+        return order[offsets[code]:offsets[code + 1]]
+
+    def rows_of_codes(self, codes):
+        """Rows of the objects with these ID codes, object after object;
+        returns (rows, position in codes of each row's object)."""
+        _, _, order, offsets = self._id_structure()
+        return _gather(order, offsets, numpy.asarray(codes, dtype=numpy.int64))
+
+    def object_rows(self, codes):
+        """Rows of the distinct objects of codes (-1 skipped), object after
+        object in the order they first appear in the frame — each object once
+        however often codes repeats it."""
+        codes = numpy.asarray(codes, dtype=numpy.int64)
+        codes = _distinct(codes[codes >= 0])
+        rows, _ = self.rows_of_codes(codes[numpy.argsort(self.first_rows(codes))])
+        return rows
+
+    def first_rows(self, codes):
+        """One row (the first) of each object of codes — to read its ID."""
+        _, _, order, offsets = self._id_structure()
+        return order[offsets[numpy.asarray(codes, dtype=numpy.int64)]]
+
+    # ── KEY / VALUE ─────────────────────────────────────────────────────
+
+    def key_rows(self, key):
+        """Rows with this KEY."""
+        codes, lookup, order, offsets = self._key_structure()
+        code = lookup.get(key)
+        if code is None:
+            return numpy.empty(0, numpy.int64)
+        return order[offsets[code]:offsets[code + 1]]
+
+    def value_rows(self, key, value):
+        """Rows with this KEY and VALUE — ``value_rows("Type", "ACLineSegment")``
+        are the Type rows of the ACLineSegments."""
+        grouped = self._key_values.get(key)
+        if grouped is None:
+            grouped = self._key_values[key] = self._group_values(self.key_rows(key))
+        return grouped.get(value, numpy.empty(0, numpy.int64))
+
+    # ── References ──────────────────────────────────────────────────────
+
+    @property
+    def targets(self):
+        """ID code of the object each row's VALUE names, -1 where it names none."""
+        return self._target_structure()[0]
+
+    def referencing_rows(self, codes):
+        """Rows whose VALUE names the objects of codes, object after object;
+        returns (rows, position in codes of each row's target)."""
+        _, order, offsets = self._target_structure()
+        return _gather(order, offsets, numpy.asarray(codes, dtype=numpy.int64))
+
+    def referenced_rows(self, codes):
+        """Rows of the objects of codes whose VALUE names an object, object
+        after object; returns (rows, position in codes of each row's object)."""
+        order, offsets = self._source_structure()
+        return _gather(order, offsets, numpy.asarray(codes, dtype=numpy.int64))
+
+    def levels_to(self, codes, levels, link="target"):
+        """The references_to traversal from the objects of codes (repeats
+        allowed — the ID codes of the seed rows): per level,
+        (source codes, target codes) — every object referencing the previous
+        level's objects, once, with the object it was reached through: the
+        first one in the previous level's order, or with ``link="row"`` the
+        one its first referencing row names. The sources are the next
+        level's objects; stops early at a level without referrers."""
+        frontier = _first_seen(numpy.asarray(codes, dtype=numpy.int64))
+        for _ in range(levels):
+            rows, target = self.referencing_rows(frontier)
+            if link == "row":
+                order = numpy.argsort(rows, kind="stable")
+                rows, target = rows[order], target[order]
+            sources = self.id_codes[rows]
+            keep = _first_positions(sources)
+            keep = keep[sources[keep] >= 0]
+            if not len(keep):
+                return
+            frontier, targets = sources[keep], frontier[target[keep]]
+            yield frontier, targets
+
+    def levels_from(self, rows, levels):
+        """The references_from traversal from rows: per level, (referencing
+        rows, target codes) — every reference of the previous level, repeats
+        kept: level 1 follows the references among rows, each next level
+        those of the objects reached. Stops early at a level without references."""
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+        linking = rows[self.targets[rows] >= 0]
+        for _ in range(levels):
+            if not len(linking):
+                return
+            targets = self.targets[linking]
+            yield linking, targets
+            linking, _ = self.referenced_rows(targets)
+
+    # ── Construction ────────────────────────────────────────────────────
+
+    def _id_structure(self):
+        if self._ids is None:
+            codes, uniques = _factorize(self._columns["ID"])
+            self._ids = (codes, uniques) + _runs(codes, len(uniques))
+        return self._ids
+
+    def _lookup(self):
+        if self._id_lookup is None:
+            import pandas
+            ids = self.ids
+            self._id_lookup = pandas.Index(ids.to_numpy(zero_copy_only=False), dtype=object)
+        return self._id_lookup
+
+    def _key_structure(self):
+        if self._keys is None:
+            codes, uniques = _factorize(self._columns["KEY"])
+            lookup = {key: code for code, key in enumerate(uniques.to_pylist())}
+            self._keys = (codes, lookup) + _runs(codes, len(uniques))
+        return self._keys
+
+    def _group_values(self, rows):
+        values = self._columns["VALUE"]
+        if len(rows):
+            values = _take(values, rows)
+        codes, uniques = _factorize(values)
+        order, offsets = _runs(codes, len(uniques))
+        return {value: rows[order[offsets[code]:offsets[code + 1]]]
+                for code, value in enumerate(uniques.to_pylist()) if value is not None}
+
+    def _target_structure(self):
+        if self._targets is None:
+            import pyarrow.compute as pc
+            values = _searchable(_plain(self._columns["VALUE"]))   # a transient copy for polars' views
+            targets = pc.index_in(values, value_set=_searchable(_plain(self.ids)).cast(values.type)).fill_null(-1)
+            targets = _numpy(targets).astype(numpy.int64)
+            self._targets = (targets,) + _runs(targets, len(self.ids))
+        return self._targets
+
+    def _source_structure(self):
+        if self._sources is None:
+            linking = numpy.flatnonzero(self.targets >= 0)
+            order, offsets = _runs(self.id_codes[linking], len(self.ids))
+            self._sources = (linking[order], offsets)
+        return self._sources
+
+
+def _indexable(data):
+    from .._engine_detect import flavor
+    if flavor(data) not in ("pandas", "polars"):
+        return False
+    if not {"ID", "KEY", "VALUE"}.issubset(data.columns):
+        return False
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _column(data, name):
+    """A column of a pandas / polars frame as a pyarrow ChunkedArray (zero-copy where possible)."""
+    import pandas
+    import pyarrow as pa
+    from .._engine_detect import flavor
+    if flavor(data) == "polars":
+        return pa.chunked_array(data.get_column(name))   # string_view: factorized as is
+    series = data[name]
+    arrow = getattr(series.array, "_pa_array", None)
+    if arrow is not None:
+        return arrow
+    if isinstance(series.dtype, pandas.CategoricalDtype):
+        return pa.chunked_array([pa.DictionaryArray.from_arrays(
+            series.cat.codes.to_numpy(), _text(series.cat.categories.to_numpy(dtype=object)))])
+    return pa.chunked_array([_text(series.to_numpy(dtype=object))])
+
+
+def _text(values):
+    """Arrow strings of an object array; raises ArrowTypeError on non-string values."""
+    import pyarrow as pa
+    return pa.array(values, from_pandas=True, type=pa.string())
+
+
+def _factorize(column):
+    """(int64 codes with -1 for nulls, distinct values) of a ChunkedArray."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    if not pa.types.is_dictionary(column.type):
+        column = pc.dictionary_encode(column)
+    column = column.unify_dictionaries()
+    if column.num_chunks == 0:
+        return numpy.empty(0, numpy.int64), pa.array([], column.type.value_type)
+    codes = numpy.concatenate([_numpy(chunk.indices.cast("int64").fill_null(-1)) for chunk in column.chunks]).astype(numpy.int64)
+    return codes, column.chunk(0).dictionary
+
+
+def _runs(codes, count):
+    """(order, offsets): rows sorted stably by code (nulls / -1 dropped) and
+    where each code's run starts — rows of code c are order[offsets[c]:offsets[c + 1]]."""
+    order = numpy.argsort(codes, kind="stable")
+    counts = numpy.bincount(codes[codes >= 0], minlength=count)
+    offsets = numpy.zeros(count + 1, numpy.int64)
+    numpy.cumsum(counts, out=offsets[1:])
+    return order[len(codes) - offsets[-1]:], offsets
+
+
+def _gather(order, offsets, codes):
+    """Concatenated runs of codes in order[] and, per element, its code's
+    position in codes (-1 codes have empty runs)."""
+    valid = codes >= 0
+    if not valid.all():
+        codes = numpy.where(valid, codes, 0)
+    starts = offsets[codes]
+    lengths = numpy.where(valid, offsets[codes + 1] - starts, 0)
+    owner = numpy.repeat(numpy.arange(len(codes)), lengths)
+    within = numpy.arange(lengths.sum()) - numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+    return order[numpy.repeat(starts, lengths) + within], owner
+
+
+def take_chunks(column, rows):
+    """column.take(rows) for a multi-chunk pyarrow ChunkedArray, gathered
+    chunk by chunk: Arrow's take concatenates all chunks first, which costs
+    far more than a small gather from a frame of many files."""
+    import pyarrow as pa
+    rows = numpy.asarray(rows, dtype=numpy.int64)
+    starts = numpy.cumsum([0] + [len(chunk) for chunk in column.chunks])
+    chunk = numpy.searchsorted(starts, rows, side="right") - 1
+    order = numpy.argsort(chunk, kind="stable")
+    bounds = numpy.searchsorted(chunk[order], numpy.arange(column.num_chunks + 1))
+    pieces = [column.chunk(i).take(pa.array(rows[order[bounds[i]:bounds[i + 1]]] - starts[i]))
+              for i in range(column.num_chunks) if bounds[i + 1] > bounds[i]]
+    gathered = pa.chunked_array(pieces, type=column.type)
+    return gathered.take(pa.array(numpy.argsort(order))) if len(rows) else gathered
+
+
+def _distinct(codes):
+    """The distinct codes, ascending. Sort-based: numpy.unique hashes, which
+    is several times slower on int64 codes."""
+    codes = numpy.sort(codes)
+    return codes[numpy.concatenate(([True], codes[1:] != codes[:-1]))] if len(codes) else codes
+
+
+def _first_positions(codes):
+    """Positions of each code's first appearance, ascending."""
+    if not len(codes):
+        return numpy.empty(0, numpy.int64)
+    order = numpy.argsort(codes, kind="stable")
+    ordered = codes[order]
+    return numpy.sort(order[numpy.concatenate(([True], ordered[1:] != ordered[:-1]))])
+
+
+def _first_seen(codes):
+    """The distinct codes, in order of first appearance."""
+    return codes[_first_positions(codes)]
+
+
+def _take(column, rows):
+    """column.take(rows); a string_view column (polars' export, which Arrow's
+    take has no kernel for) is gathered by polars, whose buffers it shares."""
+    import pyarrow as pa
+    if column.type == pa.string_view():
+        import polars as pl
+        return pa.chunked_array(pl.from_arrow(column, rechunk=False).gather(rows).to_arrow())
+    return column.take(pa.array(rows))
+
+
+def _searchable(array):
+    """string_view → large_string for index_in (no string_view kernel)."""
+    import pyarrow as pa
+    return array.cast(pa.large_string()) if array.type == pa.string_view() else array
+
+
+def _plain(array):
+    """dictionary → its value type (index_in matches plain values)."""
+    import pyarrow as pa
+    if pa.types.is_dictionary(array.type):
+        return array.cast(array.type.value_type)
+    return array
+
+
+def _numpy(array):
+    """numpy copy of an Array / ChunkedArray without nulls."""
+    chunks = getattr(array, "chunks", [array])
+    if not chunks:
+        return numpy.empty(0, numpy.int64)
+    return numpy.concatenate([chunk.to_numpy(zero_copy_only=False) for chunk in chunks])
@@ -13,8 +13,11 @@
 
 import logging
 
+import numpy
 import pandas
 
+from .index import take_chunks, triplet_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,9 +77,11 @@ def get_namespace_map(data: pandas.DataFrame):
     return namespace_map, xml_base
 
 
-def _numeric_columns(data_view):
+def _numeric_columns(data_view, skip=()):
     """Convert columns that contain only numbers to numeric dtypes."""
     for column in data_view.columns:
+        if column in skip:
+            continue
         try:
             data_view[column] = pandas.to_numeric(data_view[column], errors="raise")
         except (ValueError, TypeError):
@@ -84,18 +89,63 @@ def _numeric_columns(data_view):
     return data_view
 
 
-def _tableview(rows, data, string_to_number, multivalue, label):
+def _object_data(rows, data):
+    """All triplets of the objects whose IDs rows hold (a scan of data)."""
+    return pandas.merge(rows[["ID"]].drop_duplicates(), data, on="ID")
+
+
+def _id_values(id):
+    """The IDs of an ``id`` argument: one ID, a list / array / Series of
+    them, or a DataFrame with an ID column — without copying a sequence."""
+    if isinstance(id, str):
+        return [id]
+    if isinstance(id, pandas.DataFrame):
+        return id["ID"]
+    return id
+
+
+def _indexed_object_data(index, codes, data):
+    """All triplets of the objects with these ID codes (a TripletIndex gather)."""
+    rows = index.object_rows(codes)
+    return _take(data, rows).reset_index(drop=True)
+
+
+def _chunked(values):
+    """Whether a column is Arrow-backed with several chunks (see _take)."""
+    arrow = getattr(values.array, "_pa_array", None)
+    return arrow is not None and arrow.num_chunks > 1
+
+
+def _take_array(values, rows):
+    """values.take(rows) for a column's array; a multi-chunk Arrow array is
+    gathered chunk by chunk (index.take_chunks)."""
+    arrow = getattr(values, "_pa_array", None)
+    if arrow is None or arrow.num_chunks < 2:
+        return values.take(rows)
+    return values._from_pyarrow_array(take_chunks(arrow, rows))
+
+
+def _take(data, rows):
+    """data.take(rows), gathering multi-chunk Arrow columns chunk by chunk —
+    a parse of many files has a chunk per file, and Arrow's take would
+    concatenate them all for every lookup."""
+    if not any(_chunked(values) for _, values in data.items()):
+        return data.take(rows)
+    index = data.index.take(rows)
+    columns = {name: pandas.Series(_take_array(values.array, rows), index=index, dtype=values.dtype, copy=False)
+               for name, values in data.items()}
+    return pandas.DataFrame(columns, index=index).__finalize__(data)
+
+
+def _tableview(object_data, string_to_number, multivalue, label, rdf_map=None):
     """Shared pivot core for the three tableview functions.
 
-    rows: triplet rows whose IDs select the objects; data: full dataset
-    providing all triplets of the selected objects.
+    object_data: all triplets of the selected objects.
     """
-    if rows.empty:
+    if object_data.empty:
         logger.warning(f'No data available for {label}')
         return None
 
-    object_data = pandas.merge(rows[["ID"]].drop_duplicates(), data, on="ID")
-
     if multivalue:
         def _aggregate(x):
             x_list = list(x)
@@ -105,12 +155,56 @@ def _tableview(rows, data, string_to_number, multivalue, label):
 
         data_view = object_data.pivot_table(index="ID", columns="KEY", values="VALUE", aggfunc=_aggregate)
     else:
-        data_view = object_data.drop_duplicates(["ID", "KEY"]).pivot(index="ID", columns="KEY")["VALUE"]
+        data_view = object_data.drop_duplicates(["ID", "KEY"]).pivot(index="ID", columns="KEY", values="VALUE")
 
+    if rdf_map is not None and not multivalue:
+        from ..parser.typed import column_kinds
+        return _schema_columns(data_view, column_kinds(rdf_map, data_view.columns))
+    if string_to_number and not multivalue and "VALUE_NUM" in object_data.columns:
+        return _typed_columns(data_view, object_data)
     return _numeric_columns(data_view) if string_to_number else data_view
 
 
-def type_tableview(data, type_name, string_to_number=True, type_key="Type", multivalue=False):
+def _schema_columns(data_view, kinds):
+    """Typed columns from the export schema (``rdf_map=``): numeric KEYs are
+    cast to float64 (integers included) and xsd:boolean KEYs to the nullable
+    boolean dtype, one vectorized cast each; malformed values become
+    missing, like TRY_CAST. Every other column stays text — none is probed,
+    so numeric-looking names and identifiers are not turned into numbers."""
+    from ..parser.typed import BOOLEANS
+    for column, kind in kinds.items():
+        values = data_view[column]
+        if kind == "boolean":
+            data_view[column] = values.map(BOOLEANS).astype("boolean")
+            continue
+        target = "double[pyarrow]" if isinstance(values.dtype, pandas.ArrowDtype) else "float64"
+        try:
+            data_view[column] = values.astype(target)
+        except (ValueError, TypeError):   # malformed numbers
+            data_view[column] = pandas.to_numeric(values, errors="coerce").astype(target)
+    return data_view
+
+
+def _typed_columns(data_view, object_data):
+    """string_to_number with the parse-time VALUE_NUM / VALUE_ENUM columns
+    (``parse(..., rdf_map=...)``): KEYs the schema types as numbers are cast
+    straight to float64 (integers included) instead of being probed with
+    pandas.to_numeric, Enumeration KEYs are left as text, and only the
+    remaining columns are probed as before."""
+    numeric = set(object_data.loc[object_data["VALUE_NUM"].notna(), "KEY"].unique())
+    enums = set(object_data.loc[object_data["VALUE_ENUM"].notna(), "KEY"].unique())
+    cast = set()
+    for column in numeric.intersection(data_view.columns):
+        target = "double[pyarrow]" if isinstance(data_view[column].dtype, pandas.ArrowDtype) else "float64"
+        try:
+            data_view[column] = data_view[column].astype(target)
+            cast.add(column)
+        except (ValueError, TypeError):   # xsd:boolean text, malformed numbers
+            pass
+    return _numeric_columns(data_view, skip=cast | enums)
+
+
+def type_tableview(data, type_name, string_to_number=True, type_key="Type", multivalue=False, rdf_map=None):
     """Create a table view of all objects of a specified type.
 
     Parameters
@@ -125,6 +219,10 @@ def type_tableview(data, type_name, string_to_number=True, type_key="Type", mult
         Key used to identify object types in the dataset (default is 'Type').
     multivalue : bool, optional
         If True, aggregate duplicate (ID, KEY) pairs into lists (default is False).
+    rdf_map : dict or str, optional
+        Export schema (dict or JSON path). Columns are typed by its xsd:type
+        instead of string_to_number: numbers → float64, xsd:boolean →
+        boolean, everything else stays text (ignored with multivalue).
 
     Returns
     -------
@@ -135,11 +233,15 @@ def type_tableview(data, type_name, string_to_number=True, type_key="Type", mult
     --------
     >>> table = data.type_tableview("ACLineSegment", multivalue=True)
     """
-    rows = data[(data["VALUE"] == type_name) & (data["KEY"] == type_key)]
-    return _tableview(rows, data, string_to_number, multivalue, type_name)
+    index = triplet_index(data)
+    if index is not None:
+        object_data = _indexed_object_data(index, index.id_codes[index.value_rows(type_key, type_name)], data)
+    else:
+        object_data = _object_data(data[(data["VALUE"] == type_name) & (data["KEY"] == type_key)], data)
+    return _tableview(object_data, string_to_number, multivalue, type_name, rdf_map)
 
 
-def key_tableview(data, key, string_to_number=True, multivalue=False):
+def key_tableview(data, key, string_to_number=True, multivalue=False, rdf_map=None):
     """Create a table view of all objects with a specified key.
 
     Parameters
@@ -152,6 +254,10 @@ def key_tableview(data, key, string_to_number=True, multivalue=False):
         If True, convert columns containing numbers to numeric types (default is True).
     multivalue : bool, optional
         If True, aggregate duplicate (ID, KEY) pairs into lists (default is False).
+    rdf_map : dict or str, optional
+        Export schema (dict or JSON path). Columns are typed by its xsd:type
+        instead of string_to_number: numbers → float64, xsd:boolean →
+        boolean, everything else stays text (ignored with multivalue).
 
     Returns
     -------
@@ -162,23 +268,31 @@ def key_tableview(data, key, string_to_number=True, multivalue=False):
     --------
     >>> table = data.key_tableview("GeneratingUnit.maxOperatingP")
     """
-    rows = data[data["KEY"] == key]
-    return _tableview(rows, data, string_to_number, multivalue, key)
+    index = triplet_index(data)
+    if index is not None:
+        object_data = _indexed_object_data(index, index.id_codes[index.key_rows(key)], data)
+    else:
+        object_data = _object_data(data[data["KEY"] == key], data)
+    return _tableview(object_data, string_to_number, multivalue, key, rdf_map)
 
 
-def id_tableview(data, id, string_to_number=True, multivalue=False):
+def id_tableview(data, id, string_to_number=True, multivalue=False, rdf_map=None):
     """Create a tabular view of a CGMES triplet dataset filtered by ID-s.
 
     Parameters
     ----------
     data : pandas.DataFrame
         Triplet dataset containing CGMES data.
-    id : str or list or pandas.DataFrame
-        ID(s) to filter by (single ID, list of IDs, or DataFrame with an ID column).
+    id : str or list or array-like or pandas.DataFrame
+        ID(s) to filter by (single ID, list / array / Series of IDs, or DataFrame with an ID column).
     string_to_number : bool, optional
         If True, convert columns containing numbers to numeric types (default is True).
     multivalue : bool, optional
         If True, aggregate duplicate (ID, KEY) pairs into lists (default is False).
+    rdf_map : dict or str, optional
+        Export schema (dict or JSON path). Columns are typed by its xsd:type
+        instead of string_to_number: numbers → float64, xsd:boolean →
+        boolean, everything else stays text (ignored with multivalue).
 
     Returns
     -------
@@ -191,13 +305,14 @@ def id_tableview(data, id, string_to_number=True, multivalue=False):
     >>> table = id_tableview(data, ['UUID_1', 'UUID_2'])
     >>> table = id_tableview(data, pandas.DataFrame({"ID": ['UUID_1', 'UUID_2']}))
     """
-    if isinstance(id, str):
-        id = [id]
-    if isinstance(id, list):
-        id = pandas.DataFrame({"ID": id})
-
-    rows = data[data["ID"].isin(id["ID"])]
-    return _tableview(rows, data, string_to_number, multivalue, list(id["ID"]))
+    ids = _id_values(id)
+    index = triplet_index(data)
+    if index is not None:
+        object_data = _indexed_object_data(index, index.id_code(ids), data)
+    else:
+        object_data = _object_data(data[data["ID"].isin(ids)], data)
+    return _tableview(object_data, string_to_number, multivalue,
+                      ids.tolist() if hasattr(ids, "tolist") else list(ids), rdf_map)
 
 
 def references_to_simple(data, reference, columns=["Type"]):
@@ -236,8 +351,8 @@ def references_to(data, reference, levels=1):
     ----------
     data : pandas.DataFrame
         Triplet dataset containing RDF data.
-    reference : str
-        ID of the reference object.
+    reference : str or list of str
+        ID of the reference object, or a list of IDs to traverse from all at once.
     levels : int, optional
         Number of reference levels to traverse (default is 1).
 
@@ -253,12 +368,17 @@ def references_to(data, reference, levels=1):
     Examples
     --------
     >>> refs = data.references_to("99722373_VL_TN1", levels=2)
+    >>> refs = data.references_to(["99722373_VL_TN1", "99722373_VL_TN2"], levels=2)
     """
+    index = triplet_index(data)
+    if index is not None:
+        return _indexed_references_to(index, data, reference, levels)
+
     # TODO - add the key on which connection was made
     level = 0
 
     # Get the object itself
-    object_data = data.query(f"ID == '{reference}'").copy()
+    object_data = _reference_data(data, reference)
     object_data["level"] = level
     # object_data["ID_TO"] = reference
     # object_data["ID_FROM"] = reference
@@ -333,8 +453,8 @@ def references_from(data, reference, levels=1):
     ----------
     data : pandas.DataFrame
         Triplet dataset containing RDF data.
-    reference : str
-        ID of the reference object.
+    reference : str or list of str
+        ID of the reference object, or a list of IDs to traverse from all at once.
     levels : int, optional
         Number of reference levels to traverse (default is 1).
 
@@ -350,12 +470,17 @@ def references_from(data, reference, levels=1):
     Examples
     --------
     >>> refs = data.references_from("99722373_VL_TN1", levels=2)
+    >>> refs = data.references_from(["99722373_VL_TN1", "99722373_VL_TN2"], levels=2)
     """
+    index = triplet_index(data)
+    if index is not None:
+        return _indexed_references_from(index, data, reference, levels)
+
     # TODO - add the key on which connection was made
     level = 0
 
     # Get the object itself
-    object_data = data.query(f"ID == '{reference}'").copy()
+    object_data = _reference_data(data, reference)
     object_data["level"] = level
     #object_data["ID_TO"] = reference
     #object_data["ID_FROM"] = reference
@@ -391,6 +516,66 @@ def references_from(data, reference, levels=1):
     return pandas.concat(objects_list)
 
 
+def _level_frame(data, rows, level, schema, **columns):
+    """data rows at positions rows as one references_* level: the given
+    link columns first, then the triplet columns, then level — with the
+    dtypes of schema, the scan's merge result (merges recast categorical
+    keys whose categories differ)."""
+    frame = _take(data, rows).reset_index(drop=True)
+    for position, (name, values) in enumerate(columns.items()):
+        frame.insert(position, name, values)
+    changed = {name: dtype for name, dtype in schema.items() if frame[name].dtype != dtype}
+    if changed:
+        frame = frame.astype(changed)
+    frame["level"] = level
+    return frame
+
+
+def _reference_data(data, reference):
+    """The triplets of the reference object, or of a list of them."""
+    if isinstance(reference, str):
+        return data.query(f"ID == '{reference}'").copy()
+    return data[data["ID"].isin(list(reference))].copy()
+
+
+def _indexed_references_to(index, data, reference, levels):
+    """references_to with a TripletIndex: the traversal runs on ID codes
+    (TripletIndex.levels_to), then each level's rows are gathered."""
+    rows = index.id_rows(reference)
+    object_data = _take(data, rows)
+    object_data["level"] = 0
+    objects_list = [object_data]
+    id_column = data["ID"].array
+    empty = data.iloc[:0]
+    links = pandas.merge(empty[["ID"]], empty, left_on="ID", right_on="VALUE", suffixes=("_TO", "_FROM"))
+    schema = pandas.merge(links[["ID_TO", "ID_FROM"]], empty, left_on="ID_FROM", right_on="ID").dtypes
+    for level, (sources, targets) in enumerate(index.levels_to(index.id_codes[rows], levels), start=1):
+        rows, link = index.rows_of_codes(sources)
+        objects_list.append(_level_frame(data, rows, level, schema,
+                                         ID_TO=_take_array(id_column, index.first_rows(targets[link])),
+                                         ID_FROM=_take_array(id_column, rows)))
+    return pandas.concat(objects_list)
+
+
+def _indexed_references_from(index, data, reference, levels):
+    """references_from with a TripletIndex: the traversal runs on ID codes
+    (TripletIndex.levels_from), then each level's rows are gathered."""
+    rows = index.id_rows(reference)
+    object_data = _take(data, rows)
+    object_data["level"] = 0
+    objects_list = [object_data]
+    id_column, value_column = data["ID"].array, data["VALUE"].array
+    empty = data.iloc[:0]
+    schema = pandas.merge(empty[["ID", "VALUE"]], empty, left_on="VALUE", right_on="ID",
+                          suffixes=("_FROM", "")).rename(columns={"VALUE_FROM": "ID_TO"}).dtypes
+    for level, (linking, targets) in enumerate(index.levels_from(rows, levels), start=1):
+        rows, link = index.rows_of_codes(targets)
+        objects_list.append(_level_frame(data, rows, level, schema,
+                                         ID_FROM=_take_array(id_column, linking[link]),
+                                         ID_TO=_take_array(value_column, linking[link])))
+    return pandas.concat(objects_list)
+
+
 def references_all(data):
     """Find all unique references (links) in the dataset.
 
@@ -506,11 +691,18 @@ def types_dict(data, contains=None, case_insensitive=True):
     >>> data.types_dict(contains="Settlement")
     {'MarketEvaluationPoint': 3, ...}
     """
-    # Count distinct objects per type, not Type-declaration rows: an object
-    # re-declared across instances (EQ/SSH/TP/SV) must count once. Matches the
-    # polars (n_unique) and duckdb (COUNT DISTINCT) engines.
-    type_rows = data[data.KEY == "Type"].drop_duplicates(subset=["ID", "VALUE"])
-    types_dictionary = type_rows["VALUE"].value_counts().to_dict()
+    # The unmodified result of an arrow-engine parse() carries these counts
+    # (triplets.parser.stats) — no pass over the data
+    from ..parser.stats import types
+    known = types(data)
+    if known is not None:
+        types_dictionary = dict(known)
+    else:
+        # Count distinct objects per type, not Type-declaration rows: an object
+        # re-declared across instances (EQ/SSH/TP/SV) must count once. Matches the
+        # polars (n_unique) and duckdb (COUNT DISTINCT) engines.
+        type_rows = data[data.KEY == "Type"].drop_duplicates(subset=["ID", "VALUE"])
+        types_dictionary = type_rows["VALUE"].value_counts().to_dict()
 
     if contains is None:
         return types_dictionary
@@ -569,27 +761,40 @@ def set_value_at_key_and_id(data, key, value, id):
     data.loc[data[(data.ID == id) & (data.KEY == key)].index, "VALUE"] = _string_or_none(value)
 
 
-def triplets_to_tableviews(triplet_df, multivalue=False):
+def triplets_to_tableviews(triplet_df, multivalue=False, string_to_number=True, rdf_map=None):
     """Convert triplet DataFrame to dict of tableview DataFrames.
 
+    One pass instead of a type_tableview scan per class: every triplet is
+    tagged with its object's Type by one merge, grouped by Type once, and
+    each group is pivoted. The tableviews equal type_tableview's.
+
     Parameters
     ----------
     triplet_df : pandas.DataFrame
         Triplet dataset with columns [ID, KEY, VALUE, INSTANCE_ID].
     multivalue : bool, default False
         If True, aggregate duplicate (ID, KEY) pairs into lists.
+    string_to_number : bool, default True
+        If True, convert columns containing numbers to numeric types.
+    rdf_map : dict or str, optional
+        Export schema: type the columns by its xsd:type (see type_tableview).
 
     Returns
     -------
     dict
-        {class_name: tableview_df}
+        {class_name: tableview_df}, largest class first (types_dict order)
     """
     types = types_dict(triplet_df)
+    type_rows = triplet_df.loc[triplet_df["KEY"] == "Type", ["ID", "VALUE"]].drop_duplicates()
+    # Objects declared with two Types are tagged twice, once into each tableview
+    tagged = pandas.merge(type_rows.rename(columns={"VALUE": "_TYPE"}), triplet_df, on="ID")
+    partitions = {str(class_name): partition.drop(columns="_TYPE")
+                  for class_name, partition in tagged.groupby("_TYPE", sort=False, observed=True)}
     tableviews = {}
     for class_name in types:
-        table_view = type_tableview(triplet_df, class_name, multivalue=multivalue)
-        if table_view is not None:
-            tableviews[class_name] = table_view
+        if class_name in partitions:
+            tableviews[class_name] = _tableview(partitions[class_name], string_to_number, multivalue,
+                                                class_name, rdf_map)
     return tableviews
 
 
@@ -639,9 +844,43 @@ def get_object_data(data, object_UUID):
     --------
     >>> obj_data = data.get_object_data("uuid1")
     """
+    index = triplet_index(data)
+    if index is not None:
+        return _take(data, index.id_rows(object_UUID)).set_index("KEY")["VALUE"]
     return data.query("ID == '{}'".format(object_UUID)).set_index("KEY")["VALUE"]
 
 
+def get_objects_data(data, ids):
+    """Retrieve the triplets of many objects at once.
+
+    One semi-join on ID (a TripletIndex gather from the second lookup on a
+    frame) instead of a ``get_object_data`` query per object.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        Triplet dataset containing RDF data.
+    ids : str or list or array-like or pandas.DataFrame
+        IDs of the objects (single ID, list / array / Series of IDs, or DataFrame with an ID column).
+
+    Returns
+    -------
+    pandas.DataFrame
+        Triplets of the objects, in dataset order; IDs not in the dataset are skipped.
+
+    Examples
+    --------
+    >>> objects = data.get_objects_data(["uuid1", "uuid2"])
+    >>> for object_UUID, object_data in objects.groupby("ID", sort=False):
+    ...     values = object_data.set_index("KEY")["VALUE"]
+    """
+    ids = _id_values(ids)
+    index = triplet_index(data)
+    if index is not None:
+        return _take(data, index.id_rows(ids))
+    return data[data["ID"].isin(ids)]
+
+
 def tableview_to_triplets(data, multivalue=False, instance_id=None):
     """Convert a table view back to a triplet format.
 
@@ -846,6 +1085,12 @@ def filter_triplets_by_type(data, type_name, type_key="Type"):
     --------
     >>> filtered = filter_triplets_by_type(data, "ACLineSegment")
     """
+    index = triplet_index(data)
+    if index is not None:
+        # Each object's rows once per Type row declaring it, in data order — as the merge
+        rows, _ = index.rows_of_codes(index.id_codes[index.value_rows(type_key, type_name)])
+        return _take(data, numpy.sort(rows, kind="stable")).reset_index(drop=True)
+
     filter_triplet = data[(data.KEY == type_key) & (data.VALUE == type_name)]
 
     return filter_triplets_by_triplets(data, filter_triplet)
@@ -5,15 +5,18 @@ All functions accept and return polars DataFrames.
 """
 
 import logging
+import numpy
 import polars as pl
 
+from .index import triplet_index
+
 logger = logging.getLogger(__name__)
 
 
-def _numeric_columns(data_view):
+def _numeric_columns(data_view, skip=()):
     """Cast columns that contain only numbers to Float64."""
     for col in data_view.columns:
-        if col == "ID":
+        if col == "ID" or col in skip:
             continue
         try:
             data_view = data_view.with_columns(pl.col(col).cast(pl.Float64, strict=True))
@@ -22,17 +25,36 @@ def _numeric_columns(data_view):
     return data_view
 
 
-def _tableview(ids, data, string_to_number, multivalue, label):
+def _object_data(ids, data):
+    """All triplets of the objects whose IDs ids holds (a join with data)."""
+    return ids.select("ID").unique().join(data, on="ID", how="inner")
+
+
+def _id_values(id):
+    """The IDs of an ``id`` argument as a Utf8 Series named ID: one ID, a
+    list / array / Series of them, or a DataFrame with an ID column."""
+    if isinstance(id, str):
+        id = [id]
+    if isinstance(id, pl.DataFrame):
+        id = id.get_column("ID")
+    return pl.Series("ID", id).cast(pl.Utf8)
+
+
+def _indexed_object_data(index, codes, data):
+    """All triplets of the objects with these ID codes (a TripletIndex gather)."""
+    rows = index.object_rows(codes)
+    return data[rows]
+
+
+def _tableview(object_data, string_to_number, multivalue, label, rdf_map=None):
     """Shared pivot core for the three tableview functions.
 
-    ids: polars DataFrame with an ID column selecting the objects.
+    object_data: all triplets of the selected objects.
     """
-    if ids.is_empty():
+    if object_data.is_empty():
         logger.warning(f'No data available for {label}')
         return None
 
-    object_data = ids.select("ID").unique().join(data, on="ID", how="inner")
-
     if multivalue:
         # Aggregate all values per (ID, KEY) into lists, then pivot (maintain_order so
         # the list element order matches the pandas engine's row order).
@@ -55,30 +77,68 @@ def _tableview(ids, data, string_to_number, multivalue, label):
     else:
         data_view = object_data.unique(subset=["ID", "KEY"], keep="first").pivot(on="KEY", index="ID", values="VALUE")
 
+    if rdf_map is not None and not multivalue:
+        from ..parser.typed import column_kinds
+        return _schema_columns(data_view, column_kinds(rdf_map, data_view.columns))
+    if string_to_number and not multivalue and "VALUE_NUM" in object_data.columns:
+        return _typed_columns(data_view, object_data)
     return _numeric_columns(data_view) if string_to_number else data_view
 
 
-def type_tableview(data, type_name, string_to_number=True, type_key="Type", multivalue=False):
-    """Create a table view of all objects of a specified type using polars pivot."""
-    ids = data.filter((pl.col("VALUE") == type_name) & (pl.col("KEY") == type_key))
-    return _tableview(ids, data, string_to_number, multivalue, type_name)
+def _schema_columns(data_view, kinds):
+    """Typed columns from the export schema (``rdf_map=``): numeric KEYs cast
+    to Float64 and xsd:boolean KEYs to Boolean in one with_columns, malformed
+    values null (non-strict cast); every other column stays text."""
+    from ..parser.typed import BOOLEANS
+    return data_view.with_columns(
+        pl.col(column).cast(pl.Utf8).cast(pl.Float64, strict=False) if kind == "number"
+        else pl.col(column).cast(pl.Utf8).replace_strict(BOOLEANS, default=None, return_dtype=pl.Boolean)
+        for column, kind in kinds.items())
 
 
-def key_tableview(data, key, string_to_number=True, multivalue=False):
-    """Create a table view of all objects with a specified key."""
-    ids = data.filter(pl.col("KEY") == key)
-    return _tableview(ids, data, string_to_number, multivalue, key)
+def _typed_columns(data_view, object_data):
+    """string_to_number with the parse-time VALUE_ENUM column
+    (``parse(..., rdf_map=...)``): Enumeration KEYs are left as text instead
+    of being tried as numbers. KEYs the schema types as numbers cast cleanly
+    in _numeric_columns, like the VALUE_NUM they were parsed into."""
+    enums = object_data.filter(pl.col("VALUE_ENUM").is_not_null())["KEY"].cast(pl.Utf8).unique().to_list()
+    return _numeric_columns(data_view, skip=set(enums))
 
 
-def id_tableview(data, id, string_to_number=True, multivalue=False):
-    """Create a table view of objects by ID (single ID, list of IDs, or DataFrame with ID column)."""
-    if isinstance(id, str):
-        id = [id]
-    if isinstance(id, list):
-        id = pl.DataFrame({"ID": id})
+def type_tableview(data, type_name, string_to_number=True, type_key="Type", multivalue=False, rdf_map=None):
+    """Create a table view of all objects of a specified type using polars pivot.
 
-    ids = data.join(id.select("ID"), on="ID", how="semi")
-    return _tableview(ids, data, string_to_number, multivalue, id["ID"].to_list())
+    With ``rdf_map`` (export schema) the columns are typed by its xsd:type
+    instead of string_to_number, as in the pandas engine.
+    """
+    index = triplet_index(data)
+    if index is not None:
+        object_data = _indexed_object_data(index, index.id_codes[index.value_rows(type_key, type_name)], data)
+    else:
+        object_data = _object_data(data.filter((pl.col("VALUE") == type_name) & (pl.col("KEY") == type_key)), data)
+    return _tableview(object_data, string_to_number, multivalue, type_name, rdf_map)
+
+
+def key_tableview(data, key, string_to_number=True, multivalue=False, rdf_map=None):
+    """Create a table view of all objects with a specified key."""
+    index = triplet_index(data)
+    if index is not None:
+        object_data = _indexed_object_data(index, index.id_codes[index.key_rows(key)], data)
+    else:
+        object_data = _object_data(data.filter(pl.col("KEY") == key), data)
+    return _tableview(object_data, string_to_number, multivalue, key, rdf_map)
+
+
+def id_tableview(data, id, string_to_number=True, multivalue=False, rdf_map=None):
+    """Create a table view of objects by ID (single ID, list / array / Series of
+    IDs, or DataFrame with ID column)."""
+    ids = _id_values(id)
+    index = triplet_index(data)
+    if index is not None:
+        object_data = _indexed_object_data(index, index.id_code(ids), data)
+    else:
+        object_data = _object_data(data.filter(pl.col("ID").is_in(ids.implode())), data)
+    return _tableview(object_data, string_to_number, multivalue, ids.to_list(), rdf_map)
 
 
 def types_dict(data, contains=None, case_insensitive=True):
@@ -101,13 +161,28 @@ def types_dict(data, contains=None, case_insensitive=True):
 
 def get_object_data(data, object_UUID):
     """Get all data for a specific object."""
-    obj = data.filter(pl.col("ID") == object_UUID)
+    index = triplet_index(data)
+    if index is not None:
+        obj = data[index.id_rows(object_UUID)]
+    else:
+        obj = data.filter(pl.col("ID") == object_UUID)
     if obj.is_empty():
         return None
     # Return as a simple key-value series (polars doesn't have Series.set_index like pandas)
     return obj.select(["KEY", "VALUE"])
 
 
+def get_objects_data(data, ids):
+    """All triplets of many objects at once (single ID, list / array / Series
+    of IDs, or DataFrame with ID column), in dataset order — one semi-join on
+    ID (a TripletIndex gather once indexed) instead of a lookup per object."""
+    ids = _id_values(ids)
+    index = triplet_index(data)
+    if index is not None:
+        return data[index.id_rows(ids)]
+    return data.filter(pl.col("ID").is_in(ids.implode()))
+
+
 def get_namespace_map(data):
     """Extract namespace map from triplet data.
 
@@ -131,15 +206,26 @@ def _cast_columns_to_string(data):
     return data.with_columns([pl.col(c).cast(pl.Utf8) for c in cols])
 
 
+def _reference_filter(reference):
+    """Filter on the rows of the reference object, or of a list of them."""
+    if isinstance(reference, str):
+        return pl.col("ID") == reference
+    return pl.col("ID").is_in(pl.Series(list(reference), dtype=pl.Utf8).implode())
+
+
 def references_to(data, reference, levels=1):
-    """Objects that reference `reference`, traversing up to `levels`. Matches the
-    pandas engine: level 0 is the object itself; level N rows carry level/ID_TO/ID_FROM."""
+    """Objects that reference `reference` (an ID, or a list of IDs traversed
+    from at once), traversing up to `levels`. Matches the pandas engine:
+    level 0 is the object itself; level N rows carry level/ID_TO/ID_FROM."""
+    index = triplet_index(data)
+    if index is not None:
+        return _indexed_references_to(index, data, reference, levels)
     data = _cast_columns_to_string(data)
-    base = data.filter(pl.col("ID") == reference).with_columns(pl.lit(0, dtype=pl.Int64).alias("level"))
+    base = data.filter(_reference_filter(reference)).with_columns(pl.lit(0, dtype=pl.Int64).alias("level"))
     parts, frontier = [base], base
     for level in range(1, levels + 1):
-        to_ids = frontier.select("ID").unique().to_series().to_list()
-        links = (data.filter(pl.col("VALUE").is_in(to_ids))
+        to_ids = frontier.get_column("ID").unique()
+        links = (data.filter(pl.col("VALUE").is_in(to_ids.implode()))
                  .select(pl.col("ID").alias("ID_FROM"), pl.col("VALUE").alias("ID_TO"))
                  .unique(subset="ID_FROM", keep="first"))
         if links.is_empty():
@@ -152,10 +238,14 @@ def references_to(data, reference, levels=1):
 
 
 def references_from(data, reference, levels=1):
-    """Objects referenced BY `reference`, traversing up to `levels`. Matches pandas:
-    level 0 is the object itself; level N rows carry level/ID_TO/ID_FROM."""
+    """Objects referenced BY `reference` (an ID, or a list of IDs traversed
+    from at once), traversing up to `levels`. Matches pandas: level 0 is the
+    object itself; level N rows carry level/ID_TO/ID_FROM."""
+    index = triplet_index(data)
+    if index is not None:
+        return _indexed_references_from(index, data, reference, levels)
     data = _cast_columns_to_string(data)
-    base = data.filter(pl.col("ID") == reference).with_columns(pl.lit(0, dtype=pl.Int64).alias("level"))
+    base = data.filter(_reference_filter(reference)).with_columns(pl.lit(0, dtype=pl.Int64).alias("level"))
     parts, frontier = [base], base
     for level in range(1, levels + 1):
         edges = frontier.select(pl.col("ID").alias("ID_FROM"), pl.col("VALUE").alias("ID_TO"))
@@ -168,6 +258,37 @@ def references_from(data, reference, levels=1):
     return pl.concat(parts, how="diagonal_relaxed")
 
 
+def _indexed_references_to(index, data, reference, levels):
+    """references_to with a TripletIndex: the traversal runs on ID codes
+    (TripletIndex.levels_to, linking each referrer by its first row like the
+    join's unique(keep="first")), then each level's rows are gathered."""
+    rows = index.id_rows(reference)
+    parts = [_cast_columns_to_string(data[rows]).with_columns(pl.lit(0, dtype=pl.Int64).alias("level"))]
+    ids = data.get_column("ID")
+    for level, (sources, targets) in enumerate(index.levels_to(index.id_codes[rows], levels, link="row"), start=1):
+        rows, link = index.rows_of_codes(sources)
+        parts.append(_cast_columns_to_string(data[rows]).with_columns(
+            ids[index.first_rows(targets[link])].cast(pl.Utf8).alias("ID_TO"),
+            pl.col("ID").alias("ID_FROM"),
+            pl.lit(level, dtype=pl.Int64).alias("level")))
+    return pl.concat(parts, how="diagonal_relaxed")
+
+
+def _indexed_references_from(index, data, reference, levels):
+    """references_from with a TripletIndex: the traversal runs on ID codes
+    (TripletIndex.levels_from), then each level's rows are gathered."""
+    rows = index.id_rows(reference)
+    parts = [_cast_columns_to_string(data[rows]).with_columns(pl.lit(0, dtype=pl.Int64).alias("level"))]
+    ids, values = data.get_column("ID"), data.get_column("VALUE")
+    for level, (linking, targets) in enumerate(index.levels_from(rows, levels), start=1):
+        rows, link = index.rows_of_codes(targets)
+        parts.append(_cast_columns_to_string(data[rows]).with_columns(
+            ids[linking[link]].cast(pl.Utf8).alias("ID_FROM"),
+            values[linking[link]].cast(pl.Utf8).alias("ID_TO"),
+            pl.lit(level, dtype=pl.Int64).alias("level")))
+    return pl.concat(parts, how="diagonal_relaxed")
+
+
 def references(data, ID, levels=1):
     """All references to and from an object (both directions), matching pandas."""
     FROM = references_from(data, ID, levels)
@@ -180,8 +301,7 @@ def references_all(data):
     """All reference links as (ID_FROM, KEY, ID_TO), matching pandas."""
     data = _cast_columns_to_string(data)
     triples = data.select("ID", "KEY", "VALUE").unique()
-    ids = data.select("ID").unique().to_series().to_list()
-    return (triples.filter(pl.col("VALUE").is_in(ids))
+    return (triples.filter(pl.col("VALUE").is_in(data.get_column("ID").unique().implode()))
             .select(pl.col("ID").alias("ID_FROM"), pl.col("KEY"), pl.col("VALUE").alias("ID_TO")))
 
 
@@ -218,6 +338,10 @@ def references_simple(data, reference, columns=None, levels=1):
 
 def filter_triplets_by_type(data, type_name, type_key="Type"):
     """Filter triplet data to only include objects of a specific type."""
+    index = triplet_index(data)
+    if index is not None:
+        rows, _ = index.rows_of_codes(index.id_codes[index.value_rows(type_key, type_name)])
+        return data[rows]
     type_ids = data.filter(
         (pl.col("KEY") == type_key) & (pl.col("VALUE") == type_name)
     ).select("ID")
@@ -333,14 +457,21 @@ def set_value_at_key_and_id(data, key, value, id):
     )
 
 
-def triplets_to_tableviews(triplet_df, multivalue=False):
-    """Convert triplet DataFrame to dict of tableview DataFrames."""
-    td = types_dict(triplet_df)
+def triplets_to_tableviews(triplet_df, multivalue=False, string_to_number=True, rdf_map=None):
+    """Convert triplet DataFrame to dict of tableview DataFrames.
+
+    One pass: every triplet is tagged with its object's Type by one join,
+    the result is split with partition_by, and each partition is pivoted.
+    """
+    type_rows = (triplet_df.filter(pl.col("KEY") == "Type")
+                 .select("ID", pl.col("VALUE").cast(pl.Utf8).alias("_TYPE")).unique())
+    tagged = type_rows.join(triplet_df, on="ID", how="inner")
+    partitions = tagged.partition_by("_TYPE", as_dict=True, include_key=False, maintain_order=True)
     tableviews = {}
-    for class_name in td:
-        tv = type_tableview(triplet_df, class_name, multivalue=multivalue)
-        if tv is not None:
-            tableviews[class_name] = tv
+    for class_name in types_dict(triplet_df):
+        partition = partitions.get((class_name,))
+        if partition is not None:
+            tableviews[class_name] = _tableview(partition, string_to_number, multivalue, class_name, rdf_map)
     return tableviews
 
 